@@ -182,6 +182,10 @@ rst_epilog = """
 
 .. |DrawingOperations| replace:: :class:`.DrawingOperations`
 
+.. |EffectiveFont| replace:: :class:`.EffectiveFont`
+
+.. |EffectiveParagraphFormat| replace:: :class:`.EffectiveParagraphFormat`
+
 .. |Emu| replace:: :class:`.Emu`
 
 .. |False| replace:: :class:`False`
@@ -340,12 +344,16 @@ rst_epilog = """
 
 .. |SlideShapes| replace:: :class:`.SlideShapes`
 
+.. |SpatialIndex| replace:: :class:`.SpatialIndex`
+
 .. |str| replace:: :class:`str`
 
 .. |Table| replace:: :class:`Table`
 
 .. |TextFrame| replace:: :class:`.TextFrame`
 
+.. |TextStyleResolver| replace:: :class:`.TextStyleResolver`
+
 .. |TickLabels| replace:: :class:`.TickLabels`
 
 .. |True| replace:: :class:`True`
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compare the time taken to write the Excel workbook embedded in a chart by the
+built-in SpreadsheetML writer and by XlsxWriter.
+
+    $ python lab/xlsx-backends/benchmark.py [repeat]
+"""
+
+from __future__ import print_function
+
+import random
+import sys
+import timeit
+
+from pptx.chart.data import CategoryChartData, XyChartData
+
+
+def category_chart_data(backend, series_count, category_count):
+    chart_data = CategoryChartData(xlsx_backend=backend)
+    chart_data.categories = ["Category %d" % i for i in range(category_count)]
+    for idx in range(series_count):
+        chart_data.add_series(
+            "Series %d" % idx, [random.random() for _ in range(category_count)]
+        )
+    return chart_data
+
+
+def xy_chart_data(backend, series_count, point_count):
+    chart_data = XyChartData(xlsx_backend=backend)
+    for idx in range(series_count):
+        series = chart_data.add_series("Series %d" % idx)
+        for x in range(point_count):
+            series.add_data_point(x, random.random())
+    return chart_data
+
+
+CASES = (
+    ("category 3 x 10", category_chart_data, 3, 10),
+    ("category 10 x 1,000", category_chart_data, 10, 1000),
+    ("category 50 x 5,000", category_chart_data, 50, 5000),
+    ("xy 1 x 100,000", xy_chart_data, 1, 100000),
+)
+
+
+def main(repeat):
+    print("%-22s %12s %12s %8s" % ("chart data", "native", "xlsxwriter", "ratio"))
+    for name, factory, series_count, point_count in CASES:
+        times = []
+        for backend in ("native", "xlsxwriter"):
+            chart_data = factory(backend, series_count, point_count)
+            times.append(
+                min(
+                    timeit.repeat(
+                        lambda: chart_data.xlsx_blob, number=1, repeat=repeat
+                    )
+                )
+            )
+        native, xlsxwriter = times
+        print(
+            "%-22s %11.4fs %11.4fs %7.1fx"
+            % (name, native, xlsxwriter, xlsxwriter / native)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
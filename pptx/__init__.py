@@ -9,10 +9,14 @@ import pptx.exc as exceptions
 import sys
 
 sys.modules["pptx.exceptions"] = exceptions
-del sys
 
 from pptx.api import Presentation  # noqa
 
+if sys.version_info >= (3, 5):
+    from pptx.aio import open_async  # noqa
+
+del sys
+
 from pptx.opc.constants import CONTENT_TYPE as CT  # noqa: E402
 from pptx.opc.package import PartFactory  # noqa: E402
 from pptx.parts.chart import ChartPart  # noqa: E402
@@ -0,0 +1,76 @@
+# encoding: utf-8
+
+"""Coroutines to open and save a presentation without blocking the event loop.
+
+Only available on Python 3, this module uses `async def` syntax.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+import inspect
+import io
+
+from .api import Presentation
+
+
+async def open_async(pptx=None, executor=None):
+    """Return a |Presentation| object loaded from *pptx*, off the event loop.
+
+    Like :func:`pptx.Presentation`, but reading the zip archive and parsing
+    its parts happen in *executor*, so the event loop stays responsive.
+    *pptx* can be a path, a file-like object, or an asynchronous byte source
+    whose `read()` method is a coroutine, like an `asyncio.StreamReader` or
+    an `aiofiles` file object, which is read to the end on the event loop
+    first. *executor* is a `concurrent.futures.ThreadPoolExecutor`, or
+    |None| for the default executor of the event loop. The number of worker
+    threads of the executor bounds the number of presentations opened or
+    saved at the same time.
+    """
+    if _is_async_source(pptx):
+        pptx = io.BytesIO(await pptx.read())
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, Presentation, pptx)
+
+
+async def save_async(prs, file, executor=None):
+    """Save |Presentation| object *prs* to *file* without blocking the loop.
+
+    Serializing the parts and writing the zip archive happen in *executor*.
+    *file* can be a path, a file-like object, or an asynchronous byte sink
+    whose `write()` method is a coroutine, like an `aiofiles` file object,
+    or which has a `drain()` coroutine, like an `asyncio.StreamWriter`. The
+    archive is written to an asynchronous sink on the event loop, once it
+    is complete. *prs* must not be changed until saving has finished.
+    """
+    loop = asyncio.get_event_loop()
+    if not _is_async_sink(file):
+        await loop.run_in_executor(executor, prs.save, file)
+        return
+    blob = await loop.run_in_executor(executor, _blob, prs)
+    result = file.write(blob)
+    if inspect.isawaitable(result):
+        await result
+    drain = getattr(file, "drain", None)
+    if drain is not None:
+        await drain()
+
+
+def _blob(prs):
+    """Return the bytes of *prs* saved as a .pptx package."""
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def _is_async_sink(file):
+    """True if *file* is written to by awaiting `write()` or `drain()`."""
+    write = getattr(file, "write", None)
+    if write is None:
+        return False
+    return inspect.iscoroutinefunction(write) or hasattr(file, "drain")
+
+
+def _is_async_source(pptx):
+    """True if *pptx* is read from by awaiting its `read()` method."""
+    return inspect.iscoroutinefunction(getattr(pptx, "read", None))
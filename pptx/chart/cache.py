@@ -0,0 +1,118 @@
+# encoding: utf-8
+
+"""Cache of generated chart XML and Excel workbooks, keyed by chart content.
+
+Adding the same chart, the same chart type, data and number formats, to several
+slides or decks otherwise writes its XML and its workbook again each time. Once a
+|ChartPayloadCache| object is set with :func:`set_payload_cache`, the chart XML and
+workbook blobs of a chart data object are looked up by a SHA1 hash of its content
+before being written, and stored after.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import collections
+import os
+import tempfile
+import threading
+
+# ---the |ChartPayloadCache| object in use, or None when caching is off---
+_payload_cache = None
+
+
+def get_payload_cache():
+    """Return the |ChartPayloadCache| object in use, or |None| if there isn't one."""
+    return _payload_cache
+
+
+def set_payload_cache(payload_cache):
+    """Use |ChartPayloadCache| object *payload_cache* for all chart data objects.
+
+    |None| turns caching off, which is the default.
+    """
+    global _payload_cache
+    _payload_cache = payload_cache
+
+
+class ChartPayloadCache(object):
+    """Least-recently-used cache of chart XML and workbook blobs, by content key.
+
+    At most *max_size* blobs are kept in memory, the least recently used being
+    discarded first. When *directory* is a path, each blob is also written to a file
+    there, named by its key, and blobs not in memory are looked for there, so they
+    survive from one process to the next and are shared between processes, like the
+    workers of :func:`pptx.parallel.build_presentation`. The directory is created
+    when it doesn't exist. Files in it are never removed by the cache.
+
+    A blob found in the cache is the same bytes object each time, so the workbooks
+    of many identical charts take the memory of one until the presentation is saved.
+    A cache object can be used from several threads at once.
+    """
+
+    def __init__(self, max_size=128, directory=None):
+        super(ChartPayloadCache, self).__init__()
+        self._max_size = max_size
+        self._directory = directory
+        self._blobs = collections.OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def __len__(self):
+        return len(self._blobs)
+
+    def clear(self):
+        """Discard the blobs held in memory, leaving those in *directory*."""
+        with self._lock:
+            self._blobs.clear()
+
+    def get(self, key):
+        """Return the blob stored under *key*, or |None| if there is none."""
+        with self._lock:
+            blob = self._blobs.pop(key, None)
+            if blob is not None:
+                self._blobs[key] = blob
+                return blob
+        if self._directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                blob = f.read()
+        except (IOError, OSError):
+            return None
+        self._remember(key, blob)
+        return blob
+
+    def put(self, key, blob):
+        """Store *blob* under *key*, in memory and in *directory* if there is one."""
+        self._remember(key, blob)
+        if self._directory is not None:
+            self._write(key, blob)
+
+    def _path(self, key):
+        """Return the path of the file holding the blob stored under *key*."""
+        return os.path.join(self._directory, key)
+
+    def _remember(self, key, blob):
+        """Hold *blob* in memory, discarding the least recently used beyond max."""
+        with self._lock:
+            blobs = self._blobs
+            blobs.pop(key, None)
+            blobs[key] = blob
+            while len(blobs) > self._max_size:
+                blobs.popitem(last=False)
+
+    def _write(self, key, blob):
+        """Write *blob* to its file, whole, so a reader never sees a partial one.
+
+        The blob is written to a temporary file renamed into place. Failing to
+        write it only means it is written again the next time it is needed.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.rename(tmp_path, self._path(key))
+        except (IOError, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -10,6 +10,8 @@ discovery of the depth of that hierarchy and providing means to navigate it.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from bisect import bisect_right
+
 from pptx.compat import Sequence
 
 
@@ -103,45 +105,37 @@ class Categories(Sequence):
         the same length as the number of levels (excepting certain edge
         cases which I believe always indicate a chart construction error).
         """
-        levels = self.levels
+        levels = [tuple(level) for level in self.levels]
         if not levels:
             return
-        leaf_level, remaining_levels = levels[0], levels[1:]
+        leaf_level, parent_levels = levels[0], levels[1:]
+        # ---the idx values of each parent level are read once, then each
+        #    parent is located by bisection---
+        parent_idxs = [[category.idx for category in level] for level in parent_levels]
         for category in leaf_level:
-            yield self._parentage((category,), remaining_levels)
-
-    def _parentage(self, categories, levels):
-        """
-        Return a tuple formed by recursively concatenating *categories* with
-        its next ancestor from *levels*. The idx value of the first category
-        in *categories* determines parentage in all levels. The returned
-        sequence is in child -> parent order. A parent category is the
-        Category object in a next level having the maximum idx value not
-        exceeding that of the leaf category.
-        """
-        # exhausting levels is the expected recursion termination condition
-        if not levels:
-            return tuple(categories)
-
-        # guard against edge case where next level is present but empty. That
-        # situation is not prohibited for some reason.
-        if not levels[0]:
-            return tuple(categories)
-
-        parent_level, remaining_levels = levels[0], levels[1:]
-        leaf_node = categories[0]
-
-        # Make the first parent the default. A possible edge case is where no
-        # parent is defined for one or more leading values, e.g. idx > 0 for
-        # the first parent.
-        parent = parent_level[0]
-        for category in parent_level:
-            if category.idx > leaf_node.idx:
+            yield self._parentage(category, parent_levels, parent_idxs)
+
+    def _parentage(self, leaf, levels, level_idxs):
+        """
+        Return a tuple formed by concatenating *leaf* with its ancestor in
+        each of *levels*, where *level_idxs* contains the list of category
+        idx values for each level. The idx value of *leaf* determines
+        parentage in all levels. The returned sequence is in child -> parent
+        order. A parent category is the Category object in a next level
+        having the maximum idx value not exceeding that of the leaf category.
+        """
+        categories = [leaf]
+        for level, idxs in zip(levels, level_idxs):
+            # guard against edge case where next level is present but empty.
+            # That situation is not prohibited for some reason.
+            if not level:
                 break
-            parent = category
-
-        extended_categories = tuple(categories) + (parent,)
-        return self._parentage(extended_categories, remaining_levels)
+            # Make the first parent the default. A possible edge case is where
+            # no parent is defined for one or more leading values, e.g. idx > 0
+            # for the first parent.
+            offset = bisect_right(idxs, leaf.idx)
+            categories.append(level[offset - 1] if offset else level[0])
+        return tuple(categories)
 
 
 class Category(str):
@@ -198,5 +192,9 @@ class CategoryLevel(Sequence):
     def __getitem__(self, offset):
         return Category(self._lvl.pt_lst[offset])
 
+    def __iter__(self):
+        for pt in self._lvl.pt_lst:
+            yield Category(pt)
+
     def __len__(self):
         return len(self._lvl.pt_lst)
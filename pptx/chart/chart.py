@@ -163,15 +163,32 @@ class Chart(PartElementProxy):
         plotArea = self._chartSpace.chart.plotArea
         return _Plots(plotArea, self)
 
-    def replace_data(self, chart_data):
+    def replace_data(self, chart_data, embed_workbook=True, incremental=False):
         """
         Use the categories and series values in the |ChartData| object
         *chart_data* to replace those in the XML and Excel worksheet for this
         chart.
+
+        *embed_workbook* is |True| to write the Excel worksheet right away,
+        `"lazy"` to write it only when the presentation is saved, or |False|
+        to remove it, leaving only the values cached in the chart XML. A chart
+        without a worksheet displays normally but its data cannot be edited
+        in PowerPoint.
+
+        When *incremental* is |True| and *chart_data* differs from the data
+        of this chart only in its values, just the data points whose value
+        changed are rewritten, in the XML and in the cells of the existing
+        Excel worksheet. Otherwise, as when the number of series or points,
+        a series name or the categories changed, the data is replaced in
+        full.
         """
         rewriter = SeriesXmlRewriterFactory(self.chart_type, chart_data)
-        rewriter.replace_series_data(self._chartSpace)
-        self._workbook.update_from_xlsx_blob(chart_data.xlsx_blob)
+        cells = rewriter.update_series_values(self._chartSpace) if incremental else None
+        if cells is None:
+            rewriter.replace_series_data(self._chartSpace)
+        elif embed_workbook is True and self._workbook.update_cells(cells):
+            return
+        self._workbook.update_from_chart_data(chart_data, embed_workbook)
 
     @lazyproperty
     def series(self):
@@ -183,6 +200,42 @@ class Chart(PartElementProxy):
         """
         return SeriesCollection(self._chartSpace.plotArea)
 
+    def to_columns(self):
+        """
+        Return the data of this chart as a list of `(heading, values)` pairs,
+        one for each column of its chart data table, read from the values
+        cached in the chart XML in a single pass.
+
+        A category chart has a first column of category labels, headed
+        |None|, followed by a column of values for each series, headed by the
+        series name. A label of a multi-level category is a tuple in parent
+        -> child order, as in :attr:`.Categories.flattened_labels`. Each
+        series of an XY chart has a column of X values, headed |None|,
+        followed by a column of Y values headed by the series name, and
+        a bubble chart series has a third column of bubble sizes headed
+        'Size'. Each sequence of values is a tuple of floats, with |None| for
+        a data point having no value.
+        """
+        columns = []
+        categories = self.plots[0].categories if self.plots else None
+        if categories is not None and categories.depth > 0:
+            if categories.depth > 1:
+                labels = categories.flattened_labels
+            else:
+                labels = tuple(category.label for category in categories)
+            columns.append((None, labels))
+
+        for series in self.series:
+            ser = series._element
+            if ser.xVal is None and ser.yVal is None:
+                columns.append((series.name, series.values))
+                continue
+            columns.append((None, () if ser.xVal is None else ser.xVal.pt_values()))
+            columns.append((series.name, series.values))
+            if ser.bubbleSize is not None:
+                columns.append(("Size", ser.bubbleSize.pt_values()))
+        return columns
+
     @property
     def value_axis(self):
         """
@@ -7,8 +7,13 @@ ChartData and related objects.
 from __future__ import absolute_import, print_function, unicode_literals
 
 import datetime
+import hashlib
+from array import array
 from numbers import Number
 
+from pptx import __version__
+from pptx.chart.cache import get_payload_cache
+from pptx.chart.downsample import lttb, min_max
 from pptx.chart.xlsx import (
     BubbleWorkbookWriter,
     CategoryWorkbookWriter,
@@ -28,12 +33,20 @@ class _BaseChartData(Sequence):
     as a parameter in :meth:`shapes.add_chart` and
     :meth:`Chart.replace_data`. The data structure varies between major chart
     categories such as category charts and XY charts.
+
+    *xlsx_backend* chooses the library writing the Excel workbook embedded in
+    the chart, "native" for the small built-in writer or "xlsxwriter" for
+    XlsxWriter, which must then be installed.
     """
 
-    def __init__(self, number_format="General"):
+    def __init__(self, number_format="General", xlsx_backend="native"):
         super(_BaseChartData, self).__init__()
+        if xlsx_backend not in ("native", "xlsxwriter"):
+            raise ValueError("xlsx_backend must be 'native' or 'xlsxwriter'")
         self._number_format = number_format
+        self._xlsx_backend = xlsx_backend
         self._series = []
+        self._offsets = None
 
     def __getitem__(self, index):
         return self._series.__getitem__(index)
@@ -42,6 +55,7 @@ class _BaseChartData(Sequence):
         return self._series.__len__()
 
     def append(self, series):
+        self._offsets = None
         return self._series.append(series)
 
     def data_point_offset(self, series):
@@ -49,12 +63,7 @@ class _BaseChartData(Sequence):
         The total integer number of data points appearing in the series of
         this chart that are prior to *series* in this sequence.
         """
-        count = 0
-        for this_series in self:
-            if series is this_series:
-                return count
-            count += len(this_series)
-        raise ValueError("series not in chart data object")
+        return self._series_offsets(series)[1]
 
     @property
     def number_format(self):
@@ -71,10 +80,7 @@ class _BaseChartData(Sequence):
         """
         Return the integer index of *series* in this sequence.
         """
-        for idx, s in enumerate(self):
-            if series is s:
-                return idx
-        raise ValueError("series not in chart data object")
+        return self._series_offsets(series)[0]
 
     def series_name_ref(self, series):
         """
@@ -90,13 +96,23 @@ class _BaseChartData(Sequence):
         """
         return self._workbook_writer.x_values_ref(series)
 
+    @property
+    def xlsx_backend(self):
+        """
+        The name of the library writing the Excel workbook for this chart
+        data, "native" or "xlsxwriter".
+        """
+        return self._xlsx_backend
+
     @property
     def xlsx_blob(self):
         """
         Return a blob containing an Excel workbook file populated with the
         contents of this chart data object.
         """
-        return self._workbook_writer.xlsx_blob
+        return self._cached_payload(
+            "xlsx", self._xlsx_writer_id, lambda: self._workbook_writer.xlsx_blob
+        )
 
     def xml_bytes(self, chart_type):
         """
@@ -104,7 +120,9 @@ class _BaseChartData(Sequence):
         containing the series in this chart data object, as bytes suitable
         for writing directly to a file.
         """
-        return self._xml(chart_type).encode("utf-8")
+        return self._cached_payload(
+            "xml", int(chart_type), lambda: self._xml(chart_type).encode("utf-8")
+        )
 
     def y_values_ref(self, series):
         """
@@ -113,6 +131,72 @@ class _BaseChartData(Sequence):
         """
         return self._workbook_writer.y_values_ref(series)
 
+    def _cached_payload(self, kind, variant, write):
+        """
+        Return the blob written by calling *write*, or the same blob found in
+        the chart payload cache when one is in use. *kind* and *variant*,
+        like "xml" and the chart type, tell apart the blobs written for the
+        same content.
+        """
+        payload_cache = get_payload_cache()
+        if payload_cache is None:
+            return write()
+        key = self._content_key(kind, variant)
+        blob = payload_cache.get(key)
+        if blob is None:
+            blob = write()
+            payload_cache.put(key, blob)
+        return blob
+
+    def _clear_offsets(self):
+        """
+        Discard the cached index and data point offset of each series, on
+        a change in the number of data points of a series.
+        """
+        self._offsets = None
+
+    def _content_key(self, kind, variant):
+        """
+        Return the SHA1 hex digest of *kind*, *variant* and the content of
+        this chart data object, the key of its blobs in the payload cache.
+        The python-pptx version is part of the key, so blobs kept on disk by
+        an earlier version, whose writers may differ, are not reused.
+        """
+        sha1 = hashlib.sha1()
+        sha1.update(_content_bytes((kind, variant, __version__)))
+        for item in self._iter_content():
+            sha1.update(_content_bytes(item))
+        return sha1.hexdigest()
+
+    def _iter_content(self):
+        """
+        Generate the items of the content of this chart data object that its
+        XML and Excel workbook depend on, the series names, number formats
+        and value columns.
+        """
+        yield (type(self).__name__, self._number_format)
+        for series in self:
+            yield (series.name, series.number_format)
+            for column in series._columns:
+                yield column
+
+    def _series_offsets(self, series):
+        """
+        Return the (index, data_point_offset) pair for *series*. The pairs
+        for all series are computed in a single pass and cached until
+        a series or a data point is added.
+        """
+        if self._offsets is None:
+            offsets, count = {}, 0
+            for idx, this_series in enumerate(self._series):
+                offsets[id(this_series)] = (idx, count)
+                count += len(this_series)
+            self._offsets = offsets
+        try:
+            return self._offsets[id(series)]
+        except KeyError:
+            raise ValueError("series not in chart data object")
+
     @property
     def _workbook_writer(self):
         """
@@ -121,6 +205,19 @@ class _BaseChartData(Sequence):
         """
         raise NotImplementedError("must be implemented by all subclasses")
 
+    @property
+    def _xlsx_writer_id(self):
+        """
+        The name of the xlsx backend, along with the version of XlsxWriter
+        when that is the backend, telling apart the workbooks it writes in
+        the payload cache.
+        """
+        if self._xlsx_backend == "native":
+            return "native"
+        import xlsxwriter
+
+        return "xlsxwriter %s" % xlsxwriter.__version__
+
     def _xml(self, chart_type):
         """
         Return (as unicode text) the XML for a chart of *chart_type*
@@ -152,6 +249,7 @@ class _BaseSeriesData(Sequence):
         return self._data_points.__len__()
 
     def append(self, data_point):
+        self._clear_chart_offsets()
         return self._data_points.append(data_point)
 
     @property
@@ -232,6 +330,22 @@ class _BaseSeriesData(Sequence):
         """
         return self._chart_data.y_values_ref(self)
 
+    def _clear_chart_offsets(self):
+        """
+        Discard the series offsets cached by the chart data object, as the
+        number of data points in this series is changing.
+        """
+        if self._chart_data is not None:
+            self._chart_data._clear_offsets()
+
+    def _keep_points(self, idxs):
+        """
+        Keep only the data points at offsets *idxs*, in that order.
+        """
+        self._clear_chart_offsets()
+        data_points = self._data_points
+        self._data_points = [data_points[idx] for idx in idxs]
+
 
 class _BaseDataPoint(object):
     """
@@ -327,6 +441,34 @@ class CategoryChartData(_BaseChartData):
         """
         return self._workbook_writer.categories_ref
 
+    def downsample(self, max_points):
+        """
+        Reduce the number of categories to at most *max_points*, keeping the
+        shape of each series. The same categories are kept for every series,
+        chosen by :func:`.downsample.min_max` so that the minimum and maximum
+        values of each series in each stretch of categories survive. Nothing
+        changes when there are no more than *max_points* categories.
+
+        Only a single level of categories can be downsampled, each series
+        must have a value for each category, and *max_points* must be at
+        least twice the number of series; |ValueError| is raised otherwise.
+        A line chart of many thousands
+        of points is drawn much the same from a few thousand of them, and
+        both the chart XML and the Excel workbook are written much faster.
+        """
+        categories = self.categories
+        if categories.leaf_count <= max_points:
+            return
+        if categories.depth != 1:
+            raise ValueError("only single-level categories can be downsampled")
+        columns = [series_data.values for series_data in self]
+        if any(len(column) != categories.leaf_count for column in columns):
+            raise ValueError("each series must have a value for each category")
+        idxs = min_max(columns, max_points)
+        categories._keep_categories(idxs)
+        for series_data in self:
+            series_data._keep_points(idxs)
+
     def values_ref(self, series):
         """
         The Excel worksheet reference to the values for *series* (not
@@ -334,6 +476,16 @@ class CategoryChartData(_BaseChartData):
         """
         return self._workbook_writer.values_ref(series)
 
+    def _iter_content(self):
+        """
+        Generate the items of the content of this chart data object, the
+        category labels at each level of the hierarchy ahead of the series.
+        """
+        categories = self.categories
+        yield (categories.number_format, list(categories.levels))
+        for item in super(CategoryChartData, self)._iter_content():
+            yield item
+
     @lazyproperty
     def _workbook_writer(self):
         """
@@ -353,6 +505,7 @@ class Categories(Sequence):
         super(Categories, self).__init__()
         self._categories = []
         self._number_format = None
+        self._clear_cache()
 
     def __getitem__(self, idx):
         return self._categories.__getitem__(idx)
@@ -379,6 +532,7 @@ class Categories(Sequence):
         """
         category = Category(label, self)
         self._categories.append(category)
+        self._clear_cache()
         return category
 
     @property
@@ -428,26 +582,21 @@ class Categories(Sequence):
         The number of hierarchy levels in this category graph. Returns 0 if
         it contains no categories.
         """
-        categories = self._categories
-        if not categories:
-            return 0
-        first_depth = categories[0].depth
-        for category in categories[1:]:
-            if category.depth != first_depth:
-                raise ValueError("category depth not uniform")
-        return first_depth
+        if self._depth is None:
+            self._depth = _uniform_depth(self._categories)
+        return self._depth
 
     def index(self, category):
         """
         The offset of *category* in the overall sequence of leaf categories.
         A non-leaf category gets the index of its first sub-category.
         """
-        index = 0
-        for this_category in self._categories:
-            if category is this_category:
-                return index
-            index += this_category.leaf_count
-        raise ValueError("category not in top-level categories")
+        if self._offsets is None:
+            self._offsets, self._leaf_count = _leaf_offsets(self._categories)
+        try:
+            return self._offsets[id(category)]
+        except KeyError:
+            raise ValueError("category not in top-level categories")
 
     @property
     def leaf_count(self):
@@ -456,7 +605,9 @@ class Categories(Sequence):
         value is the same as that of `len()` only when the hierarchy is
         single level.
         """
-        return sum(c.leaf_count for c in self._categories)
+        if self._leaf_count is None:
+            self._offsets, self._leaf_count = _leaf_offsets(self._categories)
+        return self._leaf_count
 
     @property
     def levels(self):
@@ -475,7 +626,9 @@ class Categories(Sequence):
             # yield this level
             yield [(cat.idx, cat.label) for cat in categories]
 
-        for level in levels(self):
+        if self._levels is None:
+            self._levels = list(levels(self))
+        for level in self._levels:
             yield level
 
     @property
@@ -509,6 +662,24 @@ class Categories(Sequence):
     def number_format(self, value):
         self._number_format = value
 
+    def _clear_cache(self):
+        """
+        Discard the depth, leaf count, category offsets and levels cached for
+        this hierarchy, on the addition of a category anywhere in it.
+        """
+        self._depth = None
+        self._leaf_count = None
+        self._offsets = None
+        self._levels = None
+
+    def _keep_categories(self, idxs):
+        """
+        Keep only the categories at offsets *idxs*, in that order.
+        """
+        categories = self._categories
+        self._categories = [categories[idx] for idx in idxs]
+        self._clear_cache()
+
 
 class Category(object):
     """
@@ -522,6 +693,9 @@ class Category(object):
         self._label = label
         self._parent = parent
         self._sub_categories = []
+        self._depth = None
+        self._leaf_count = None
+        self._offsets = None
 
     def add_sub_category(self, label):
         """
@@ -530,6 +704,7 @@ class Category(object):
         """
         category = Category(label, self)
         self._sub_categories.append(category)
+        self._clear_cache()
         return category
 
     @property
@@ -538,14 +713,9 @@ class Category(object):
         The number of hierarchy levels rooted at this category node. Returns
         1 if this category has no sub-categories.
         """
-        sub_categories = self._sub_categories
-        if not sub_categories:
-            return 1
-        first_depth = sub_categories[0].depth
-        for category in sub_categories[1:]:
-            if category.depth != first_depth:
-                raise ValueError("category depth not uniform")
-        return first_depth + 1
+        if self._depth is None:
+            self._depth = _uniform_depth(self._sub_categories) + 1
+        return self._depth
 
     @property
     def idx(self):
@@ -561,12 +731,13 @@ class Category(object):
         The offset of *sub_category* in the overall sequence of leaf
         categories.
         """
-        index = self._parent.index(self)
-        for this_sub_category in self._sub_categories:
-            if sub_category is this_sub_category:
-                return index
-            index += this_sub_category.leaf_count
-        raise ValueError("sub_category not in this category")
+        if self._offsets is None:
+            self._offsets, self._leaf_count = _leaf_offsets(self._sub_categories)
+        try:
+            offset = self._offsets[id(sub_category)]
+        except KeyError:
+            raise ValueError("sub_category not in this category")
+        return self._parent.index(self) + offset
 
     @property
     def leaf_count(self):
@@ -576,7 +747,9 @@ class Category(object):
         """
         if not self._sub_categories:
             return 1
-        return sum(category.leaf_count for category in self._sub_categories)
+        if self._leaf_count is None:
+            self._offsets, self._leaf_count = _leaf_offsets(self._sub_categories)
+        return self._leaf_count
 
     @property
     def label(self):
@@ -606,6 +779,17 @@ class Category(object):
         """
         return self._sub_categories
 
+    def _clear_cache(self):
+        """
+        Discard the depth, leaf count and offsets cached for this category
+        and each of its ancestors, on the addition of a sub-category.
+        """
+        self._depth = None
+        self._leaf_count = None
+        self._offsets = None
+        if self._parent is not None:
+            self._parent._clear_cache()
+
     def _excel_date_number(self, date_1904):
         """
         Return an integer representing the date label of this category as the
@@ -684,6 +868,13 @@ class CategorySeriesData(_BaseSeriesData):
         """
         return self._chart_data.values_ref(self)
 
+    @property
+    def _columns(self):
+        """
+        The value columns of this series, just its (Y) values.
+        """
+        return (self.values,)
+
 
 class XyChartData(_BaseChartData):
     """
@@ -702,6 +893,32 @@ class XyChartData(_BaseChartData):
         self.append(series_data)
         return series_data
 
+    def downsample(self, max_points, method="lttb"):
+        """
+        Reduce the number of points of each series having more than
+        *max_points* to that many, keeping the shape of the series. *method*
+        is "lttb" to choose the points by :func:`.downsample.lttb`, which
+        suits a line through the points, or "min_max" to keep the lowest and
+        highest Y value in each stretch of points, by
+        :func:`.downsample.min_max`, which assumes the X values are in
+        increasing order. LTTB drops the points having a blank X or Y value.
+
+        A scatter chart of many thousands of points is drawn much the same
+        from a few thousand of them, and both the chart XML and the Excel
+        workbook are written much faster. Twice the width of the chart in
+        pixels is a reasonable number of points.
+        """
+        if method not in ("lttb", "min_max"):
+            raise ValueError("method must be 'lttb' or 'min_max', got %r" % method)
+        for series_data in self:
+            if len(series_data) <= max_points:
+                continue
+            if method == "lttb":
+                idxs = lttb(series_data.x_values, series_data.y_values, max_points)
+            else:
+                idxs = min_max((series_data.y_values,), max_points)
+            series_data._keep_points(idxs)
+
     @lazyproperty
     def _workbook_writer(self):
         """
@@ -765,6 +982,13 @@ class XySeriesData(_BaseSeriesData):
         self.append(data_point)
         return data_point
 
+    @property
+    def _columns(self):
+        """
+        The value columns of this series, its X and Y values.
+        """
+        return (self.x_values, self.y_values)
+
 
 class BubbleSeriesData(XySeriesData):
     """
@@ -804,6 +1028,232 @@ class BubbleSeriesData(XySeriesData):
         """
         return self._chart_data.bubble_sizes_ref(self)
 
+    @property
+    def _columns(self):
+        """
+        The value columns of this series, its X and Y values and bubble
+        sizes.
+        """
+        return (self.x_values, self.y_values, self.bubble_sizes)
+
+
+class ColumnarCategoryChartData(CategoryChartData):
+    """
+    A |CategoryChartData| object storing the values of each series as
+    a column of floats rather than as a data point object per value. It uses
+    a small fraction of the memory for a series having many thousands of
+    values and can take each series whole, for example as a NumPy array.
+    A blank value is represented by NaN.
+    """
+
+    def add_series(self, name, values=(), number_format=None):
+        """
+        Add a series to this data set entitled *name* and having the values
+        in *values*, an iterable of numeric values like a list, an
+        `array('d')` or a NumPy array. A |None| value, or a NaN or masked
+        value in a NumPy array, is a blank. *number_format* specifies how the
+        series values will be displayed, and may be a string, e.g. '#,##0'
+        corresponding to an Excel number format.
+        """
+        series_data = ColumnarCategorySeriesData(self, name, number_format, values)
+        self.append(series_data)
+        return series_data
+
+
+class ColumnarXyChartData(XyChartData):
+    """
+    An |XyChartData| object storing the X and Y values of each series as
+    columns of floats rather than as a data point object per point.
+    """
+
+    def add_series(self, name, x_values=(), y_values=(), number_format=None):
+        """
+        Return a |ColumnarXySeriesData| object newly created and added at the
+        end of this sequence, identified by *name*, having the points given
+        by the numbers in *x_values* and *y_values* and values formatted with
+        *number_format*. *x_values* and *y_values* can be any iterable of
+        numbers, like a NumPy array, and must be the same length.
+        """
+        series_data = ColumnarXySeriesData(
+            self, name, number_format, x_values, y_values
+        )
+        self.append(series_data)
+        return series_data
+
+
+class ColumnarBubbleChartData(BubbleChartData):
+    """
+    A |BubbleChartData| object storing the X and Y values and bubble sizes of
+    each series as columns of floats rather than as a data point object per
+    point.
+    """
+
+    def add_series(
+        self, name, x_values=(), y_values=(), bubble_sizes=(), number_format=None
+    ):
+        """
+        Return a |ColumnarBubbleSeriesData| object newly created and added at
+        the end of this sequence, identified by *name*, having the points
+        given by the numbers in *x_values*, *y_values* and *bubble_sizes* and
+        values formatted with *number_format*. Each of *x_values*, *y_values*
+        and *bubble_sizes* can be any iterable of numbers, like a NumPy
+        array, and they must be the same length.
+        """
+        series_data = ColumnarBubbleSeriesData(
+            self, name, number_format, x_values, y_values, bubble_sizes
+        )
+        self.append(series_data)
+        return series_data
+
+
+class ColumnarCategorySeriesData(CategorySeriesData):
+    """
+    A category chart series storing its values as an `array('d')` column. It
+    operates as a sequence of float values, NaN for a blank.
+    """
+
+    def __init__(self, chart_data, name, number_format, values=()):
+        super(ColumnarCategorySeriesData, self).__init__(
+            chart_data, name, number_format
+        )
+        self._values = _float_column(values)
+
+    def __getitem__(self, index):
+        return self._values.__getitem__(index)
+
+    def __len__(self):
+        return self._values.__len__()
+
+    def add_data_point(self, value, number_format=None):
+        """
+        Append *value* to the values of this series, a blank when *value* is
+        |None|. A number format is not stored per value, so *number_format*
+        is ignored.
+        """
+        self._clear_chart_offsets()
+        self._values.append(_NAN if value is None else value)
+
+    def _keep_points(self, idxs):
+        """
+        Keep only the values at offsets *idxs*, in that order.
+        """
+        self._clear_chart_offsets()
+        self._values = _take(self._values, idxs)
+
+    @property
+    def values(self):
+        """
+        The `array('d')` column of values of this series, NaN for a blank.
+        """
+        return self._values
+
+
+class ColumnarXySeriesData(XySeriesData):
+    """
+    An XY chart series storing its X and Y values as `array('d')` columns. It
+    operates as a sequence of (x, y) pairs, NaN for a blank.
+    """
+
+    def __init__(self, chart_data, name, number_format, x_values=(), y_values=()):
+        super(ColumnarXySeriesData, self).__init__(chart_data, name, number_format)
+        self._x_values = _float_column(x_values)
+        self._y_values = _float_column(y_values)
+        if len(self._x_values) != len(self._y_values):
+            raise ValueError("x_values and y_values must be the same length")
+
+    def __getitem__(self, index):
+        return self._x_values.__getitem__(index), self._y_values.__getitem__(index)
+
+    def __len__(self):
+        return self._x_values.__len__()
+
+    def add_data_point(self, x, y, number_format=None):
+        """
+        Append the point (*x*, *y*) to this series, |None| for a blank.
+        A number format is not stored per point, so *number_format* is
+        ignored.
+        """
+        self._clear_chart_offsets()
+        self._x_values.append(_NAN if x is None else x)
+        self._y_values.append(_NAN if y is None else y)
+
+    def _keep_points(self, idxs):
+        """
+        Keep only the points at offsets *idxs*, in that order.
+        """
+        self._clear_chart_offsets()
+        self._x_values = _take(self._x_values, idxs)
+        self._y_values = _take(self._y_values, idxs)
+
+    @property
+    def x_values(self):
+        """
+        The `array('d')` column of X values of this series, NaN for a blank.
+        """
+        return self._x_values
+
+    @property
+    def y_values(self):
+        """
+        The `array('d')` column of Y values of this series, NaN for a blank.
+        """
+        return self._y_values
+
+
+class ColumnarBubbleSeriesData(ColumnarXySeriesData, BubbleSeriesData):
+    """
+    A bubble chart series storing its X and Y values and bubble sizes as
+    `array('d')` columns. It operates as a sequence of (x, y, size) triples,
+    NaN for a blank.
+    """
+
+    def __init__(
+        self,
+        chart_data,
+        name,
+        number_format,
+        x_values=(),
+        y_values=(),
+        bubble_sizes=(),
+    ):
+        super(ColumnarBubbleSeriesData, self).__init__(
+            chart_data, name, number_format, x_values, y_values
+        )
+        self._bubble_sizes = _float_column(bubble_sizes)
+        if len(self._bubble_sizes) != len(self._x_values):
+            raise ValueError("bubble_sizes must be the same length as x_values")
+
+    def __getitem__(self, index):
+        return (
+            self._x_values.__getitem__(index),
+            self._y_values.__getitem__(index),
+            self._bubble_sizes.__getitem__(index),
+        )
+
+    def add_data_point(self, x, y, size, number_format=None):
+        """
+        Append the point (*x*, *y*) having bubble *size* to this series,
+        |None| for a blank. A number format is not stored per point, so
+        *number_format* is ignored.
+        """
+        super(ColumnarBubbleSeriesData, self).add_data_point(x, y)
+        self._bubble_sizes.append(_NAN if size is None else size)
+
+    def _keep_points(self, idxs):
+        """
+        Keep only the points at offsets *idxs*, in that order.
+        """
+        super(ColumnarBubbleSeriesData, self)._keep_points(idxs)
+        self._bubble_sizes = _take(self._bubble_sizes, idxs)
+
+    @property
+    def bubble_sizes(self):
+        """
+        The `array('d')` column of bubble sizes of this series, NaN for
+        a blank.
+        """
+        return self._bubble_sizes
+
 
 class CategoryDataPoint(_BaseDataPoint):
     """
@@ -866,3 +1316,74 @@ class BubbleDataPoint(XyDataPoint):
         The value representing the size of the bubble for this data point.
         """
         return self._size
+
+
+_NAN = float("nan")
+
+
+def _leaf_offsets(categories):
+    """
+    Return a (offsets, leaf_count) pair for the sibling *categories*, where
+    offsets maps the id of each category to the number of leaf categories
+    preceding it among them.
+    """
+    offsets, leaf_count = {}, 0
+    for category in categories:
+        offsets[id(category)] = leaf_count
+        leaf_count += category.leaf_count
+    return offsets, leaf_count
+
+
+def _uniform_depth(categories):
+    """
+    Return the depth shared by each of the sibling *categories*, 0 when there
+    are none. Raises |ValueError| when they differ in depth.
+    """
+    if not categories:
+        return 0
+    first_depth = categories[0].depth
+    for category in categories[1:]:
+        if category.depth != first_depth:
+            raise ValueError("category depth not uniform")
+    return first_depth
+
+
+def _float_column(values):
+    """
+    Return an `array('d')` containing the numbers in *values*, NaN for
+    a blank. A NumPy array is copied as a single buffer, a masked value
+    becoming NaN. Each item of another iterable is copied in turn, a |None|
+    item becoming NaN.
+    """
+    column = array("d")
+    if hasattr(values, "dtype"):
+        values = values.astype("d")
+        if hasattr(values, "filled"):
+            values = values.filled(_NAN)
+        if hasattr(values, "tobytes"):
+            frombytes = getattr(column, "frombytes", None) or column.fromstring
+            frombytes(values.tobytes())
+            return column
+    column.extend(_NAN if value is None else value for value in values)
+    return column
+
+
+def _take(column, idxs):
+    """
+    Return a new `array('d')` column of the values of *column* at *idxs*.
+    """
+    return array("d", [column[idx] for idx in idxs])
+
+
+def _content_bytes(item):
+    """
+    Return bytes standing for *item* in a content key, a value column or
+    a tuple of values. Each is prefixed with its kind and length so that
+    no two sequences of items give the same bytes.
+    """
+    if isinstance(item, array):
+        tobytes = getattr(item, "tobytes", None) or item.tostring
+        data, kind = tobytes(), "a"
+    else:
+        data, kind = repr(list(item)).encode("utf-8"), "r"
+    return ("%s%d:" % (kind, len(data))).encode("ascii") + data
@@ -0,0 +1,181 @@
+# encoding: utf-8
+
+"""Shape-preserving reduction of the number of points in large chart series.
+
+Each function returns the indices of the points to keep, in order, so the same selection
+can be applied to every column of a series, or to the categories shared by the series
+of a category chart. When NumPy is installed, the points of each bucket are compared
+with array operations rather than one by one.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def lttb(x_values, y_values, max_points):
+    """Return indices of at most *max_points* points, chosen by the LTTB algorithm.
+
+    Largest-Triangle-Three-Buckets keeps the first and last points and divides those
+    between into `max_points - 2` buckets. The point kept from each bucket is the one
+    forming the largest triangle with the point kept from the bucket before and the
+    average point of the bucket after, which preserves the peaks and troughs a line
+    through all the points would show. A point having a blank X or Y value, |None| or
+    NaN, is dropped.
+    """
+    _validate(max_points)
+    if numpy is not None:
+        x, y = _numpy_column(x_values), _numpy_column(y_values)
+        valid = numpy.flatnonzero(~(numpy.isnan(x) | numpy.isnan(y)))
+        if len(valid) <= max_points:
+            return valid.tolist()
+        return valid[_lttb_numpy(x[valid], y[valid], max_points)].tolist()
+
+    valid = [
+        idx
+        for idx, (x, y) in enumerate(zip(x_values, y_values))
+        if not _is_blank(x) and not _is_blank(y)
+    ]
+    if len(valid) <= max_points:
+        return valid
+    x = [float(x_values[idx]) for idx in valid]
+    y = [float(y_values[idx]) for idx in valid]
+    return [valid[idx] for idx in _lttb_python(x, y, max_points)]
+
+
+def min_max(columns, max_points):
+    """Return indices of at most *max_points* points, keeping the extremes of *columns*.
+
+    *columns* is a sequence of equal-length value columns, like the values of each
+    series of a category chart. The points are divided into buckets of consecutive
+    points and from each bucket the points where any column has its minimum or maximum
+    are kept, so that every spike in any column survives. The number of buckets is
+    chosen so at most *max_points* points are kept. The first point of a bucket having
+    only blank values, |None| or NaN, is kept so the gap still shows.
+
+    Raises |ValueError| when *max_points* is less than two points for each column,
+    too few for even a single bucket.
+    """
+    _validate(max_points)
+    columns = list(columns)
+    point_count = len(columns[0]) if columns else 0
+    if point_count <= max_points:
+        return list(range(point_count))
+    bucket_count = max_points // (2 * len(columns))
+    if bucket_count < 1:
+        raise ValueError(
+            "max_points must be at least 2 per column, got %r for %d columns"
+            % (max_points, len(columns))
+        )
+    bounds = _bucket_bounds(point_count, bucket_count)
+
+    if numpy is not None:
+        arrays = [_numpy_column(column) for column in columns]
+        idxs = set()
+        for start, end in zip(bounds, bounds[1:]):
+            kept = False
+            for array in arrays:
+                bucket = array[start:end]
+                if numpy.isnan(bucket).all():
+                    continue
+                idxs.add(start + int(numpy.nanargmin(bucket)))
+                idxs.add(start + int(numpy.nanargmax(bucket)))
+                kept = True
+            if not kept:
+                idxs.add(start)
+        return sorted(idxs)
+
+    idxs = set()
+    for start, end in zip(bounds, bounds[1:]):
+        kept = False
+        for column in columns:
+            valid = [idx for idx in range(start, end) if not _is_blank(column[idx])]
+            if not valid:
+                continue
+            idxs.add(min(valid, key=column.__getitem__))
+            idxs.add(max(valid, key=column.__getitem__))
+            kept = True
+        if not kept:
+            idxs.add(start)
+    return sorted(idxs)
+
+
+def _bucket_bounds(point_count, bucket_count):
+    """Return the `bucket_count + 1` offsets dividing *point_count* points evenly."""
+    return [point_count * i // bucket_count for i in range(bucket_count + 1)]
+
+
+def _is_blank(value):
+    """True if *value* is |None| or NaN."""
+    return value is None or value != value
+
+
+def _lttb_numpy(x, y, max_points):
+    """Return the LTTB indices of float arrays *x* and *y*, using array operations."""
+    bounds = _lttb_bounds(len(x), max_points)
+    idxs = numpy.empty(max_points, dtype=numpy.intp)
+    idxs[0], idxs[-1] = 0, len(x) - 1
+    a = 0
+    for i in range(max_points - 2):
+        start, end = bounds[i], bounds[i + 1]
+        next_end = bounds[i + 2] if i + 2 < len(bounds) else len(x)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = numpy.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        idxs[i + 1] = a
+    return idxs
+
+
+def _lttb_python(x, y, max_points):
+    """Return the LTTB indices of float lists *x* and *y*, one point at a time."""
+    point_count = len(x)
+    bounds = _lttb_bounds(point_count, max_points)
+    idxs = [0]
+    a = 0
+    for i in range(max_points - 2):
+        start, end = bounds[i], bounds[i + 1]
+        next_end = bounds[i + 2] if i + 2 < len(bounds) else point_count
+        next_count = next_end - end
+        avg_x = sum(x[end:next_end]) / next_count
+        avg_y = sum(y[end:next_end]) / next_count
+        ax, ay = x[a], y[a]
+        dx, dy = ax - avg_x, avg_y - ay
+        max_area, a = -1.0, start
+        for idx in range(start, end):
+            area = abs(dx * (y[idx] - ay) - (ax - x[idx]) * dy)
+            if area > max_area:
+                max_area, a = area, idx
+        idxs.append(a)
+    idxs.append(point_count - 1)
+    return idxs
+
+
+def _lttb_bounds(point_count, max_points):
+    """Return the offsets dividing all but the end points into `max_points - 2` buckets.
+
+    Bucket *i* spans the points from `bounds[i]` up to `bounds[i + 1]`.
+    """
+    every = (point_count - 2) / (max_points - 2)
+    bounds = [int(i * every) + 1 for i in range(max_points - 1)]
+    bounds[-1] = point_count - 1
+    return bounds
+
+
+def _numpy_column(values):
+    """Return *values* as a NumPy float array, NaN for |None|."""
+    if hasattr(values, "dtype") or hasattr(values, "typecode"):
+        return numpy.asarray(values, dtype=float)
+    return numpy.array([numpy.nan if v is None else v for v in values], dtype=float)
+
+
+def _validate(max_points):
+    """Raise |ValueError| unless *max_points* leaves room for more than the ends."""
+    if max_points < 3:
+        raise ValueError("max_points must be at least 3, got %r" % max_points)
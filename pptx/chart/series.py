@@ -73,15 +73,10 @@ class _BaseCategorySeries(_BaseSeries):
         Read-only. A sequence containing the float values for this series, in
         the order they appear on the chart.
         """
-
-        def iter_values():
-            val = self._element.val
-            if val is None:
-                return
-            for idx in range(val.ptCount_val):
-                yield val.pt_v(idx)
-
-        return tuple(iter_values())
+        val = self._element.val
+        if val is None:
+            return ()
+        return val.pt_values()
 
 
 class _MarkerMixin(object):
@@ -182,8 +177,8 @@ class XySeries(_BaseSeries, _MarkerMixin):
         if yVal is None:
             return
 
-        for idx in range(yVal.ptCount_val):
-            yield yVal.pt_v(idx)
+        for value in yVal.pt_values():
+            yield value
 
     @lazyproperty
     def points(self):
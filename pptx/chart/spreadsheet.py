@@ -0,0 +1,452 @@
+# encoding: utf-8
+
+"""Minimal writer for the Excel workbook embedded in a chart.
+
+|Workbook| and |Worksheet| provide the small part of the XlsxWriter API used by the
+workbook writers in `pptx.chart.xlsx`, enough to write a single worksheet of numbers,
+strings and dates. Cells are not formatted beyond their number format and no formula is
+ever written. A column written with `write_column()` is kept as the sequence passed and
+only rendered to XML when the workbook is closed, one row at a time.
+
+`update_cells()` changes the values of a few cells of an existing workbook in place.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+import posixpath
+import zipfile
+from numbers import Number
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+from pptx.compat import BytesIO, to_unicode
+
+_INFINITIES = (float("inf"), float("-inf"))
+
+_NS = {
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+}
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.re'
+    'lationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformat'
+    's-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.open'
+    'xmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-'
+    'officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlf'
+    'ormats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    "</Types>"
+)
+
+_PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationship'
+    's"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument'
+    '/2006/relationships/officeDocument" Target="xl/workbook.xml"/></Relationships>'
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns'
+    ':r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationship'
+    's"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument'
+    '/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/><Relationship Id='
+    '"rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+    'styles" Target="styles.xml"/><Relationship Id="rId3" Type="http://schemas.openxml'
+    'formats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedString'
+    's.xml"/></Relationships>'
+)
+
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "{numFmts}"
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/><family val="2"/>'
+    '<scheme val="minor"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFil'
+    'l patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    "</borders>"
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    "</cellStyleXfs>"
+    '<cellXfs count="{xf_count}">{xfs}</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    "</cellStyles>"
+    "</styleSheet>"
+)
+
+_SHEET_HEAD_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+)
+
+
+class Workbook(object):
+    """A workbook having a single worksheet, written to *file* on `close()`.
+
+    *file* is a path or a writable file-like object such as a `BytesIO` instance.
+    *options* is accepted for compatibility with `xlsxwriter.Workbook` and ignored.
+    """
+
+    def __init__(self, file, options=None):
+        super(Workbook, self).__init__()
+        self._file = file
+        self._worksheet = None
+        self._num_formats = []
+
+    def add_format(self, properties=None):
+        """Return a |Format| object having the number format in *properties*.
+
+        Only the `"num_format"` key of *properties* is recognized, as in
+        `{"num_format": "0.00"}`.
+        """
+        num_format = (properties or {}).get("num_format", "General")
+        if num_format not in self._num_formats:
+            self._num_formats.append(num_format)
+        return Format(self._num_formats.index(num_format) + 1)
+
+    def add_worksheet(self):
+        """Return the |Worksheet| object of this workbook, named "Sheet1"."""
+        if self._worksheet is None:
+            self._worksheet = Worksheet()
+        return self._worksheet
+
+    def close(self):
+        """Write this workbook to its file as a zip package."""
+        worksheet = self.add_worksheet()
+        with zipfile.ZipFile(self._file, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+            zip_file.writestr("_rels/.rels", _PACKAGE_RELS_XML)
+            zip_file.writestr("xl/workbook.xml", _WORKBOOK_XML)
+            zip_file.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+            zip_file.writestr("xl/styles.xml", self._styles_xml.encode("utf-8"))
+            zip_file.writestr("xl/worksheets/sheet1.xml", worksheet.xml_bytes())
+            zip_file.writestr(
+                "xl/sharedStrings.xml", worksheet.shared_strings_xml.encode("utf-8")
+            )
+
+    @property
+    def _styles_xml(self):
+        """The XML of the styles part, having an xf for each number format."""
+        num_fmts, xfs = [], ['<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>']
+        for num_format in self._num_formats:
+            if num_format == "General":
+                num_fmt_id = 0
+            else:
+                num_fmt_id = 164 + len(num_fmts)
+                num_fmts.append(
+                    '<numFmt numFmtId="%d" formatCode="%s"/>'
+                    % (num_fmt_id, escape(num_format, {'"': "&quot;"}))
+                )
+            xfs.append(
+                '<xf numFmtId="%d" fontId="0" fillId="0" borderId="0" xfId="0"%s/>'
+                % (num_fmt_id, ' applyNumberFormat="1"' if num_fmt_id else "")
+            )
+        return _STYLES_XML.format(
+            numFmts=(
+                '<numFmts count="%d">%s</numFmts>' % (len(num_fmts), "".join(num_fmts))
+                if num_fmts
+                else ""
+            ),
+            xf_count=len(xfs),
+            xfs="".join(xfs),
+        )
+
+
+class Format(object):
+    """The cell format returned by `Workbook.add_format()`, identified by its xf id."""
+
+    def __init__(self, xf_id):
+        super(Format, self).__init__()
+        self.xf_id = xf_id
+
+
+class Worksheet(object):
+    """The worksheet of a |Workbook|.
+
+    Values are written as XlsxWriter `Worksheet.write()` writes them, except that
+    a string is always written as a string, never as a formula or a number. |None| and
+    NaN values are written as blank cells.
+    """
+
+    def __init__(self):
+        super(Worksheet, self).__init__()
+        self._columns = []
+        self._widths = {}
+        self._shared_strings = []
+        self._string_ids = {}
+
+    def set_column(self, first_col, last_col, width):
+        """Set the width of the columns *first_col* to *last_col* to *width*."""
+        for col in range(first_col, last_col + 1):
+            self._widths[col] = width
+
+    def write(self, row, col, value, cell_format=None):
+        """Write *value* to the cell at zero-based *row* and *col*."""
+        self.write_column(row, col, (value,), cell_format)
+
+    def write_column(self, row, col, values, cell_format=None):
+        """Write the sequence *values* down *col*, starting at *row*.
+
+        A sequence in *values* is kept as-is until the workbook is closed, not copied.
+        """
+        if not hasattr(values, "__getitem__"):
+            values = list(values)
+        xf_id = 0 if cell_format is None else cell_format.xf_id
+        self._columns.append((row, col, values, xf_id))
+
+    @property
+    def shared_strings_xml(self):
+        """The XML of the shared strings part, of the strings written so far."""
+        strings = self._shared_strings
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'count="%d" uniqueCount="%d">%s</sst>'
+            % (
+                len(strings),
+                len(strings),
+                "".join('<si><t xml:space="preserve">%s</t></si>' % s for s in strings),
+            )
+        )
+
+    def xml_bytes(self):
+        """Return the XML of this worksheet as UTF-8 bytes.
+
+        The shared strings are collected as the cells are written, so this must be
+        called before `shared_strings_xml` is read.
+        """
+        xml = [_SHEET_HEAD_XML]
+        if self._widths:
+            xml.append("<cols>")
+            for col in sorted(self._widths):
+                xml.append(
+                    '<col min="%d" max="%d" width="%s" customWidth="1"/>'
+                    % (col + 1, col + 1, self._widths[col])
+                )
+            xml.append("</cols>")
+        xml.append("<sheetData>")
+        xml.extend(self._iter_row_xml())
+        xml.append("</sheetData></worksheet>")
+        return "".join(xml).encode("utf-8")
+
+    def _cell_xml(self, ref, value, xf_id):
+        """Return the `c` element XML for *value* in the cell at *ref*."""
+        s = ' s="%d"' % xf_id if xf_id else ""
+        if value is None or value != value:
+            return '<c r="%s"%s/>' % (ref, s) if xf_id else ""
+        if isinstance(value, bool):
+            return '<c r="%s"%s t="b"><v>%d</v></c>' % (ref, s, value)
+        # ---Excel has no infinity; like XlsxWriter, refuse it rather than write a
+        #    workbook Excel reports as damaged---
+        if isinstance(value, Number) and value in _INFINITIES:
+            raise ValueError("cannot write %r to cell %s" % (value, ref))
+        if isinstance(value, float):
+            return '<c r="%s"%s><v>%r</v></c>' % (ref, s, float(value))
+        if isinstance(value, Number):
+            return '<c r="%s"%s><v>%s</v></c>' % (ref, s, value)
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            return '<c r="%s"%s><v>%r</v></c>' % (ref, s, _excel_serial(value))
+        return '<c r="%s"%s t="s"><v>%d</v></c>' % (ref, s, self._string_id(value))
+
+    def _iter_row_xml(self):
+        """Generate the `row` element XML for each row having a cell.
+
+        Columns are swept by row; only those spanning the current row are looked at.
+        """
+        pending = sorted(self._columns, key=lambda c: (c[0], c[1]), reverse=True)
+        active = []
+        row = 0
+        while pending or active:
+            if not active:
+                row = max(row, pending[-1][0])
+            if pending and pending[-1][0] <= row:
+                while pending and pending[-1][0] <= row:
+                    start_row, col, values, xf_id = pending.pop()
+                    col_ref = _col_ref(col)
+                    s = ' s="%d"' % xf_id if xf_id else ""
+                    active.append((start_row, col, values, xf_id, col_ref, s))
+                active.sort(key=lambda c: c[1])
+            r = str(row + 1)
+            cells = []
+            for start_row, _, values, xf_id, col_ref, s in active:
+                # ---an empty column, like that of a series having no points, is
+                #    active for its first row but has no cell in it---
+                offset = row - start_row
+                if offset >= len(values):
+                    continue
+                value = values[offset]
+                # ---numbers are by far the most common cell value; NaN and
+                #    infinity, for which the difference is NaN, are left to
+                #    _cell_xml()---
+                if type(value) is float and value - value == 0.0:
+                    cells.append('<c r="%s%s"%s><v>%r</v></c>' % (col_ref, r, s, value))
+                else:
+                    cells.append(self._cell_xml(col_ref + r, value, xf_id))
+            cells_xml = "".join(cells)
+            if cells_xml:
+                yield '<row r="%s">%s</row>' % (r, cells_xml)
+            row += 1
+            if any(row - c[0] >= len(c[2]) for c in active):
+                active = [c for c in active if row - c[0] < len(c[2])]
+
+    def _string_id(self, value):
+        """Return the index of *value* in the shared strings, adding it if new."""
+        value = escape(to_unicode(value))
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self._shared_strings)
+            self._shared_strings.append(value)
+        return string_id
+
+
+def update_cells(xlsx_blob, cells, sheet_name="Sheet1"):
+    """Return *xlsx_blob* with the numbers in *cells* written to its *sheet_name*.
+
+    *cells* maps a cell reference like "B3" to its new number, or to |None| to clear
+    the cell. Only the worksheet part is rewritten; the other parts of the package are
+    copied as they are. Returns |None| when the cells can't be changed in place, because
+    the worksheet is not found or one of the cells holds a formula.
+    """
+    with zipfile.ZipFile(BytesIO(xlsx_blob)) as zip_file:
+        sheet_path = _sheet_path(zip_file, sheet_name)
+        if sheet_path is None:
+            return None
+        worksheet = etree.fromstring(zip_file.read(sheet_path))
+        sheetData = worksheet.find("x:sheetData", _NS)
+        if sheetData is None or not _update_sheet_data(sheetData, cells):
+            return None
+        stream = BytesIO()
+        with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as new_zip_file:
+            for info in zip_file.infolist():
+                if info.filename == sheet_path:
+                    blob = etree.tostring(
+                        worksheet,
+                        encoding="UTF-8",
+                        xml_declaration=True,
+                        standalone=True,
+                    )
+                else:
+                    blob = zip_file.read(info)
+                new_zip_file.writestr(info, blob)
+    return stream.getvalue()
+
+
+def _col_idx(col_ref):
+    """Return the zero-based index of column *col_ref*, like 27 for "AB"."""
+    col = 0
+    for letter in col_ref:
+        col = col * 26 + ord(letter) - ord("A") + 1
+    return col - 1
+
+
+def _col_ref(col):
+    """Return the letters of zero-based column *col*, like "A" or "AB"."""
+    col_ref = ""
+    col += 1
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        col_ref = chr(ord("A") + remainder) + col_ref
+    return col_ref
+
+
+def _excel_serial(value):
+    """Return the Excel 1900-epoch serial number of date or datetime *value*."""
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime(value.year, value.month, value.day)
+    delta = value - datetime.datetime(1899, 12, 31)
+    serial = delta.days + (delta.seconds + delta.microseconds / 1e6) / 86400
+    # ---Excel counts a nonexistent February 29, 1900---
+    if serial > 59:
+        serial += 1
+    return serial
+
+
+def _sheet_path(zip_file, sheet_name):
+    """Return the zip member name of worksheet *sheet_name* in *zip_file*, or |None|."""
+    workbook_path = "xl/workbook.xml"
+    rels_path = "xl/_rels/workbook.xml.rels"
+    names = zip_file.namelist()
+    if workbook_path not in names or rels_path not in names:
+        return None
+    workbook = etree.fromstring(zip_file.read(workbook_path))
+    rIds = workbook.xpath(
+        "x:sheets/x:sheet[@name=$name]/@r:id", namespaces=_NS, name=sheet_name
+    )
+    if not rIds:
+        return None
+    rels = etree.fromstring(zip_file.read(rels_path))
+    targets = rels.xpath(
+        "rel:Relationship[@Id=$rId]/@Target", namespaces=_NS, rId=rIds[0]
+    )
+    if not targets:
+        return None
+    target = targets[0]
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join("xl", target))
+
+
+def _split_cell_ref(cell_ref):
+    """Return the column letters and row number of *cell_ref*, like ("B", 3)."""
+    col_ref = cell_ref.rstrip("0123456789")
+    return col_ref, int(cell_ref[len(col_ref) :])
+
+
+def _update_sheet_data(sheetData, cells):
+    """Write the numbers in *cells* into the `sheetData` element *sheetData*.
+
+    Missing `row` and `c` elements are added in order. Returns False, possibly after
+    changing some cells, when a cell holds a formula or the rows and cells don't all
+    have their optional `r` attribute, so can't be written.
+    """
+    x = "{%s}" % _NS["x"]
+    if sheetData.xpath("x:row[not(@r)] | x:row/x:c[not(@r)]", namespaces=_NS):
+        return False
+    rows = dict((int(row.get("r")), row) for row in sheetData.iterchildren(x + "row"))
+    for cell_ref, value in sorted(cells.items()):
+        col_ref, row_idx = _split_cell_ref(cell_ref)
+        row = rows.get(row_idx)
+        if row is None:
+            row = rows[row_idx] = etree.Element(x + "row", r=str(row_idx))
+            following = [r for r in rows if r > row_idx]
+            if following:
+                rows[min(following)].addprevious(row)
+            else:
+                sheetData.append(row)
+        c = row.find("x:c[@r='%s']" % cell_ref, _NS)
+        if c is None:
+            c = etree.Element(x + "c", r=cell_ref)
+            col = _col_idx(col_ref)
+            for sibling in row.iterchildren(x + "c"):
+                if _col_idx(_split_cell_ref(sibling.get("r"))[0]) > col:
+                    sibling.addprevious(c)
+                    break
+            else:
+                row.append(c)
+            # ---spans is only a hint, and may no longer cover the row---
+            row.attrib.pop("spans", None)
+        if c.find("x:f", _NS) is not None:
+            return False
+        for child in list(c):
+            c.remove(child)
+        c.attrib.pop("t", None)
+        if value is not None:
+            etree.SubElement(c, x + "v").text = repr(float(value))
+    return True
@@ -6,11 +6,11 @@ Chart builder and related objects.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from array import array
 from contextlib import contextmanager
 
-from xlsxwriter import Workbook
-
 from ..compat import BytesIO
+from .spreadsheet import Workbook
 
 
 class _BaseWorkbookWriter(object):
@@ -41,7 +41,7 @@ class _BaseWorkbookWriter(object):
         stream object (such as a ``BytesIO`` instance) is expected as
         *xlsx_file*.
         """
-        workbook = Workbook(xlsx_file, {"in_memory": True})
+        workbook = self._Workbook(xlsx_file, {"in_memory": True})
         worksheet = workbook.add_worksheet()
         yield workbook, worksheet
         workbook.close()
@@ -53,6 +53,20 @@ class _BaseWorkbookWriter(object):
         """
         raise NotImplementedError("must be provided by each subclass")
 
+    @property
+    def _Workbook(self):
+        """
+        The workbook class of the backend chosen by the chart data object,
+        the built-in `.spreadsheet.Workbook` unless it chooses "xlsxwriter".
+        XlsxWriter is only imported when chosen, so it needn't be installed
+        otherwise.
+        """
+        if self._chart_data.xlsx_backend == "native":
+            return Workbook
+        from xlsxwriter import Workbook as XlsxWriterWorkbook
+
+        return XlsxWriterWorkbook
+
 
 class CategoryWorkbookWriter(_BaseWorkbookWriter):
     """
@@ -182,7 +196,7 @@ class CategoryWorkbookWriter(_BaseWorkbookWriter):
             num_format = workbook.add_format({"num_format": series.number_format})
             series_col = idx + col_offset
             worksheet.write(0, series_col, series.name)
-            worksheet.write_column(1, series_col, series.values, num_format)
+            worksheet.write_column(1, series_col, _cells(series.values), num_format)
 
 
 class XyWorkbookWriter(_BaseWorkbookWriter):
@@ -243,10 +257,14 @@ class XyWorkbookWriter(_BaseWorkbookWriter):
             )
             offset = self.series_table_row_offset(series)
             # write X values
-            worksheet.write_column(offset + 1, 0, series.x_values, chart_num_format)
+            worksheet.write_column(
+                offset + 1, 0, _cells(series.x_values), chart_num_format
+            )
             # write Y values
             worksheet.write(offset, 1, series.name)
-            worksheet.write_column(offset + 1, 1, series.y_values, series_num_format)
+            worksheet.write_column(
+                offset + 1, 1, _cells(series.y_values), series_num_format
+            )
 
 
 class BubbleWorkbookWriter(XyWorkbookWriter):
@@ -281,10 +299,27 @@ class BubbleWorkbookWriter(XyWorkbookWriter):
             )
             offset = self.series_table_row_offset(series)
             # write X values
-            worksheet.write_column(offset + 1, 0, series.x_values, chart_num_format)
+            worksheet.write_column(
+                offset + 1, 0, _cells(series.x_values), chart_num_format
+            )
             # write Y values
             worksheet.write(offset, 1, series.name)
-            worksheet.write_column(offset + 1, 1, series.y_values, series_num_format)
+            worksheet.write_column(
+                offset + 1, 1, _cells(series.y_values), series_num_format
+            )
             # write bubble sizes
             worksheet.write(offset, 2, "Size")
-            worksheet.write_column(offset + 1, 2, series.bubble_sizes, chart_num_format)
+            worksheet.write_column(
+                offset + 1, 2, _cells(series.bubble_sizes), chart_num_format
+            )
+
+
+def _cells(values):
+    """
+    Return *values* suitable for writing to a worksheet column. In an
+    `array('d')` column of columnar chart data, a blank is NaN, which is
+    written as an empty cell.
+    """
+    if not isinstance(values, array):
+        return values
+    return [None if value != value else value for value in values]
@@ -9,11 +9,16 @@ from __future__ import absolute_import, print_function, unicode_literals
 from copy import deepcopy
 from xml.sax.saxutils import escape
 
+from lxml import etree
+
 from ..compat import to_unicode
 from ..enum.chart import XL_CHART_TYPE
 from ..oxml import parse_xml
 from ..oxml.ns import nsdecls
 
+# ---a `c:pt` element, written compact as there can be many thousands---
+_PT_TMPL = '<c:pt idx="%d"><c:v>%s</c:v></c:pt>\n'
+
 
 def ChartXmlWriter(chart_type, chart_data):
     """
@@ -147,23 +152,16 @@ class _BaseSeriesXmlWriter(object):
         `c:ptCount` refers to the number of `c:pt` elements in this sequence.
         The `idx` attribute value for `c:pt` elements locates the data point
         in the overall data point sequence of the chart and is started at
-        *offset*.
-        """
-        xml = ('                <c:ptCount val="{pt_count}"/>\n').format(
-            pt_count=len(values)
+        *offset*. No `c:pt` element is written for a blank value, either
+        |None| or NaN.
+        """
+        xml = ['                <c:ptCount val="%d"/>\n' % len(values)]
+        xml.extend(
+            _PT_TMPL % (idx, value)
+            for idx, value in enumerate(values)
+            if value is not None and value == value
         )
-
-        pt_tmpl = (
-            '                <c:pt idx="{idx}">\n'
-            "                  <c:v>{value}</c:v>\n"
-            "                </c:pt>\n"
-        )
-        for idx, value in enumerate(values):
-            if value is None:
-                continue
-            xml += pt_tmpl.format(idx=idx, value=value)
-
-        return xml
+        return "".join(xml)
 
     @property
     def tx(self):
@@ -206,9 +204,7 @@ class _BaseSeriesXmlWriter(object):
             "              <c:f>{wksht_ref}</c:f>\n"
             "              <c:strCache>\n"
             '                <c:ptCount val="1"/>\n'
-            '                <c:pt idx="0">\n'
-            "                  <c:v>{series_name}</c:v>\n"
-            "                </c:pt>\n"
+            '<c:pt idx="0"><c:v>{series_name}</c:v></c:pt>\n'
             "              </c:strCache>\n"
             "            </c:strRef>\n"
             "          </c:tx>\n"
@@ -240,6 +236,45 @@ class _BaseSeriesXmlRewriter(object):
         for ser, series_data in zip(plotArea.sers, chart_data):
             self._rewrite_ser_data(ser, series_data, date_1904)
 
+    def update_series_values(self, chartSpace):
+        """
+        Update the series values under *chartSpace* in place from the chart
+        data, touching only the `c:pt` elements of data points whose value
+        changed. Return a dict mapping the worksheet cell of each changed
+        value, like "B3", to its new value, |None| for a blank.
+
+        Return |None| without changing *chartSpace* when the chart data
+        differs from the chart in more than its values, such as in the
+        number of series or data points, a series name, a number format or
+        the categories. The series data must then be replaced in full.
+        """
+        chart_data, date_1904 = self._chart_data, chartSpace.date_1904
+        sers = chartSpace.plotArea.sers
+        if len(sers) != len(chart_data):
+            return None
+        sources = []
+        for ser, series_data in zip(sers, chart_data):
+            if not self._labels_match(ser, series_data, date_1904):
+                return None
+            for source, ref, values in self._value_sources(ser, series_data):
+                if source is None or source.ref != ref:
+                    return None
+                if source.format_code != series_data.number_format:
+                    return None
+                if source.ptCount_val != len(values):
+                    return None
+                sources.append((source, ref, values))
+
+        cells = {}
+        for source, ref, values in sources:
+            col, top_row = _ref_origin(ref)
+            for idx in source.update_pt_values(values):
+                value = values[idx]
+                cells["%s%d" % (col, top_row + idx)] = (
+                    None if value is None or value != value else value
+                )
+        return cells
+
     def _add_cloned_sers(self, plotArea, count):
         """
         Add `c:ser` elements to the last xChart element in *plotArea*, cloned
@@ -272,6 +307,13 @@ class _BaseSeriesXmlRewriter(object):
         elif ser_count_diff < 0:
             self._trim_ser_count_by(plotArea, abs(ser_count_diff))
 
+    def _labels_match(self, ser, series_data, date_1904):
+        """
+        True if *ser* has the name of *series_data*. Overridden by rewriters
+        whose series also have categories.
+        """
+        return _xml_equal(ser.tx, _BaseSeriesXmlWriter(series_data).tx)
+
     def _rewrite_ser_data(self, ser, series_data, date_1904):
         """
         Rewrite selected child elements of *ser* based on the values in
@@ -279,6 +321,14 @@ class _BaseSeriesXmlRewriter(object):
         """
         raise NotImplementedError("must be implemented by each subclass")
 
+    def _value_sources(self, ser, series_data):
+        """
+        Return a `(source, ref, values)` tuple for each numeric data source
+        of *ser*, like its `c:val` element, pairing it with the worksheet
+        reference and values it has for *series_data*.
+        """
+        raise NotImplementedError("must be implemented by each subclass")
+
     def _trim_ser_count_by(self, plotArea, count):
         """
         Remove the last *count* ser elements from *plotArea*. Any xChart
@@ -434,27 +484,29 @@ class _AreaChartXmlWriter(_BaseChartXmlWriter):
 
     @property
     def _ser_xml(self):
-        xml = ""
+        xml = []
         for series in self._chart_data:
             xml_writer = _CategorySeriesXmlWriter(series)
-            xml += (
-                "        <c:ser>\n"
-                '          <c:idx val="{ser_idx}"/>\n'
-                '          <c:order val="{ser_order}"/>\n'
-                "{tx_xml}"
-                "{cat_xml}"
-                "{val_xml}"
-                "        </c:ser>\n"
-            ).format(
-                **{
-                    "ser_idx": series.index,
-                    "ser_order": series.index,
-                    "tx_xml": xml_writer.tx_xml,
-                    "cat_xml": xml_writer.cat_xml,
-                    "val_xml": xml_writer.val_xml,
-                }
+            xml.append(
+                (
+                    "        <c:ser>\n"
+                    '          <c:idx val="{ser_idx}"/>\n'
+                    '          <c:order val="{ser_order}"/>\n'
+                    "{tx_xml}"
+                    "{cat_xml}"
+                    "{val_xml}"
+                    "        </c:ser>\n"
+                ).format(
+                    **{
+                        "ser_idx": series.index,
+                        "ser_order": series.index,
+                        "tx_xml": xml_writer.tx_xml,
+                        "cat_xml": xml_writer.cat_xml,
+                        "val_xml": xml_writer.val_xml,
+                    }
+                )
             )
-        return xml
+        return "".join(xml)
 
 
 class _BarChartXmlWriter(_BaseChartXmlWriter):
@@ -619,27 +671,29 @@ class _BarChartXmlWriter(_BaseChartXmlWriter):
 
     @property
     def _ser_xml(self):
-        xml = ""
+        xml = []
         for series in self._chart_data:
             xml_writer = _CategorySeriesXmlWriter(series)
-            xml += (
-                "        <c:ser>\n"
-                '          <c:idx val="{ser_idx}"/>\n'
-                '          <c:order val="{ser_order}"/>\n'
-                "{tx_xml}"
-                "{cat_xml}"
-                "{val_xml}"
-                "        </c:ser>\n"
-            ).format(
-                **{
-                    "ser_idx": series.index,
-                    "ser_order": series.index,
-                    "tx_xml": xml_writer.tx_xml,
-                    "cat_xml": xml_writer.cat_xml,
-                    "val_xml": xml_writer.val_xml,
-                }
+            xml.append(
+                (
+                    "        <c:ser>\n"
+                    '          <c:idx val="{ser_idx}"/>\n'
+                    '          <c:order val="{ser_order}"/>\n'
+                    "{tx_xml}"
+                    "{cat_xml}"
+                    "{val_xml}"
+                    "        </c:ser>\n"
+                ).format(
+                    **{
+                        "ser_idx": series.index,
+                        "ser_order": series.index,
+                        "tx_xml": xml_writer.tx_xml,
+                        "cat_xml": xml_writer.cat_xml,
+                        "val_xml": xml_writer.val_xml,
+                    }
+                )
             )
-        return xml
+        return "".join(xml)
 
     @property
     def _val_ax_pos(self):
@@ -719,29 +773,31 @@ class _DoughnutChartXmlWriter(_BaseChartXmlWriter):
 
     @property
     def _ser_xml(self):
-        xml = ""
+        xml = []
         for series in self._chart_data:
             xml_writer = _CategorySeriesXmlWriter(series)
-            xml += (
-                "        <c:ser>\n"
-                '          <c:idx val="{ser_idx}"/>\n'
-                '          <c:order val="{ser_order}"/>\n'
-                "{tx_xml}"
-                "{explosion_xml}"
-                "{cat_xml}"
-                "{val_xml}"
-                "        </c:ser>\n"
-            ).format(
-                **{
-                    "ser_idx": series.index,
-                    "ser_order": series.index,
-                    "tx_xml": xml_writer.tx_xml,
-                    "explosion_xml": self._explosion_xml,
-                    "cat_xml": xml_writer.cat_xml,
-                    "val_xml": xml_writer.val_xml,
-                }
+            xml.append(
+                (
+                    "        <c:ser>\n"
+                    '          <c:idx val="{ser_idx}"/>\n'
+                    '          <c:order val="{ser_order}"/>\n'
+                    "{tx_xml}"
+                    "{explosion_xml}"
+                    "{cat_xml}"
+                    "{val_xml}"
+                    "        </c:ser>\n"
+                ).format(
+                    **{
+                        "ser_idx": series.index,
+                        "ser_order": series.index,
+                        "tx_xml": xml_writer.tx_xml,
+                        "explosion_xml": self._explosion_xml,
+                        "cat_xml": xml_writer.cat_xml,
+                        "val_xml": xml_writer.val_xml,
+                    }
+                )
             )
-        return xml
+        return "".join(xml)
 
 
 class _LineChartXmlWriter(_BaseChartXmlWriter):
@@ -887,30 +943,32 @@ class _LineChartXmlWriter(_BaseChartXmlWriter):
 
     @property
     def _ser_xml(self):
-        xml = ""
+        xml = []
         for series in self._chart_data:
             xml_writer = _CategorySeriesXmlWriter(series)
-            xml += (
-                "        <c:ser>\n"
-                '          <c:idx val="{ser_idx}"/>\n'
-                '          <c:order val="{ser_order}"/>\n'
-                "{tx_xml}"
-                "{marker_xml}"
-                "{cat_xml}"
-                "{val_xml}"
-                '          <c:smooth val="0"/>\n'
-                "        </c:ser>\n"
-            ).format(
-                **{
-                    "ser_idx": series.index,
-                    "ser_order": series.index,
-                    "tx_xml": xml_writer.tx_xml,
-                    "marker_xml": self._marker_xml,
-                    "cat_xml": xml_writer.cat_xml,
-                    "val_xml": xml_writer.val_xml,
-                }
+            xml.append(
+                (
+                    "        <c:ser>\n"
+                    '          <c:idx val="{ser_idx}"/>\n'
+                    '          <c:order val="{ser_order}"/>\n'
+                    "{tx_xml}"
+                    "{marker_xml}"
+                    "{cat_xml}"
+                    "{val_xml}"
+                    '          <c:smooth val="0"/>\n'
+                    "        </c:ser>\n"
+                ).format(
+                    **{
+                        "ser_idx": series.index,
+                        "ser_order": series.index,
+                        "tx_xml": xml_writer.tx_xml,
+                        "marker_xml": self._marker_xml,
+                        "cat_xml": xml_writer.cat_xml,
+                        "val_xml": xml_writer.val_xml,
+                    }
+                )
             )
-        return xml
+        return "".join(xml)
 
 
 class _PieChartXmlWriter(_BaseChartXmlWriter):
@@ -1083,30 +1141,32 @@ class _RadarChartXmlWriter(_BaseChartXmlWriter):
 
     @property
     def _ser_xml(self):
-        xml = ""
+        xml = []
         for series in self._chart_data:
             xml_writer = _CategorySeriesXmlWriter(series)
-            xml += (
-                "        <c:ser>\n"
-                '          <c:idx val="{ser_idx}"/>\n'
-                '          <c:order val="{ser_order}"/>\n'
-                "{tx_xml}"
-                "{marker_xml}"
-                "{cat_xml}"
-                "{val_xml}"
-                '          <c:smooth val="0"/>\n'
-                "        </c:ser>\n"
-            ).format(
-                **{
-                    "ser_idx": series.index,
-                    "ser_order": series.index,
-                    "tx_xml": xml_writer.tx_xml,
-                    "marker_xml": self._marker_xml,
-                    "cat_xml": xml_writer.cat_xml,
-                    "val_xml": xml_writer.val_xml,
-                }
+            xml.append(
+                (
+                    "        <c:ser>\n"
+                    '          <c:idx val="{ser_idx}"/>\n'
+                    '          <c:order val="{ser_order}"/>\n'
+                    "{tx_xml}"
+                    "{marker_xml}"
+                    "{cat_xml}"
+                    "{val_xml}"
+                    '          <c:smooth val="0"/>\n'
+                    "        </c:ser>\n"
+                ).format(
+                    **{
+                        "ser_idx": series.index,
+                        "ser_order": series.index,
+                        "tx_xml": xml_writer.tx_xml,
+                        "marker_xml": self._marker_xml,
+                        "cat_xml": xml_writer.cat_xml,
+                        "val_xml": xml_writer.val_xml,
+                    }
+                )
             )
-        return xml
+        return "".join(xml)
 
 
 class _XyChartXmlWriter(_BaseChartXmlWriter):
@@ -1212,32 +1272,34 @@ class _XyChartXmlWriter(_BaseChartXmlWriter):
 
     @property
     def _ser_xml(self):
-        xml = ""
+        xml = []
         for series in self._chart_data:
             xml_writer = _XySeriesXmlWriter(series)
-            xml += (
-                "        <c:ser>\n"
-                '          <c:idx val="{ser_idx}"/>\n'
-                '          <c:order val="{ser_order}"/>\n'
-                "{tx_xml}"
-                "{spPr_xml}"
-                "{marker_xml}"
-                "{xVal_xml}"
-                "{yVal_xml}"
-                '          <c:smooth val="0"/>\n'
-                "        </c:ser>\n"
-            ).format(
-                **{
-                    "ser_idx": series.index,
-                    "ser_order": series.index,
-                    "tx_xml": xml_writer.tx_xml,
-                    "spPr_xml": self._spPr_xml,
-                    "marker_xml": self._marker_xml,
-                    "xVal_xml": xml_writer.xVal_xml,
-                    "yVal_xml": xml_writer.yVal_xml,
-                }
+            xml.append(
+                (
+                    "        <c:ser>\n"
+                    '          <c:idx val="{ser_idx}"/>\n'
+                    '          <c:order val="{ser_order}"/>\n'
+                    "{tx_xml}"
+                    "{spPr_xml}"
+                    "{marker_xml}"
+                    "{xVal_xml}"
+                    "{yVal_xml}"
+                    '          <c:smooth val="0"/>\n'
+                    "        </c:ser>\n"
+                ).format(
+                    **{
+                        "ser_idx": series.index,
+                        "ser_order": series.index,
+                        "tx_xml": xml_writer.tx_xml,
+                        "spPr_xml": self._spPr_xml,
+                        "marker_xml": self._marker_xml,
+                        "xVal_xml": xml_writer.xVal_xml,
+                        "yVal_xml": xml_writer.yVal_xml,
+                    }
+                )
             )
-        return xml
+        return "".join(xml)
 
     @property
     def _spPr_xml(self):
@@ -1349,32 +1411,34 @@ class _BubbleChartXmlWriter(_XyChartXmlWriter):
 
     @property
     def _ser_xml(self):
-        xml = ""
+        xml = []
         for series in self._chart_data:
             xml_writer = _BubbleSeriesXmlWriter(series)
-            xml += (
-                "        <c:ser>\n"
-                '          <c:idx val="{ser_idx}"/>\n'
-                '          <c:order val="{ser_order}"/>\n'
-                "{tx_xml}"
-                '          <c:invertIfNegative val="0"/>\n'
-                "{xVal_xml}"
-                "{yVal_xml}"
-                "{bubbleSize_xml}"
-                '          <c:bubble3D val="{bubble3D_val}"/>\n'
-                "        </c:ser>\n"
-            ).format(
-                **{
-                    "ser_idx": series.index,
-                    "ser_order": series.index,
-                    "tx_xml": xml_writer.tx_xml,
-                    "xVal_xml": xml_writer.xVal_xml,
-                    "yVal_xml": xml_writer.yVal_xml,
-                    "bubbleSize_xml": xml_writer.bubbleSize_xml,
-                    "bubble3D_val": self._bubble3D_val,
-                }
+            xml.append(
+                (
+                    "        <c:ser>\n"
+                    '          <c:idx val="{ser_idx}"/>\n'
+                    '          <c:order val="{ser_order}"/>\n'
+                    "{tx_xml}"
+                    '          <c:invertIfNegative val="0"/>\n'
+                    "{xVal_xml}"
+                    "{yVal_xml}"
+                    "{bubbleSize_xml}"
+                    '          <c:bubble3D val="{bubble3D_val}"/>\n'
+                    "        </c:ser>\n"
+                ).format(
+                    **{
+                        "ser_idx": series.index,
+                        "ser_order": series.index,
+                        "tx_xml": xml_writer.tx_xml,
+                        "xVal_xml": xml_writer.xVal_xml,
+                        "yVal_xml": xml_writer.yVal_xml,
+                        "bubbleSize_xml": xml_writer.bubbleSize_xml,
+                        "bubble3D_val": self._bubble3D_val,
+                    }
+                )
             )
-        return xml
+        return "".join(xml)
 
 
 class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
@@ -1503,19 +1567,11 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
         The unicode XML snippet for the ``<c:pt>`` elements when category
         labels are numeric (including date type).
         """
-        xml = ""
-        for idx, category in enumerate(self._series.categories):
-            xml += (
-                '                <c:pt idx="{cat_idx}">\n'
-                "                  <c:v>{cat_lbl_str}</c:v>\n"
-                "                </c:pt>\n"
-            ).format(
-                **{
-                    "cat_idx": idx,
-                    "cat_lbl_str": category.numeric_str_val(self._date_1904),
-                }
-            )
-        return xml
+        date_1904 = self._date_1904
+        return "".join(
+            _PT_TMPL % (idx, category.numeric_str_val(date_1904))
+            for idx, category in enumerate(self._series.categories)
+        )
 
     @property
     def _cat_pt_xml(self):
@@ -1523,16 +1579,10 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
         The unicode XML snippet for the ``<c:pt>`` elements containing the
         category names for this series.
         """
-        xml = ""
-        for idx, category in enumerate(self._series.categories):
-            xml += (
-                '                <c:pt idx="{cat_idx}">\n'
-                "                  <c:v>{cat_label}</c:v>\n"
-                "                </c:pt>\n"
-            ).format(
-                **{"cat_idx": idx, "cat_label": escape(to_unicode(category.label))}
-            )
-        return xml
+        return "".join(
+            _PT_TMPL % (idx, escape(to_unicode(category.label)))
+            for idx, category in enumerate(self._series.categories)
+        )
 
     @property
     def _cat_tmpl(self):
@@ -1558,22 +1608,12 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
         multi-level category names.
         """
 
-        def lvl_pt_xml(level):
-            xml = ""
-            for idx, name in level:
-                xml += (
-                    '                  <c:pt idx="%d">\n'
-                    "                    <c:v>%s</c:v>\n"
-                    "                  </c:pt>\n"
-                ) % (idx, escape("%s" % name))
-            return xml
-
-        xml = ""
+        xml = []
         for level in categories.levels:
-            xml += (
-                "                <c:lvl>\n" "{lvl_pt_xml}" "                </c:lvl>\n"
-            ).format(**{"lvl_pt_xml": lvl_pt_xml(level)})
-        return xml
+            xml.append("                <c:lvl>\n")
+            xml.extend(_PT_TMPL % (idx, escape("%s" % name)) for idx, name in level)
+            xml.append("                </c:lvl>\n")
+        return "".join(xml)
 
     @property
     def _multiLvl_cat_tmpl(self):
@@ -1616,18 +1656,14 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
     def _val_pt_xml(self):
         """
         The unicode XML snippet containing the ``<c:pt>`` elements containing
-        the values for this series.
-        """
-        xml = ""
-        for idx, value in enumerate(self._series.values):
-            if value is None:
-                continue
-            xml += (
-                '                <c:pt idx="{val_idx:d}">\n'
-                "                  <c:v>{value}</c:v>\n"
-                "                </c:pt>\n"
-            ).format(**{"val_idx": idx, "value": value})
-        return xml
+        the values for this series. A blank value, either |None| or NaN, is
+        skipped.
+        """
+        return "".join(
+            _PT_TMPL % (idx, value)
+            for idx, value in enumerate(self._series.values)
+            if value is not None and value == value
+        )
 
     @property
     def _val_tmpl(self):
@@ -1819,12 +1855,27 @@ class _BubbleSeriesXmlRewriter(_BaseSeriesXmlRewriter):
         ser._insert_yVal(xml_writer.yVal)
         ser._insert_bubbleSize(xml_writer.bubbleSize)
 
+    def _value_sources(self, ser, series_data):
+        """
+        The X values, Y values and bubble sizes of *ser*, with those of
+        *series_data*.
+        """
+        return (
+            (ser.xVal, series_data.x_values_ref, series_data.x_values),
+            (ser.yVal, series_data.y_values_ref, series_data.y_values),
+            (ser.bubbleSize, series_data.bubble_sizes_ref, series_data.bubble_sizes),
+        )
+
 
 class _CategorySeriesXmlRewriter(_BaseSeriesXmlRewriter):
     """
     A series rewriter suitable for category charts.
     """
 
+    def __init__(self, chart_data):
+        super(_CategorySeriesXmlRewriter, self).__init__(chart_data)
+        self._cat_c14n = None
+
     def _rewrite_ser_data(self, ser, series_data, date_1904):
         """
         Rewrite the ``<c:tx>``, ``<c:cat>`` and ``<c:val>`` child elements
@@ -1840,6 +1891,24 @@ class _CategorySeriesXmlRewriter(_BaseSeriesXmlRewriter):
         ser._insert_cat(xml_writer.cat)
         ser._insert_val(xml_writer.val)
 
+    def _labels_match(self, ser, series_data, date_1904):
+        """
+        True if *ser* has the name and categories of *series_data*. The
+        categories of every series are the same, so are only written once.
+        """
+        xml_writer = _CategorySeriesXmlWriter(series_data, date_1904)
+        if not _xml_equal(ser.tx, xml_writer.tx) or ser.cat is None:
+            return False
+        if self._cat_c14n is None:
+            self._cat_c14n = _c14n(xml_writer.cat)
+        return _c14n(ser.cat) == self._cat_c14n
+
+    def _value_sources(self, ser, series_data):
+        """
+        The values of *ser*, with those of *series_data*.
+        """
+        return ((ser.val, series_data.values_ref, series_data.values),)
+
 
 class _XySeriesXmlRewriter(_BaseSeriesXmlRewriter):
     """
@@ -1860,3 +1929,39 @@ class _XySeriesXmlRewriter(_BaseSeriesXmlRewriter):
         ser._insert_tx(xml_writer.tx)
         ser._insert_xVal(xml_writer.xVal)
         ser._insert_yVal(xml_writer.yVal)
+
+    def _value_sources(self, ser, series_data):
+        """
+        The X and Y values of *ser*, with those of *series_data*.
+        """
+        return (
+            (ser.xVal, series_data.x_values_ref, series_data.x_values),
+            (ser.yVal, series_data.y_values_ref, series_data.y_values),
+        )
+
+
+def _ref_origin(ref):
+    """
+    Return the column letters and row number of the top-left cell of
+    worksheet range *ref*, like `("B", 2)` for "Sheet1!$B$2:$B$5".
+    """
+    cell = ref.split("!")[-1].split(":")[0].replace("$", "")
+    col = cell.rstrip("0123456789")
+    return col, int(cell[len(col) :])
+
+
+def _xml_equal(element, other):
+    """
+    True if oxml elements *element* and *other* have the same XML, or are
+    both |None|. Namespace declarations not used by either are ignored.
+    """
+    if element is None or other is None:
+        return element is other
+    return _c14n(element) == _c14n(other)
+
+
+def _c14n(element):
+    """
+    The exclusive canonical XML of *element*, as bytes.
+    """
+    return etree.tostring(element, method="c14n", exclusive=True)
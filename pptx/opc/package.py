@@ -13,7 +13,7 @@ from .constants import RELATIONSHIP_TYPE as RT
 from .oxml import CT_Relationships, serialize_part_xml
 from ..oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
-from .pkgreader import PackageReader
+from .pkgreader import PackageReader, SnapshotReader
 from .pkgwriter import PackageWriter
 
 
@@ -36,27 +36,41 @@ class OpcPackage(object):
         """
         pass
 
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Return an |OpcPackage| instance loaded from *snapshot*, bytes
+        produced by :meth:`snapshot`. Each call produces a new, independent
+        package. Raises |ValueError| if *snapshot* is not a package snapshot.
+        """
+        snapshot_reader = SnapshotReader.from_snapshot(snapshot)
+        package = cls()
+        Unmarshaller.unmarshal(snapshot_reader, package, PartFactory)
+        return package
+
     def iter_parts(self):
         """
         Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph.
         """
 
-        def walk_parts(source, visited=list()):
-            for rel in source.rels.values():
+        # ---an explicit stack of rel iterators rather than recursion keeps
+        # ---the cost of each step independent of the depth of the graph
+        visited = set()
+        rel_iters = [iter(self.rels.values())]
+        while rel_iters:
+            for rel in rel_iters[-1]:
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 yield part
-                new_source = part
-                for part in walk_parts(new_source, visited):
-                    yield part
-
-        for part in walk_parts(self):
-            yield part
+                rel_iters.append(iter(part.rels.values()))
+                break
+            else:
+                rel_iters.pop()
 
     def iter_rels(self):
         """
@@ -64,22 +78,21 @@ class OpcPackage(object):
         performing a depth-first traversal of the rels graph.
         """
 
-        def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
-            for rel in source.rels.values():
+        visited = set()
+        rel_iters = [iter(self.rels.values())]
+        while rel_iters:
+            for rel in rel_iters[-1]:
                 yield rel
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
-                new_source = part
-                for rel in walk_rels(new_source, visited):
-                    yield rel
-
-        for rel in walk_rels(self):
-            yield rel
+                visited.add(part)
+                rel_iters.append(iter(part.rels.values()))
+                break
+            else:
+                rel_iters.pop()
 
     def load_rel(self, reltype, target, rId, is_external=False):
         """
@@ -109,7 +122,7 @@ class OpcPackage(object):
         containing a single replacement item, a '%d' to be used to insert the
         integer portion of the partname. Example: '/ppt/slides/slide%d.xml'
         """
-        partnames = [part.partname for part in self.iter_parts()]
+        partnames = set(part.partname for part in self.iter_parts())
         for n in range(1, len(partnames) + 2):
             candidate_partname = tmpl % n
             if candidate_partname not in partnames:
@@ -143,6 +156,26 @@ class OpcPackage(object):
         """
         return [part for part in self.iter_parts()]
 
+    def parts_related_to(self, part, reltype):
+        """
+        Return list of parts in this package having a relationship of
+        *reltype* to *part*. Served from an index kept current as
+        relationships are added and removed, so no part graph traversal is
+        required. A part remains a source until its relationship is removed,
+        even if the part itself is no longer reachable from the package.
+        """
+        return self._rel_sources.sources(part, reltype)
+
+    def parts_related_by_type(self, reltype):
+        """
+        Return list of parts in this package that are the target of at least
+        one relationship of *reltype*, like all the notes slides for
+        `RT.NOTES_SLIDE`. Served from the same index as
+        :meth:`parts_related_to`, so a part remains a target until its last
+        such relationship is removed.
+        """
+        return self._rel_sources.targets(reltype)
+
     def relate_to(self, part, reltype):
         """
         Return rId key of relationship to *part*, from the existing
@@ -166,8 +199,35 @@ class OpcPackage(object):
         """
         for part in self.parts:
             part.before_marshal()
+        # ---parts are gathered again since before_marshal() can drop the
+        # ---relationships that made a part reachable
         PackageWriter.write(pkg_file, self.rels, self.parts)
 
+    def snapshot(self):
+        """
+        Return bytes capturing the current state of this package, from which
+        :meth:`from_snapshot` creates a copy of it.
+
+        A snapshot can be passed to other processes, or kept as a cache, and
+        loads much faster than the equivalent package file since there is no
+        zip archive to inflate, no content types to resolve and no parts to
+        locate by walking relationships. It holds only the partname, content
+        type, blob and relationships of each part, in a plain format that
+        loading cannot execute. It is meant to be loaded by the same version
+        of this library.
+        """
+        for part in self.parts:
+            part.before_marshal()
+        return PackageWriter.snapshot(self.rels, self.parts)
+
+    @lazyproperty
+    def _rel_sources(self):
+        """
+        |_RelationshipSourceIndex| object mapping each part in this package
+        to the parts having a relationship to it.
+        """
+        return _RelationshipSourceIndex()
+
 
 class Part(object):
     """
@@ -313,7 +373,7 @@ class Part(object):
         |RelationshipCollection| instance holding the relationships for this
         part.
         """
-        return RelationshipCollection(self._partname.baseURI)
+        return RelationshipCollection(self._partname.baseURI, self)
 
     def target_ref(self, rId):
         """
@@ -393,19 +453,58 @@ class RelationshipCollection(dict):
     Collection object for |_Relationship| instances, having list semantics.
     """
 
-    def __init__(self, baseURI):
+    def __init__(self, baseURI, source=None):
         super(RelationshipCollection, self).__init__()
         self._baseURI = baseURI
+        self._source = source
         self._target_parts_by_rId = {}
+        # ---rIds of the rels having each (reltype, is_external, target), so
+        # ---an existing relationship is found without a scan
+        self._rIds_by_target = {}
+        # ---every rId below 'rId{n}' is known to be in use---
+        self._rId_floor = 1
+
+    def __delitem__(self, rId):
+        """
+        Remove relationship identified by *rId*, e.g. ``del rels["rId3"]``,
+        updating the package index of relationship sources.
+        """
+        rel = self[rId]
+        super(RelationshipCollection, self).__delitem__(rId)
+        self._unindex(rId, rel)
+        n = _rId_number(rId)
+        if n is not None and n < self._rId_floor:
+            self._rId_floor = n
+        if rel.is_external:
+            return
+        self._target_parts_by_rId.pop(rId, None)
+        rel_sources = self._rel_sources
+        if rel_sources is not None:
+            rel_sources.remove(self._source, rel.target_part, rel.reltype)
+
+    def __setitem__(self, rId, rel):
+        """
+        Add *rel* with key *rId*, e.g. ``rels["rId3"] = rel``, indexing it by
+        target.
+        """
+        if rId in self:
+            self._unindex(rId, self[rId])
+        super(RelationshipCollection, self).__setitem__(rId, rel)
+        self._rIds_by_target.setdefault(_target_key(rel), []).append(rId)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
         Return a newly added |_Relationship| instance.
         """
+        if rId in self:
+            del self[rId]
         rel = _Relationship(rId, reltype, target, self._baseURI, is_external)
         self[rId] = rel
         if not is_external:
             self._target_parts_by_rId[rId] = target
+            rel_sources = self._rel_sources
+            if rel_sources is not None:
+                rel_sources.add(self._source, target, reltype)
         return rel
 
     def get_or_add(self, reltype, target_part):
@@ -464,20 +563,10 @@ class RelationshipCollection(dict):
         *is_external* from collection, or None if not found.
         """
 
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        rIds = self._rIds_by_target.get((reltype, is_external, target))
+        if not rIds:
+            return None
+        return self[rIds[0]]
 
     def _get_rel_of_type(self, reltype):
         """
@@ -494,16 +583,103 @@ class RelationshipCollection(dict):
             raise ValueError(tmpl % reltype)
         return matching[0]
 
+    @property
+    def _rel_sources(self):
+        """
+        |_RelationshipSourceIndex| of the package the source part of these
+        relationships belongs to, or |None| when there is no such package.
+        """
+        source = self._source
+        if source is None or source.package is None:
+            return None
+        return source.package._rel_sources
+
     @property
     def _next_rId(self):
         """
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        for n in range(1, len(self) + 2):
-            rId_candidate = "rId%d" % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        n = self._rId_floor
+        while "rId%d" % n in self:
+            n += 1
+        self._rId_floor = n
+        return "rId%d" % n  # like 'rId19'
+
+    def _unindex(self, rId, rel):
+        """Remove *rId* of *rel* from the index of rIds by target."""
+        key = _target_key(rel)
+        rIds = self._rIds_by_target.get(key)
+        if rIds is None or rId not in rIds:
+            return
+        rIds.remove(rId)
+        if not rIds:
+            del self._rIds_by_target[key]
+
+
+def _rId_number(rId):
+    """Return integer *n* of an rId like 'rId{n}', or |None| for other keys."""
+    prefix, digits = ("%s" % rId)[:3], ("%s" % rId)[3:]
+    if prefix != "rId" or not digits.isdigit():
+        return None
+    return int(digits)
+
+
+def _target_key(rel):
+    """Return (reltype, is_external, target) key identifying target of *rel*."""
+    if rel.is_external:
+        return (rel.reltype, True, rel.target_ref)
+    return (rel.reltype, False, rel.target_part)
+
+
+class _RelationshipSourceIndex(object):
+    """
+    Maps a (target part, reltype) pair to the parts having a relationship of
+    that type to that target, the reverse of the relationship graph.
+
+    A source can have more than one relationship of the same type to the same
+    target, so a reference count is kept for each source. :attr:`version`
+    changes each time a relationship is added or removed, so a cache derived
+    from the relationship graph can tell whether it is still current.
+    """
+
+    def __init__(self):
+        super(_RelationshipSourceIndex, self).__init__()
+        self._source_counts = {}
+        self._targets_by_reltype = {}
+        self.version = 0
+
+    def add(self, source, target, reltype):
+        """Record a relationship of *reltype* from *source* to *target*."""
+        self.version += 1
+        key = (target, reltype)
+        source_counts = self._source_counts.get(key)
+        if source_counts is None:
+            source_counts = self._source_counts[key] = {}
+            self._targets_by_reltype.setdefault(reltype, set()).add(target)
+        source_counts[source] = source_counts.get(source, 0) + 1
+
+    def remove(self, source, target, reltype):
+        """Forget one relationship of *reltype* from *source* to *target*."""
+        key = (target, reltype)
+        source_counts = self._source_counts.get(key)
+        if source_counts is None or source not in source_counts:
+            return
+        self.version += 1
+        source_counts[source] -= 1
+        if source_counts[source] < 1:
+            del source_counts[source]
+        if not source_counts:
+            del self._source_counts[key]
+            self._targets_by_reltype[reltype].discard(target)
+
+    def sources(self, target, reltype):
+        """Return list of parts having a relationship of *reltype* to *target*."""
+        return list(self._source_counts.get((target, reltype), ()))
+
+    def targets(self, reltype):
+        """Return list of parts that are the target of a *reltype* relationship."""
+        return list(self._targets_by_reltype.get(reltype, ()))
 
 
 class Unmarshaller(object):
@@ -7,11 +7,13 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+import struct
+
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
 from .phys_pkg import PhysPkgReader
-from .shared import CaseInsensitiveDict
+from .shared import SNAPSHOT_FORMAT, CaseInsensitiveDict
 
 
 class PackageReader(object):
@@ -108,6 +110,60 @@ class PackageReader(object):
                 yield (partname, blob, srels)
 
 
+class SnapshotReader(object):
+    """
+    Provides access to the contents of a package snapshot, as written by
+    :meth:`PackageWriter.snapshot`, through the same interface as
+    |PackageReader|.
+    """
+
+    def __init__(self, pkg_rels_data, parts_data):
+        super(SnapshotReader, self).__init__()
+        self._pkg_rels_data = pkg_rels_data
+        self._parts_data = parts_data
+
+    @staticmethod
+    def from_snapshot(snapshot):
+        """
+        Return a |SnapshotReader| instance loaded with the contents of
+        *snapshot* bytes. Raises |ValueError| if *snapshot* is not a package
+        snapshot, or is cut short or otherwise damaged. The format line is
+        checked before anything else is read, and the rest is only ever
+        decoded into strings and bytes, so a snapshot from an untrusted
+        source can do no more than fail to load.
+        """
+        header = SNAPSHOT_FORMAT.encode("ascii") + b"\n"
+        if not isinstance(snapshot, bytes) or not snapshot.startswith(header):
+            raise ValueError("not a python-pptx package snapshot")
+        decoder = _SnapshotDecoder(snapshot, len(header))
+        pkg_rels_data = decoder.rels_data()
+        parts_data = [
+            (decoder.text(), decoder.text(), decoder.field(), decoder.rels_data())
+            for _ in range(decoder.count())
+        ]
+        decoder.check_end()
+        return SnapshotReader(pkg_rels_data, parts_data)
+
+    def iter_sparts(self):
+        """
+        Generate a 3-tuple `(partname, content_type, blob)` for each of the
+        parts in the snapshot.
+        """
+        for partname, content_type, blob, _ in self._parts_data:
+            yield (PackURI(partname), content_type, blob)
+
+    def iter_srels(self):
+        """
+        Generate a 2-tuple `(source_uri, srel)` for each of the relationships
+        in the snapshot.
+        """
+        for rel_data in self._pkg_rels_data:
+            yield (PACKAGE_URI, _SnapshotRelationship(*rel_data))
+        for partname, _, _, rels_data in self._parts_data:
+            for rel_data in rels_data:
+                yield (partname, _SnapshotRelationship(*rel_data))
+
+
 class _ContentTypeMap(object):
     """
     Value type providing dictionary semantics for looking up content type by
@@ -264,6 +320,80 @@ class _SerializedRelationship(object):
         return self._target_partname
 
 
+class _SnapshotDecoder(object):
+    """
+    Reads the records of a package snapshot, as written by
+    :meth:`PackageWriter.snapshot`, from *snapshot* bytes starting at
+    *offset*. Raises |ValueError| on data that doesn't fit the layout.
+    """
+
+    _COUNT = struct.Struct(">I")
+
+    def __init__(self, snapshot, offset):
+        super(_SnapshotDecoder, self).__init__()
+        self._snapshot = snapshot
+        self._offset = offset
+
+    def check_end(self):
+        """Raise |ValueError| unless all of the snapshot has been read."""
+        if self._offset != len(self._snapshot):
+            raise ValueError("damaged python-pptx package snapshot")
+
+    def count(self):
+        """Return the count or length in the next four bytes."""
+        return self._COUNT.unpack(self._read(4))[0]
+
+    def field(self):
+        """Return the bytes of the next field."""
+        return self._read(self.count())
+
+    def rels_data(self):
+        """Return list of `(rId, reltype, target, is_external)` of next rels."""
+        return [
+            (self.text(), self.text(), self.text(), self.field() == b"1")
+            for _ in range(self.count())
+        ]
+
+    def text(self):
+        """Return the next field decoded as UTF-8 text."""
+        try:
+            return self.field().decode("utf-8")
+        except UnicodeDecodeError:
+            raise ValueError("damaged python-pptx package snapshot")
+
+    def _read(self, length):
+        """Return the next *length* bytes, raising when there are fewer left."""
+        start = self._offset
+        end = start + length
+        if end > len(self._snapshot):
+            raise ValueError("damaged python-pptx package snapshot")
+        self._offset = end
+        return self._snapshot[start:end]
+
+
+class _SnapshotRelationship(object):
+    """
+    Value object representing a relationship in a package snapshot, having
+    the interface of |_SerializedRelationship| used when unmarshalling.
+    *target* is the partname of the target part for an internal relationship
+    and its URI for an external one.
+    """
+
+    def __init__(self, rId, reltype, target, is_external):
+        super(_SnapshotRelationship, self).__init__()
+        self.rId = rId
+        self.reltype = reltype
+        self.target_ref = target
+        self.is_external = is_external
+
+    @property
+    def target_partname(self):
+        """
+        |PackURI| instance containing partname targeted by this relationship.
+        """
+        return PackURI(self.target_ref)
+
+
 class _SerializedRelationshipCollection(object):
     """
     Read-only sequence of |_SerializedRelationship| instances corresponding
@@ -7,11 +7,13 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+import struct
+
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
 from .phys_pkg import PhysPkgWriter
-from .shared import CaseInsensitiveDict
+from .shared import SNAPSHOT_FORMAT, CaseInsensitiveDict
 from .spec import default_content_types
 
 
@@ -36,6 +38,53 @@ class PackageWriter(object):
         PackageWriter._write_parts(phys_writer, parts)
         phys_writer.close()
 
+    @staticmethod
+    def snapshot(pkg_rels, parts):
+        """
+        Return bytes of a package snapshot containing *pkg_rels* and *parts*.
+        Each part is stored with its content type, blob and relationships,
+        the target part of a relationship referred to by its partname. The
+        snapshot is read by |SnapshotReader|.
+
+        A snapshot is the `SNAPSHOT_FORMAT` line followed by plain records,
+        each a 4-byte big-endian count or length, followed by that many bytes
+        in the case of a field: the package relationships, then the count of
+        parts and, for each, its partname, content type, blob and
+        relationships. A relationship is its rId, reltype, target and "1"
+        when external, else "0". Text fields are UTF-8.
+        """
+        chunks = [SNAPSHOT_FORMAT.encode("ascii") + b"\n"]
+
+        def add_count(count):
+            chunks.append(struct.pack(">I", count))
+
+        def add_field(value):
+            if not isinstance(value, bytes):
+                value = value.encode("utf-8")
+            add_count(len(value))
+            chunks.append(value)
+
+        def add_rels(rels):
+            rels = list(rels.values())
+            add_count(len(rels))
+            for rel in rels:
+                add_field(rel.rId)
+                add_field(rel.reltype)
+                add_field(
+                    rel.target_ref if rel.is_external else str(rel.target_part.partname)
+                )
+                add_field(b"1" if rel.is_external else b"0")
+
+        add_rels(pkg_rels)
+        parts = list(parts)
+        add_count(len(parts))
+        for part in parts:
+            add_field(str(part.partname))
+            add_field(part.content_type)
+            add_field(part.blob)
+            add_rels(part._rels)
+        return b"".join(chunks)
+
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
         """
@@ -6,6 +6,10 @@ Objects shared by modules in the pptx.opc sub-package
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+# ---identifies the data of a package snapshot and the version of its layout,
+#    the first line of a snapshot---
+SNAPSHOT_FORMAT = "python-pptx package snapshot 2"
+
 
 class CaseInsensitiveDict(dict):
     """
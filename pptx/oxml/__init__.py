@@ -157,7 +157,9 @@ from .chart.series import (  # noqa: E402
     CT_AxDataSource,
     CT_DPt,
     CT_Lvl,
+    CT_NumData,
     CT_NumDataSource,
+    CT_NumRef,
     CT_SeriesComposite,
     CT_StrVal_NumVal_Composite,
 )
@@ -166,6 +168,8 @@ register_element_cls("c:bubbleSize", CT_NumDataSource)
 register_element_cls("c:cat", CT_AxDataSource)
 register_element_cls("c:dPt", CT_DPt)
 register_element_cls("c:lvl", CT_Lvl)
+register_element_cls("c:numCache", CT_NumData)
+register_element_cls("c:numRef", CT_NumRef)
 register_element_cls("c:pt", CT_StrVal_NumVal_Composite)
 register_element_cls("c:ser", CT_SeriesComposite)
 register_element_cls("c:val", CT_NumDataSource)
@@ -406,6 +410,7 @@ from .slide import (  # noqa: E402
     CT_SlideLayoutIdList,
     CT_SlideLayoutIdListEntry,
     CT_SlideMaster,
+    CT_SlideMasterTextStyles,
     CT_SlideTiming,
     CT_TimeNodeList,
     CT_TLMediaNodeVideo,
@@ -423,6 +428,7 @@ register_element_cls("p:sldLayoutId", CT_SlideLayoutIdListEntry)
 register_element_cls("p:sldLayoutIdLst", CT_SlideLayoutIdList)
 register_element_cls("p:sldMaster", CT_SlideMaster)
 register_element_cls("p:timing", CT_SlideTiming)
+register_element_cls("p:txStyles", CT_SlideMasterTextStyles)
 register_element_cls("p:video", CT_TLMediaNodeVideo)
 
 
@@ -453,6 +459,7 @@ from .text import (  # noqa: E402
     CT_TextField,
     CT_TextFont,
     CT_TextLineBreak,
+    CT_TextListStyle,
     CT_TextNormalAutofit,
     CT_TextParagraph,
     CT_TextParagraphProperties,
@@ -463,11 +470,22 @@ from .text import (  # noqa: E402
 
 register_element_cls("a:bodyPr", CT_TextBodyProperties)
 register_element_cls("a:br", CT_TextLineBreak)
+register_element_cls("a:defPPr", CT_TextParagraphProperties)
 register_element_cls("a:defRPr", CT_TextCharacterProperties)
 register_element_cls("a:endParaRPr", CT_TextCharacterProperties)
 register_element_cls("a:fld", CT_TextField)
 register_element_cls("a:latin", CT_TextFont)
 register_element_cls("a:lnSpc", CT_TextSpacing)
+register_element_cls("a:lstStyle", CT_TextListStyle)
+register_element_cls("a:lvl1pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl2pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl3pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl4pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl5pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl6pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl7pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl8pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl9pPr", CT_TextParagraphProperties)
 register_element_cls("a:normAutofit", CT_TextNormalAutofit)
 register_element_cls("a:r", CT_RegularTextRun)
 register_element_cls("a:p", CT_TextParagraph)
@@ -480,6 +498,11 @@ register_element_cls("a:spcPct", CT_TextSpacingPercent)
 register_element_cls("a:spcPts", CT_TextSpacingPoint)
 register_element_cls("a:txBody", CT_TextBody)
 register_element_cls("c:txPr", CT_TextBody)
+register_element_cls("p:bodyStyle", CT_TextListStyle)
+register_element_cls("p:defaultTextStyle", CT_TextListStyle)
+register_element_cls("p:notesStyle", CT_TextListStyle)
+register_element_cls("p:otherStyle", CT_TextListStyle)
+register_element_cls("p:titleStyle", CT_TextListStyle)
 register_element_cls("p:txBody", CT_TextBody)
 
 
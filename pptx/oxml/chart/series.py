@@ -6,6 +6,9 @@ Series-related oxml objects.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
 from .datalabel import CT_DLbls
 from ..simpletypes import XsdUnsignedInt
 from ..xmlchemy import (
@@ -98,6 +101,24 @@ class CT_NumDataSource(BaseOxmlElement):
         results = self.xpath(".//c:ptCount/@val")
         return int(results[0]) if results else 0
 
+    @property
+    def format_code(self):
+        """
+        The text of `./c:numRef/c:numCache/c:formatCode`, or |None| if there
+        is no such element.
+        """
+        results = self.xpath("./c:numRef/c:numCache/c:formatCode/text()")
+        return results[0] if results else None
+
+    @property
+    def ref(self):
+        """
+        The worksheet reference in `./c:numRef/c:f`, like
+        "Sheet1!$B$2:$B$5", or |None| if it is not present.
+        """
+        results = self.xpath("./c:numRef/c:f/text()")
+        return results[0] if results else None
+
     def pt_v(self, idx):
         """
         Return the Y value for data point *idx* in this cache, or None if no
@@ -106,6 +127,87 @@ class CT_NumDataSource(BaseOxmlElement):
         results = self.xpath(".//c:pt[@idx=%d]" % idx)
         return results[0].value if results else None
 
+    def pt_values(self):
+        """
+        Return a tuple containing the float value of each data point in this
+        cache, in idx order, with None for a data point having no value. The
+        `c:pt` elements are read in a single pass.
+        """
+        values = [None] * self.ptCount_val
+        for pt in self.xpath(".//c:pt"):
+            idx = pt.idx
+            if idx < len(values):
+                values[idx] = pt.value
+        return tuple(values)
+
+    def update_pt_values(self, values):
+        """
+        Change the cached value of each data point to the one in *values* and
+        return a list of the idx of each point whose value changed. Only the
+        `c:pt` elements of changed points are touched; a point whose new
+        value is |None| or NaN has its `c:pt` element removed. `c:ptCount` is
+        left as it is, so *values* is expected to have that many items.
+        """
+        numCache = self.numRef.numCache
+        if numCache is None:
+            return []
+        # ---the current values are read in bulk, a `c:pt` only when changed---
+        pt_lst = numCache.pt_lst
+        idxs = [int(idx) for idx in numCache.xpath("./c:pt/@idx")]
+        texts = numCache.xpath("./c:pt/c:v/text()")
+        if len(texts) != len(pt_lst):
+            texts = [pt.v.text for pt in pt_lst]
+        pts = dict(zip(idxs, range(len(idxs))))
+        changed, added = [], False
+        for idx, value in enumerate(values):
+            i = pts.get(idx)
+            if value is None or value != value:
+                if i is not None:
+                    numCache.remove(pt_lst[i])
+                    changed.append(idx)
+                continue
+            if i is None:
+                pt = numCache._add_pt(idx=idx)
+                added = True
+            elif float(texts[i]) == value:
+                continue
+            else:
+                pt = pt_lst[i]
+            pt.v.text = "%s" % value
+            changed.append(idx)
+        # ---a new `c:pt` is added after the others, so is moved into place---
+        if added:
+            for pt in sorted(numCache.pt_lst, key=lambda pt: pt.idx):
+                numCache._insert_pt(pt)
+        return changed
+
+
+class CT_NumData(BaseOxmlElement):
+    """
+    `c:numCache` custom element class, the values of a numeric data reference
+    cached in the chart.
+    """
+
+    _tag_seq = ("c:formatCode", "c:ptCount", "c:pt", "c:extLst")
+    pt = ZeroOrMore("c:pt", successors=_tag_seq[3:])
+    del _tag_seq
+
+    def _new_pt(self):
+        """
+        Override the metaclass generated method to get a `c:pt` element
+        having its required `c:v` child.
+        """
+        return parse_xml('<c:pt %s idx="0"><c:v/></c:pt>' % nsdecls("c"))
+
+
+class CT_NumRef(BaseOxmlElement):
+    """
+    `c:numRef` custom element class, a reference to worksheet cells holding
+    numbers, along with their cached values.
+    """
+
+    numCache = ZeroOrOne("c:numCache", successors=("c:extLst",))
+
 
 class CT_SeriesComposite(BaseOxmlElement):
     """
@@ -6,8 +6,19 @@ Custom element classes for presentation-related XML elements.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from .simpletypes import ST_SlideId, ST_SlideSizeCoordinate, XsdString
-from .xmlchemy import BaseOxmlElement, RequiredAttribute, ZeroOrOne, ZeroOrMore
+from .simpletypes import (
+    ST_SlideId,
+    ST_SlideSizeCoordinate,
+    XsdString,
+    XsdUnsignedInt,
+)
+from .xmlchemy import (
+    BaseOxmlElement,
+    OptionalAttribute,
+    RequiredAttribute,
+    ZeroOrOne,
+    ZeroOrMore,
+)
 
 
 class CT_Presentation(BaseOxmlElement):
@@ -28,6 +39,9 @@ class CT_Presentation(BaseOxmlElement):
     )
     sldIdLst = ZeroOrOne("p:sldIdLst", successors=("p:sldSz", "p:notesSz"))
     sldSz = ZeroOrOne("p:sldSz", successors=("p:notesSz",))
+    defaultTextStyle = ZeroOrOne(
+        "p:defaultTextStyle", successors=("p:modifyVerifier", "p:extLst")
+    )
 
 
 class CT_SlideId(BaseOxmlElement):
@@ -55,6 +69,18 @@ class CT_SlideIdList(BaseOxmlElement):
         """
         return self._add_sldId(id=self._next_id, rId=rId)
 
+    def add_sldIds(self, rIds):
+        """
+        Return a list of newly appended <p:sldId> child elements, one for
+        each rId in *rIds*, having consecutive slide ids greater than any in
+        use.
+        """
+        next_id = self._next_id
+        return [
+            self._add_sldId(id=slide_id, rId=rId)
+            for slide_id, rId in enumerate(rIds, next_id)
+        ]
+
     @property
     def _next_id(self):
         """
@@ -75,6 +101,14 @@ class CT_SlideMasterIdList(BaseOxmlElement):
 
     sldMasterId = ZeroOrMore("p:sldMasterId")
 
+    def add_sldMasterId(self, id_, rId):
+        """
+        Return a reference to a newly appended <p:sldMasterId> child element
+        having *id_* and *rId*. Slide master and slide layout ids share the
+        same space, so choosing an unused *id_* is left to the caller.
+        """
+        return self._add_sldMasterId(id=id_, rId=rId)
+
 
 class CT_SlideMasterIdListEntry(BaseOxmlElement):
     """
@@ -82,6 +116,7 @@ class CT_SlideMasterIdListEntry(BaseOxmlElement):
     a reference to a slide master.
     """
 
+    id = OptionalAttribute("id", XsdUnsignedInt)
     rId = RequiredAttribute("r:id", XsdString)
 
 
@@ -121,6 +121,20 @@ class CT_GroupShape(BaseShapeElement):
         """Descendent `p:grpSpPr/a:xfrm/a:chOff` element."""
         return self.grpSpPr.get_or_add_xfrm().get_or_add_chOff()
 
+    def fit_extents(self):
+        """Set x, y, cx, and cy to just enclose the contained shapes.
+
+        Unlike :meth:`recalculate_extents`, the extents of any containing
+        group are not adjusted. This allows a caller to recalculate a set of
+        nested groups once each, innermost first.
+        """
+        x, y, cx, cy = self._child_extents
+
+        self.chOff.x = self.x = x
+        self.chOff.y = self.y = y
+        self.chExt.cx = self.cx = cx
+        self.chExt.cy = self.cy = cy
+
     def get_or_add_xfrm(self):
         """
         Return the ``<a:xfrm>`` grandchild element, newly-added if not
@@ -195,12 +209,7 @@ class CT_GroupShape(BaseShapeElement):
         if not self.tag == qn("p:grpSp"):
             return
 
-        x, y, cx, cy = self._child_extents
-
-        self.chOff.x = self.x = x
-        self.chOff.y = self.y = y
-        self.chExt.cx = self.cx = cx
-        self.chExt.cy = self.cy = cy
+        self.fit_extents()
         self.getparent().recalculate_extents()
 
     @property
@@ -7,7 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from pptx.oxml import parse_from_template, parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
-from pptx.oxml.simpletypes import XsdString
+from pptx.oxml.simpletypes import XsdString, XsdUnsignedInt
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement,
     Choice,
@@ -126,6 +126,7 @@ class CT_NotesMaster(_BaseSlideElement):
 
     _tag_seq = ("p:cSld", "p:clrMap", "p:hf", "p:notesStyle", "p:extLst")
     cSld = OneAndOnlyOne("p:cSld")
+    notesStyle = ZeroOrOne("p:notesStyle", successors=_tag_seq[4:])
     del _tag_seq
 
     @classmethod
@@ -276,6 +277,7 @@ class CT_SlideLayoutIdListEntry(BaseOxmlElement):
     a reference to a slide layout.
     """
 
+    id = OptionalAttribute("id", XsdUnsignedInt)
     rId = RequiredAttribute("r:id", XsdString)
 
 
@@ -296,6 +298,20 @@ class CT_SlideMaster(_BaseSlideElement):
     )
     cSld = OneAndOnlyOne("p:cSld")
     sldLayoutIdLst = ZeroOrOne("p:sldLayoutIdLst", successors=_tag_seq[3:])
+    txStyles = ZeroOrOne("p:txStyles", successors=_tag_seq[7:])
+    del _tag_seq
+
+
+class CT_SlideMasterTextStyles(BaseOxmlElement):
+    """
+    ``<p:txStyles>`` element, child of ``<p:sldMaster>`` defining the text
+    styles inherited by title, body, and other placeholders.
+    """
+
+    _tag_seq = ("p:titleStyle", "p:bodyStyle", "p:otherStyle", "p:extLst")
+    titleStyle = ZeroOrOne("p:titleStyle", successors=_tag_seq[1:])
+    bodyStyle = ZeroOrOne("p:bodyStyle", successors=_tag_seq[2:])
+    otherStyle = ZeroOrOne("p:otherStyle", successors=_tag_seq[3:])
     del _tag_seq
 
 
@@ -81,6 +81,7 @@ class CT_TextBody(BaseOxmlElement):
     """
 
     bodyPr = OneAndOnlyOne("a:bodyPr")
+    lstStyle = ZeroOrOne("a:lstStyle", successors=("a:p",))
     p = OneOrMore("a:p")
 
     def clear_content(self):
@@ -363,6 +364,52 @@ class CT_TextLineBreak(BaseOxmlElement):
         return "\v"
 
 
+class CT_TextListStyle(BaseOxmlElement):
+    """`a:lstStyle` custom element class.
+
+    Also used for `p:defaultTextStyle` in the presentation part, for the
+    `p:titleStyle`, `p:bodyStyle`, and `p:otherStyle` children of
+    `p:txStyles` in a slide master and for `p:notesStyle` in a notes master.
+    Each `a:lvlNpPr` child defines paragraph and default character properties
+    for paragraphs at outline level N-1.
+    """
+
+    _tag_seq = (
+        "a:defPPr",
+        "a:lvl1pPr",
+        "a:lvl2pPr",
+        "a:lvl3pPr",
+        "a:lvl4pPr",
+        "a:lvl5pPr",
+        "a:lvl6pPr",
+        "a:lvl7pPr",
+        "a:lvl8pPr",
+        "a:lvl9pPr",
+        "a:extLst",
+    )
+    defPPr = ZeroOrOne("a:defPPr", successors=_tag_seq[1:])
+    lvl1pPr = ZeroOrOne("a:lvl1pPr", successors=_tag_seq[2:])
+    lvl2pPr = ZeroOrOne("a:lvl2pPr", successors=_tag_seq[3:])
+    lvl3pPr = ZeroOrOne("a:lvl3pPr", successors=_tag_seq[4:])
+    lvl4pPr = ZeroOrOne("a:lvl4pPr", successors=_tag_seq[5:])
+    lvl5pPr = ZeroOrOne("a:lvl5pPr", successors=_tag_seq[6:])
+    lvl6pPr = ZeroOrOne("a:lvl6pPr", successors=_tag_seq[7:])
+    lvl7pPr = ZeroOrOne("a:lvl7pPr", successors=_tag_seq[8:])
+    lvl8pPr = ZeroOrOne("a:lvl8pPr", successors=_tag_seq[9:])
+    lvl9pPr = ZeroOrOne("a:lvl9pPr", successors=_tag_seq[10:])
+    del _tag_seq
+
+    def level_pPrs(self, lvl):
+        """Return paragraph-properties elements that apply at outline *lvl*.
+
+        *lvl* is zero-based, as in `a:pPr/@lvl`. The `a:lvlNpPr` element for
+        that level comes first, followed by `a:defPPr`, the default for all
+        levels. Either is omitted when not present.
+        """
+        lvlNpPr = getattr(self, "lvl%dpPr" % (lvl + 1))
+        return tuple(pPr for pPr in (lvlNpPr, self.defPPr) if pPr is not None)
+
+
 class CT_TextNormalAutofit(BaseOxmlElement):
     """
     <a:normAutofit> element specifying fit text to shape font reduction, etc.
@@ -24,6 +24,26 @@ class CT_OfficeStyleSheet(BaseOxmlElement):
     )
     del _tag_seq
 
+    @property
+    def font_typefaces(self):
+        """
+        Dict mapping each theme font reference, like ``'+mn-lt'`` for the
+        minor (body) Latin font, to the typeface name defined for it in the
+        font scheme of this theme. References without a defined typeface are
+        omitted.
+        """
+        typefaces = {}
+        scripts = (("lt", "a:latin"), ("ea", "a:ea"), ("cs", "a:cs"))
+        for prefix, font_tag in (("+mj-", "a:majorFont"), ("+mn-", "a:minorFont")):
+            for suffix, script_tag in scripts:
+                typeface_lst = self.xpath(
+                    "./a:themeElements/a:fontScheme/%s/%s/@typeface"
+                    % (font_tag, script_tag)
+                )
+                if typeface_lst and typeface_lst[0]:
+                    typefaces[prefix + suffix] = typeface_lst[0]
+        return typefaces
+
     @classmethod
     def new_default(cls):
         """
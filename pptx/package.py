@@ -7,12 +7,16 @@ encounters as an end-user of the PowerPoint user interface.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from .opc.constants import RELATIONSHIP_TYPE as RT
-from .opc.package import OpcPackage
+import hashlib
+import posixpath
+
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .opc.package import OpcPackage, PartFactory, XmlPart
 from .opc.packuri import PackURI
 from .parts.coreprops import CorePropertiesPart
 from .parts.image import Image, ImagePart
 from .parts.media import MediaPart
+from .text.style import TextStyleResolver
 from .util import lazyproperty
 
 
@@ -26,6 +30,75 @@ class Package(OpcPackage):
     loaded.
     """
 
+    # ---relationships that are only in use when their rId appears in the XML
+    # ---of their source part, like an image used by `p:blipFill/a:blip`. The
+    # ---notes and handout masters are left out because this library relates
+    # ---a notes master without adding it to `p:notesMasterIdLst`.---
+    _REFERENCED_RELTYPES = frozenset(
+        (
+            RT.AUDIO,
+            RT.CHART,
+            RT.CHART_USER_SHAPES,
+            RT.HYPERLINK,
+            RT.IMAGE,
+            RT.MEDIA,
+            RT.OLE_OBJECT,
+            RT.PACKAGE,
+            RT.SLIDE,
+            RT.SLIDE_LAYOUT,
+            RT.SLIDE_MASTER,
+            RT.TAGS,
+            RT.VIDEO,
+        )
+    )
+
+    # ---(content-type, reltype) pairs of the above used by the mere existence
+    # ---of the relationship, like that of a slide to its slide layout---
+    _IMPLICIT_RELS = frozenset(
+        (
+            (CT.PML_NOTES_SLIDE, RT.SLIDE),
+            (CT.PML_SLIDE, RT.SLIDE_LAYOUT),
+            (CT.PML_SLIDE_LAYOUT, RT.SLIDE_MASTER),
+        )
+    )
+
+    def compact(self):
+        """
+        Remove relationships no longer used by the XML of their source part.
+
+        Removing a picture, chart or hyperlink by deleting its XML element
+        leaves behind its relationship, which keeps the related image or
+        chart part in the package. This method removes each relationship
+        whose rId no longer appears in an `r:id`, `r:embed`, `r:link` or
+        other `r:` attribute of its source part. Relationships a part uses
+        without referring to them in its XML, like those of a slide to its
+        slide layout and notes slide, are kept. Slides no longer in the
+        slide sequence are dropped too, along with hyperlinks to them.
+
+        Parts no longer reachable by relationship are not written when the
+        package is saved.
+        """
+        self.presentation_part.drop_orphaned_slides()
+        referenced_reltypes, implicit_rels = (
+            self._REFERENCED_RELTYPES,
+            self._IMPLICIT_RELS,
+        )
+        for part in list(self.iter_parts()):
+            if not isinstance(part, XmlPart):
+                continue
+            content_type = part.content_type
+            referenced_rIds = None
+            for rId, rel in list(part.rels.items()):
+                reltype = rel.reltype
+                if reltype not in referenced_reltypes:
+                    continue
+                if (content_type, reltype) in implicit_rels:
+                    continue
+                if referenced_rIds is None:
+                    referenced_rIds = set(part._element.xpath("//@r:*"))
+                if rId not in referenced_rIds:
+                    del part.rels[rId]
+
     @lazyproperty
     def core_properties(self):
         """
@@ -106,6 +179,25 @@ class Package(OpcPackage):
         idx = first_available_media_idx()
         return PackURI("/ppt/media/media%d.%s" % (idx, ext))
 
+    def next_notes_slide_partnames(self, count=1):
+        """Return list of the *count* lowest available notes slide partnames.
+
+        The partnames in use are those of the parts related to a slide as its
+        notes slide, found in the relationship index rather than by walking
+        the package, so allocating a partname does not depend on the size of
+        the presentation.
+        """
+        used_partnames = set(
+            part.partname for part in self.parts_related_by_type(RT.NOTES_SLIDE)
+        )
+        partnames, idx = [], 0
+        while len(partnames) < count:
+            idx += 1
+            partname = "/ppt/notesSlides/notesSlide%d.xml" % idx
+            if partname not in used_partnames:
+                partnames.append(PackURI(partname))
+        return partnames
+
     @property
     def presentation_part(self):
         """
@@ -113,6 +205,16 @@ class Package(OpcPackage):
         """
         return self.main_document_part
 
+    @lazyproperty
+    def text_styles(self):
+        """|TextStyleResolver| object for this package.
+
+        Resolves the font and paragraph properties text inherits from
+        placeholders, masters and the presentation default text style,
+        caching inherited values so repeated lookups are cheap.
+        """
+        return TextStyleResolver(self)
+
     @lazyproperty
     def _image_parts(self):
         """
@@ -121,6 +223,14 @@ class Package(OpcPackage):
         """
         return _ImageParts(self)
 
+    @lazyproperty
+    def _import_index(self):
+        """
+        |_ImportIndex| object of the partnames and image and media parts in
+        use, kept between slide imports into this package.
+        """
+        return _ImportIndex(self)
+
     @lazyproperty
     def _media_parts(self):
         """Return |_MediaParts| object for this package.
@@ -131,6 +241,242 @@ class Package(OpcPackage):
         return _MediaParts(self)
 
 
+class PartImporter(object):
+    """Provides parts of *package* to use as targets of copied relationships.
+
+    Used when XML referencing related parts, like a picture or graphic frame,
+    is copied from one part to another, in the same package or from another
+    package. *part_map* optionally maps source parts to the parts of *package*
+    that are to stand in for them, like the slide layout of another
+    presentation to the slide layout of this one.
+
+    Image and media parts are shared within a package and are matched by
+    SHA1 hash across packages, so a given image is stored only once. Parts
+    owned by the referencing content, like a chart or an embedded workbook,
+    are copied along with the parts they relate to. References to a slide,
+    layout or master of another package cannot be resolved unless mapped in
+    *part_map*.
+
+    The partnames and the image and media parts in use are looked up in
+    *index*, an |_ImportIndex| object, brought up to date when first needed.
+    An importer given none makes its own, so is meant for a single copy
+    operation. One sharing the index kept by the package, like the one used
+    to import slides, avoids walking the package and hashing its images and
+    media again for each operation.
+    """
+
+    _SHARED_RELTYPES = frozenset((RT.AUDIO, RT.IMAGE, RT.MEDIA, RT.VIDEO))
+
+    _SLIDE_RELTYPES = frozenset(
+        (
+            RT.HANDOUT_MASTER,
+            RT.NOTES_MASTER,
+            RT.NOTES_SLIDE,
+            RT.SLIDE,
+            RT.SLIDE_LAYOUT,
+            RT.SLIDE_MASTER,
+            RT.THEME,
+        )
+    )
+
+    def __init__(self, package, part_map=None, index=None):
+        super(PartImporter, self).__init__()
+        self._package = package
+        self._part_map = {} if part_map is None else part_map
+        self._index = _ImportIndex(package) if index is None else index
+        self._index_is_checked = False
+
+    def import_part(self, part, reltype):
+        """Return part of this package to stand in for *part*, or |None|.
+
+        *reltype* is the type of the relationship being copied. The returned
+        part is *part* itself when it can be shared, an existing part having
+        the same content, or a newly-created copy. |None| is returned when
+        *part* is a slide-type part of another package not in *part_map*.
+        """
+        part_map = self._part_map
+        if part in part_map:
+            return part_map[part]
+
+        if part.package is self._package:
+            if reltype in self._SHARED_RELTYPES or reltype in self._SLIDE_RELTYPES:
+                return part
+        elif reltype in self._SLIDE_RELTYPES:
+            return None
+        elif reltype in self._SHARED_RELTYPES:
+            key = _ImportIndex.sha1_key(part, reltype)
+            shared_parts_by_sha1 = self._get_index().shared_parts_by_sha1
+            if key not in shared_parts_by_sha1:
+                shared_parts_by_sha1[key] = self.copy_part(part)
+            part_map[part] = shared_parts_by_sha1[key]
+            return part_map[part]
+
+        return self.copy_part(part)
+
+    def import_rel(self, source_part, rId, target_part):
+        """Return rId of relationship from *target_part* matching *rId* of source.
+
+        The relationship identified by *rId* in *source_part* is reproduced
+        in *target_part*, reusing a matching relationship when one exists.
+        Returns |None| when the related part cannot be imported.
+        """
+        rel = source_part.rels[rId]
+        if rel.is_external:
+            return target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+        related_part = self.import_part(rel.target_part, rel.reltype)
+        if related_part is None:
+            return None
+        return target_part.relate_to(related_part, rel.reltype)
+
+    def copy_part(self, part):
+        """Return new part in this package having the content of *part*.
+
+        A copy is made even when *part* could be shared, like the notes slide
+        of a slide being duplicated. The parts *part* is related to are
+        imported too, keeping the rIds of its relationships so its XML needs
+        no change.
+        """
+        return self.copy_parts([part])[0]
+
+    def copy_parts(self, parts):
+        """Return list containing a new copy of each of *parts*, in order.
+
+        Each copy is made before any relationship is imported, so that
+        relationships among *parts*, like those between a slide master and
+        its layouts, relate the copies to one another. A reference in the XML
+        of a copy to a part that cannot be imported is set to the empty
+        string.
+        """
+        parts = list(parts)
+        part_copies = []
+        for part in parts:
+            partname = self._next_partname(part.partname)
+            part_copy = PartFactory(
+                partname, part.content_type, part.blob, self._package
+            )
+            self._part_map[part] = part_copy
+            part_copies.append(part_copy)
+        for part, part_copy in zip(parts, part_copies):
+            self._import_rels(part, part_copy)
+        return part_copies
+
+    def _get_index(self):
+        """Return the |_ImportIndex| object of this importer.
+
+        The index is refreshed the first time it is needed only, since the
+        parts this importer copies are added to it as they are made.
+        """
+        index = self._index
+        if not self._index_is_checked:
+            index.refresh()
+            self._index_is_checked = True
+        return index
+
+    def _import_rels(self, part, part_copy):
+        """Reproduce relationships of *part* in *part_copy*, with the same rIds."""
+        unresolved_rIds = set()
+        for rel in part.rels.values():
+            if rel.is_external:
+                part_copy.load_rel(rel.reltype, rel.target_ref, rel.rId, True)
+                continue
+            related_part = self.import_part(rel.target_part, rel.reltype)
+            if related_part is None:
+                unresolved_rIds.add(rel.rId)
+                continue
+            part_copy.load_rel(rel.reltype, related_part, rel.rId)
+
+        element = getattr(part_copy, "_element", None)
+        if not unresolved_rIds or element is None:
+            return
+        for rId_attr in element.xpath("//@r:*"):
+            if rId_attr in unresolved_rIds:
+                rId_attr.getparent().set(rId_attr.attrname, "")
+
+    def _next_partname(self, partname):
+        """Return |PackURI| for a copy of the part named *partname*.
+
+        Partnames of the copies made so far are taken into account, since
+        those parts may not yet be reachable from the package.
+        """
+        index = self._get_index()
+        partnames, next_partname_idxs = index.partnames, index.next_partname_idxs
+        head, ext = posixpath.splitext(partname)
+        tmpl = head.rstrip("0123456789").replace("%", "%%") + "%d" + ext
+        # ---the search for a free name resumes where the last one ended---
+        n = next_partname_idxs.get(tmpl, 1)
+        while tmpl % n in partnames:
+            n += 1
+        next_partname_idxs[tmpl] = n + 1
+        new_partname = PackURI(tmpl % n)
+        partnames.add(new_partname)
+        return new_partname
+
+
+class _ImportIndex(object):
+    """Partnames and image and media parts in use in *package*, for importers.
+
+    Gathering these means walking the package and hashing each image and
+    media part, so merging presentations one after another would be
+    quadratic if each import did it again. An index is instead kept by the
+    package and shared by its slide imports, each adding the parts it
+    copies. It is rebuilt by :meth:`refresh` once a relationship has been
+    added or removed by other means since :meth:`mark_current` was last
+    called, like when a picture is added or a slide deleted, since the parts
+    in use may then have changed.
+
+    :attr:`layout_parts_by_key` is kept for the slide importer, which fills
+    it, and is cleared when the index is rebuilt.
+    """
+
+    def __init__(self, package):
+        super(_ImportIndex, self).__init__()
+        self._package = package
+        self._version = None
+        self.partnames = set()
+        self.next_partname_idxs = {}
+        self.shared_parts_by_sha1 = {}
+        self.layout_parts_by_key = None
+
+    def mark_current(self):
+        """Note the relationships of the package as all taken into account."""
+        self._version = self._package._rel_sources.version
+
+    def refresh(self):
+        """Rebuild this index if relationships changed since it was current."""
+        version = self._package._rel_sources.version
+        if self._version is not None and self._version == version:
+            return
+        partnames, shared_parts_by_sha1, seen = set(), {}, set()
+        for rel in self._package.iter_rels():
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            if part in seen:
+                continue
+            seen.add(part)
+            partnames.add(part.partname)
+            if rel.reltype in PartImporter._SHARED_RELTYPES:
+                key = self.sha1_key(part, rel.reltype)
+                shared_parts_by_sha1.setdefault(key, part)
+        self._version = version
+        self.partnames = partnames
+        self.next_partname_idxs = {}
+        self.shared_parts_by_sha1 = shared_parts_by_sha1
+        self.layout_parts_by_key = None
+
+    @staticmethod
+    def sha1_key(part, reltype):
+        """Return (is_image, sha1) key identifying blob of image or media *part*.
+
+        The SHA1 an |ImagePart| or |MediaPart| keeps is used, so a part is
+        hashed only once.
+        """
+        sha1 = getattr(part, "sha1", None)
+        if sha1 is None:
+            sha1 = hashlib.sha1(part.blob).hexdigest()
+        return (reltype == RT.IMAGE, sha1)
+
+
 class _ImageParts(object):
     """Provides access to the image parts in a package."""
 
@@ -142,7 +488,7 @@ class _ImageParts(object):
         """
         Generate a reference to each |ImagePart| object in the package.
         """
-        image_parts = []
+        image_parts = set()
         for rel in self._package.iter_rels():
             if rel.is_external:
                 continue
@@ -151,7 +497,7 @@ class _ImageParts(object):
             image_part = rel.target_part
             if image_part in image_parts:
                 continue
-            image_parts.append(image_part)
+            image_parts.add(image_part)
             yield image_part
 
     def get_or_add_image_part(self, image_file):
@@ -199,7 +545,7 @@ class _MediaParts(object):
         # A media part can appear in more than one relationship (and commonly
         # does in the case of video). Use media_parts to keep track of those
         # that have been "yielded"; they can be skipped if they occur again.
-        media_parts = []
+        media_parts = set()
         for rel in self._package.iter_rels():
             if rel.is_external:
                 continue
@@ -208,7 +554,7 @@ class _MediaParts(object):
             media_part = rel.target_part
             if media_part in media_parts:
                 continue
-            media_parts.append(media_part)
+            media_parts.add(media_part)
             yield media_part
 
     def get_or_add_media_part(self, media):
@@ -0,0 +1,113 @@
+# encoding: utf-8
+
+"""Build the slides of a single presentation in several worker processes."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import multiprocessing
+
+from .api import Presentation
+from .package import Package
+
+# ---template snapshot and build callable of a worker, set on its start---
+_worker_state = {}
+
+
+def build_presentation(template, build, jobs, processes=None, chunk_size=None):
+    """Return a |Presentation| object having the slides built for *jobs*.
+
+    *build* is called as `build(prs, job)` for each item in *jobs*, and adds
+    the slide or slides for *job* to *prs*, a presentation opened from
+    *template*. Jobs are divided into chunks that are built in worker
+    processes, each chunk in its own copy of the template. Presentations
+    pass between processes as package snapshots (see
+    :meth:`.OpcPackage.snapshot`), which load faster than a .pptx file. The slides built
+    for each chunk are then imported into a single presentation opened from
+    *template*, in the order of *jobs*, as by :meth:`.Slides.import_slides`.
+    So the new slides use the slide layouts of the template and an image
+    appearing on many slides is stored only once.
+
+    *template* is a path, a file-like object or a |Presentation| object, or
+    |None| for the default template. Slides already in the template are
+    kept, ahead of the new slides, and *build* can use them, for example to
+    duplicate one.
+
+    *build* and each job are passed to the worker processes, so must be
+    picklable; *build* is typically a function defined at module level.
+    *processes* is the number of worker processes, by default the number of
+    CPUs. When it is 1, the slides are built in this process, which is
+    handy for debugging. *chunk_size* is the number of jobs built into a
+    single presentation by a worker, by default chosen to give each process
+    about four chunks.
+    """
+    template_snapshot = _template_snapshot(template)
+    jobs = list(jobs)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(jobs) // (processes * 4)))
+    chunks = [jobs[i : i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+
+    prs = _open_snapshot(template_snapshot)
+    pool = None
+    try:
+        if processes == 1:
+            chunk_snapshots = (
+                _build_slides(template_snapshot, build, chunk) for chunk in chunks
+            )
+        else:
+            pool = multiprocessing.Pool(
+                processes, _init_worker, (template_snapshot, build)
+            )
+            chunk_snapshots = pool.imap(_build_chunk, chunks)
+        # ---each chunk is merged as it arrives, while later ones are built---
+        for chunk_snapshot in chunk_snapshots:
+            prs.slides.import_slides(_open_snapshot(chunk_snapshot))
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return prs
+
+
+def _build_chunk(jobs):
+    """Return snapshot of presentation having slides for *jobs*, in a worker."""
+    return _build_slides(_worker_state["template"], _worker_state["build"], jobs)
+
+
+def _build_slides(template_snapshot, build, jobs):
+    """Return snapshot of presentation having only the slides for *jobs*.
+
+    The template slides are deleted once the new slides are built, so they
+    are not imported along with them.
+    """
+    prs = _open_snapshot(template_snapshot)
+    slides = prs.slides
+    template_slides = list(slides)
+    for job in jobs:
+        build(prs, job)
+    for slide in template_slides:
+        try:
+            slides.delete(slide)
+        except ValueError:  # ---already deleted by build---
+            pass
+    return prs.part.package.snapshot()
+
+
+def _init_worker(template_snapshot, build):
+    """Store *template_snapshot* and *build* for the chunks of this worker."""
+    _worker_state["template"] = template_snapshot
+    _worker_state["build"] = build
+
+
+def _open_snapshot(snapshot):
+    """Return |Presentation| object loaded from package *snapshot*."""
+    return Package.from_snapshot(snapshot).presentation_part.presentation
+
+
+def _template_snapshot(template):
+    """Return package snapshot of *template*, the default template on |None|."""
+    if not hasattr(template, "save"):
+        template = Presentation(template)
+    return template.part.package.snapshot()
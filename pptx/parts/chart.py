@@ -6,10 +6,14 @@ Chart part objects, including Chart and Charts
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import copy
+
 from ..chart.chart import Chart
+from ..chart.spreadsheet import update_cells
 from .embeddedpackage import EmbeddedXlsxPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
+from ..package import PartImporter
 from ..util import lazyproperty
 
 
@@ -22,17 +26,52 @@ class ChartPart(XmlPart):
     partname_template = "/ppt/charts/chart%d.xml"
 
     @classmethod
-    def new(cls, chart_type, chart_data, package):
+    def new(cls, chart_type, chart_data, package, embed_workbook=True):
         """
         Return a new |ChartPart| instance added to *package* containing
-        a chart of *chart_type* and depicting *chart_data*.
+        a chart of *chart_type* and depicting *chart_data*. *embed_workbook*
+        chooses whether and when its Excel workbook is written, as described
+        for :meth:`ChartWorkbook.update_from_chart_data`.
         """
         chart_blob = chart_data.xml_bytes(chart_type)
         partname = package.next_partname(cls.partname_template)
         content_type = CT.DML_CHART
         chart_part = cls.load(partname, content_type, chart_blob, package)
-        xlsx_blob = chart_data.xlsx_blob
-        chart_part.chart_workbook.update_from_xlsx_blob(xlsx_blob)
+        chart_part.chart_workbook.update_from_chart_data(chart_data, embed_workbook)
+        return chart_part
+
+    @classmethod
+    def new_from(cls, template_chart, chart_data, package, embed_workbook=True):
+        """
+        Return a new |ChartPart| instance added to *package*, a copy of the
+        chart part of |Chart| object *template_chart* depicting *chart_data*
+        instead. The copy keeps all the formatting of the template, which
+        can be in another presentation. Its series are rewritten from
+        *chart_data* as by :meth:`Chart.replace_data`, the last series of
+        the template lending its formatting to any added series. Parts the
+        template is related to, like an image used as a fill, are imported
+        as for a copied slide, except for its Excel workbook, which is
+        written from *chart_data* as chosen by *embed_workbook*.
+        """
+        template_part = template_chart.part
+        chartSpace = copy.deepcopy(template_part._element)
+        xlsx_part_rId = chartSpace.xlsx_part_rId
+        chartSpace._remove_externalData()
+        partname = package.next_partname(cls.partname_template)
+        chart_part = cls(partname, CT.DML_CHART, chartSpace, package)
+
+        importer = PartImporter(package)
+        for rel in template_part.rels.values():
+            if rel.rId == xlsx_part_rId:
+                continue
+            if rel.is_external:
+                chart_part.load_rel(rel.reltype, rel.target_ref, rel.rId, True)
+                continue
+            related_part = importer.import_part(rel.target_part, rel.reltype)
+            if related_part is not None:
+                chart_part.load_rel(rel.reltype, related_part, rel.rId)
+
+        chart_part.chart.replace_data(chart_data, embed_workbook)
         return chart_part
 
     @lazyproperty
@@ -62,6 +101,51 @@ class ChartWorkbook(object):
         self._chartSpace = chartSpace
         self._chart_part = chart_part
 
+    def update_cells(self, cells):
+        """
+        Write the numbers in *cells*, a dict like `{"B3": 4.2}`, to the
+        embedded Excel workbook in place, leaving the rest of it unchanged.
+        Return |False| when there is no workbook or it can't be changed in
+        place, for example because one of the cells holds a formula.
+        """
+        xlsx_part = self.xlsx_part
+        if xlsx_part is None:
+            return False
+        if not cells:
+            return True
+        xlsx_blob = update_cells(xlsx_part.blob, cells)
+        if xlsx_blob is None:
+            return False
+        xlsx_part.blob = xlsx_blob
+        return True
+
+    def update_from_chart_data(self, chart_data, embed_workbook=True):
+        """
+        Replace the embedded Excel workbook with one containing *chart_data*.
+
+        When *embed_workbook* is |True| the workbook is written right away.
+        When it is `"lazy"`, the workbook is only written when the
+        presentation is saved, or the blob of the |EmbeddedXlsxPart| is
+        otherwise read, so *chart_data* must not be changed until then. When
+        it is |False|, no workbook is embedded and any existing one is
+        removed; the chart still shows the values cached in its XML, but
+        cannot have its data edited in PowerPoint.
+        """
+        if embed_workbook is True:
+            self.update_from_xlsx_blob(chart_data.xlsx_blob)
+        elif embed_workbook == "lazy":
+            xlsx_part = self.xlsx_part
+            # ---a workbook loaded from a file is a plain |Part|---
+            if not isinstance(xlsx_part, EmbeddedXlsxPart):
+                self._remove_xlsx_part()
+                xlsx_part = EmbeddedXlsxPart.new(None, self._package)
+                self.xlsx_part = xlsx_part
+            xlsx_part.defer_blob(chart_data)
+        elif embed_workbook is False:
+            self._remove_xlsx_part()
+        else:
+            raise ValueError("embed_workbook must be True, False or 'lazy'")
+
     def update_from_xlsx_blob(self, xlsx_blob):
         """
         Replace the Excel spreadsheet in the related |EmbeddedXlsxPart| with
@@ -99,3 +183,14 @@ class ChartWorkbook(object):
     @property
     def _package(self):
         return self._chart_part.package
+
+    def _remove_xlsx_part(self):
+        """
+        Remove the `c:externalData` element and the relationship to the
+        embedded workbook it refers to, if there is one.
+        """
+        xlsx_part_rId = self._chartSpace.xlsx_part_rId
+        if xlsx_part_rId is None:
+            return
+        self._chartSpace._remove_externalData()
+        self._chart_part.drop_rel(xlsx_part_rId)
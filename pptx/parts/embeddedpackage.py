@@ -27,6 +27,34 @@ class EmbeddedXlsxPart(EmbeddedPackagePart):
 
     partname_template = "/ppt/embeddings/Microsoft_Excel_Sheet%d.xlsx"
 
+    def __init__(self, partname, content_type, blob=None, package=None):
+        super(EmbeddedXlsxPart, self).__init__(partname, content_type, blob, package)
+        self._chart_data = None
+
+    @property
+    def blob(self):
+        """
+        The Excel workbook in this part, as bytes. A workbook deferred to
+        a chart data object with :meth:`defer_blob` is written on first
+        access.
+        """
+        chart_data = self._chart_data
+        if chart_data is not None:
+            self._blob, self._chart_data = chart_data.xlsx_blob, None
+        return self._blob
+
+    @blob.setter
+    def blob(self, xlsx_blob):
+        self._blob, self._chart_data = xlsx_blob, None
+
+    def defer_blob(self, chart_data):
+        """
+        Replace the workbook in this part with the one for *chart_data*,
+        written only when the blob of this part is next read, typically
+        when the presentation is saved.
+        """
+        self._blob, self._chart_data = None, chart_data
+
     @classmethod
     def new(cls, xlsx_blob, package):
         """
@@ -6,11 +6,17 @@ Presentation part, the main part in a .pptx package.
 
 from __future__ import absolute_import
 
+import copy
+import hashlib
+
 from ..opc.constants import RELATIONSHIP_TYPE as RT
+from ..opc.oxml import serialize_part_xml
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
+from ..oxml.ns import qn
+from ..package import PartImporter, _ImportIndex
 from ..presentation import Presentation
-from .slide import NotesMasterPart, SlidePart
+from .slide import NotesMasterPart, NotesSlidePart, SlidePart
 from ..util import lazyproperty
 
 
@@ -20,6 +26,25 @@ class PresentationPart(XmlPart):
     directory of a .pptx file.
     """
 
+    def add_notes_slides(self, slide_parts):
+        """
+        Add a notes slide to each of *slide_parts* not already having one.
+        Partnames for all the new notes slides are allocated at once. Raises
+        |ValueError| if a slide part is not a slide of this presentation.
+        """
+        notes_less_parts, seen = [], set()
+        for slide_part in slide_parts:
+            self._sldId_for(slide_part)
+            if slide_part in seen or slide_part.has_notes_slide:
+                continue
+            seen.add(slide_part)
+            notes_less_parts.append(slide_part)
+        package = self.package
+        partnames = package.next_notes_slide_partnames(len(notes_less_parts))
+        for slide_part, partname in zip(notes_less_parts, partnames):
+            notes_slide_part = NotesSlidePart.new(package, slide_part, partname)
+            slide_part.relate_to(notes_slide_part, RT.NOTES_SLIDE)
+
     def add_slide(self, slide_layout):
         """
         Return an (rId, slide) pair of a newly created blank slide that
@@ -31,6 +56,18 @@ class PresentationPart(XmlPart):
         rId = self.relate_to(slide_part, RT.SLIDE)
         return rId, slide_part.slide
 
+    def before_marshal(self):
+        """
+        Drop references to slides deleted since the last save and rename the
+        slide parts to match their position in the slide sequence. This work
+        is deferred to save time so deleting or moving a slide does not
+        depend on the number of slides.
+        """
+        self._drop_rels_to_dropped_slides()
+        sldIdLst = self._element.sldIdLst
+        if sldIdLst is not None:
+            self.rename_slide_parts([sldId.rId for sldId in sldIdLst])
+
     @property
     def core_properties(self):
         """
@@ -39,15 +76,86 @@ class PresentationPart(XmlPart):
         """
         return self.package.core_properties
 
+    def delete_slide(self, slide_part):
+        """
+        Remove *slide_part* from the slide sequence of this presentation.
+
+        The slide is removed from any custom show or section it appears in.
+        Hyperlinks to it from other slides are removed when the presentation
+        is saved, after which the slide and any parts only it refers to, such
+        as its notes slide, are no longer part of the package. Raises
+        |ValueError| if *slide_part* is not a slide of this presentation.
+        """
+        sldId = self._sldId_for(slide_part)
+        rId, slide_id = sldId.rId, sldId.id
+        sldId.getparent().remove(sldId)
+        self._slide_id_index.discard(slide_part)
+        for sld in self._element.xpath(
+            "./p:custShowLst/p:custShow/p:sldLst/p:sld[@r:id='%s']" % rId
+        ):
+            sld.getparent().remove(sld)
+        for section_sldId in self._element.xpath(
+            "./p:extLst/p:ext/*/*/*/*[local-name()='sldId'][@id='%d']" % slide_id
+        ):
+            section_sldId.getparent().remove(section_sldId)
+        del self.rels[rId]
+        self._dropped_slide_parts.append(slide_part)
+
+    def drop_orphaned_slides(self):
+        """
+        Remove the relationships to slides not in the slide sequence of this
+        presentation, along with hyperlinks to those slides from other
+        slides. Such a slide is never shown but is still saved when related,
+        like one whose `p:sldId` element was removed directly.
+        """
+        sldIdLst = self._element.sldIdLst
+        listed_rIds = set() if sldIdLst is None else set(s.rId for s in sldIdLst)
+        for rId, rel in list(self.rels.items()):
+            if rel.reltype != RT.SLIDE or rel.is_external or rId in listed_rIds:
+                continue
+            for sld in self._element.xpath(
+                "./p:custShowLst/p:custShow/p:sldLst/p:sld[@r:id='%s']" % rId
+            ):
+                sld.getparent().remove(sld)
+            self._dropped_slide_parts.append(rel.target_part)
+            del self.rels[rId]
+        self._drop_rels_to_dropped_slides()
+
+    def duplicate_slide(self, slide_part):
+        """
+        Return an (rId, slide) pair for a new slide having the content of
+        *slide_part*, related to this presentation but not yet in its slide
+        sequence.
+        """
+        slide_copy = slide_part.duplicate(self._next_slide_partname)
+        rId = self.relate_to(slide_copy, RT.SLIDE)
+        return rId, slide_copy.slide
+
     def get_slide(self, slide_id):
         """
         Return the |Slide| object identified by *slide_id* (in this
         presentation), or |None| if not found.
         """
-        for sldId in self._element.sldIdLst:
-            if sldId.id == slide_id:
-                return self.related_parts[sldId.rId].slide
-        return None
+        slide_part = self._slide_id_index.part_for_id(slide_id)
+        if slide_part is None:
+            return None
+        return slide_part.slide
+
+    def import_slides(self, slide_parts):
+        """
+        Return a list of (rId, slide) pairs, one for a new copy of each of
+        *slide_parts*, related to this presentation but not yet in its slide
+        sequence. The slide parts are typically those of another
+        presentation.
+
+        Each copy uses the slide layout of this presentation equivalent to
+        the layout of its source slide. When there is none, the slide master
+        of that layout is copied along with its layouts and theme, once for
+        any number of slides. Images and media identical to ones already in
+        this presentation are shared. Notes slides are copied too, based on
+        the notes master of this presentation.
+        """
+        return _SlideImporter(self).import_slides(slide_parts)
 
     @lazyproperty
     def notes_master(self):
@@ -82,6 +190,20 @@ class PresentationPart(XmlPart):
         """
         return Presentation(self._element, self)
 
+    def move_slide(self, slide_part, new_idx):
+        """
+        Move *slide_part* to zero-based position *new_idx* in the slide
+        sequence of this presentation. Raises |IndexError| if *new_idx* is
+        out of range and |ValueError| if *slide_part* is not a slide of this
+        presentation.
+        """
+        sldId = self._sldId_for(slide_part)
+        sldIdLst = sldId.getparent()
+        if not 0 <= new_idx < len(sldIdLst):
+            raise IndexError("slide index out of range")
+        sldIdLst.remove(sldId)
+        sldIdLst.insert(new_idx, sldId)
+
     def related_slide(self, rId):
         """
         Return the |Slide| object for the related |SlidePart| corresponding
@@ -108,6 +230,19 @@ class PresentationPart(XmlPart):
             slide_part = self.related_parts[rId]
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
+    def reorder_slides(self, slide_parts):
+        """
+        Arrange the slides of this presentation in the order of
+        *slide_parts*, which must contain each slide part of this
+        presentation exactly once. Raises |ValueError| otherwise.
+        """
+        sldIds = [self._sldId_for(slide_part) for slide_part in slide_parts]
+        sldIdLst = self._element.get_or_add_sldIdLst()
+        if len(set(sldIds)) != len(sldIds) or len(sldIds) != len(sldIdLst):
+            raise ValueError("order must contain each slide exactly once")
+        for sldId in sldIds:
+            sldIdLst.append(sldId)
+
     def save(self, path_or_stream):
         """
         Save this presentation package to *path_or_stream*, which can be
@@ -121,10 +256,61 @@ class PresentationPart(XmlPart):
         Return the slide identifier associated with *slide_part* in this
         presentation.
         """
-        for sldId in self._element.sldIdLst:
-            if self.related_parts[sldId.rId] is slide_part:
-                return sldId.id
-        raise ValueError("matching slide_part not found")
+        slide_id = self._slide_id_index.id_for_part(slide_part)
+        if slide_id is None:
+            raise ValueError("matching slide_part not found")
+        return slide_id
+
+    def slide_idx(self, slide_part):
+        """
+        Return the zero-based position of *slide_part* in the slide sequence
+        of this presentation. Raises |ValueError| if *slide_part* is not
+        a slide of this presentation.
+        """
+        slide_idx = self._slide_id_index.idx_for_part(slide_part)
+        if slide_idx is None:
+            raise ValueError("matching slide_part not found")
+        return slide_idx
+
+    def _drop_rels_to_dropped_slides(self):
+        """
+        Remove the relationships to the slides deleted since the last save
+        from the parts having one.
+        """
+        dropped_slide_parts = self._dropped_slide_parts
+        for slide_part in dropped_slide_parts:
+            self._drop_rels_to_slide(slide_part)
+        del dropped_slide_parts[:]
+
+    def _drop_rels_to_slide(self, slide_part):
+        """
+        Remove each slide relationship to *slide_part* from the parts having
+        one, along with the hyperlinks that use it.
+        """
+        hlink_tags = (qn("a:hlinkClick"), qn("a:hlinkHover"))
+        for part in self.package.parts_related_to(slide_part, RT.SLIDE):
+            rIds = [
+                rId
+                for rId, rel in part.rels.items()
+                if rel.reltype == RT.SLIDE
+                and not rel.is_external
+                and rel.target_part is slide_part
+            ]
+            for rId in rIds:
+                for elm in part._element.xpath("//*[@r:id='%s']" % rId):
+                    if elm.tag in hlink_tags:
+                        elm.getparent().remove(elm)
+                    else:
+                        elm.set(qn("r:id"), "")
+                del part.rels[rId]
+
+    @lazyproperty
+    def _dropped_slide_parts(self):
+        """
+        List of slide parts deleted from this presentation since it was last
+        saved.
+        """
+        return []
 
     @property
     def _next_slide_partname(self):
@@ -134,5 +320,377 @@ class PresentationPart(XmlPart):
         for a slide collection containing 8 slides.
         """
         sldIdLst = self._element.get_or_add_sldIdLst()
-        partname_str = "/ppt/slides/slide%d.xml" % (len(sldIdLst) + 1)
-        return PackURI(partname_str)
+        tmpl = "/ppt/slides/slide%d.xml"
+        idx = len(sldIdLst) + 1
+        dropped_slide_parts = self._dropped_slide_parts
+        if dropped_slide_parts:
+            # ---slide parts are renamed at save; until then deleting a slide
+            # ---can leave the count-based partname in use
+            used_partnames = set(
+                part.partname
+                for part in list(self.related_parts.values()) + dropped_slide_parts
+            )
+            while tmpl % idx in used_partnames:
+                idx += 1
+        return PackURI(tmpl % idx)
+
+    def _sldId_for(self, slide_part):
+        """
+        Return the `p:sldId` element for *slide_part*. Raises |ValueError| if
+        *slide_part* is not a slide of this presentation.
+        """
+        sldId = self._slide_id_index.sldId_for_part(slide_part)
+        if sldId is None:
+            raise ValueError("matching slide_part not found")
+        return sldId
+
+    @lazyproperty
+    def _slide_id_index(self):
+        """
+        |_SlideIdIndex| object mapping slide ids, rIds and slide parts of the
+        slides in this presentation to one another.
+        """
+        return _SlideIdIndex(self)
+
+
+class _SlideIdIndex(object):
+    """
+    Index of the `p:sldId` entries of a presentation by slide id and by slide
+    part, also recording the position of each slide in the sequence.
+
+    Each entry found is checked against the XML before it is used, so
+    lookups stay correct when slides are added, removed or reordered. Slides
+    appended since the last lookup are indexed incrementally; any other
+    change causes the index to be rebuilt on the next lookup that misses or
+    finds a stale entry. This makes slide-id, rId and position lookups
+    constant-time for the common case rather than a scan of the slide list.
+    """
+
+    def __init__(self, presentation_part):
+        super(_SlideIdIndex, self).__init__()
+        self._presentation_part = presentation_part
+        self._sldIds = []
+        self._entries_by_id = {}
+        self._entries_by_part = {}
+
+    def discard(self, slide_part):
+        """Remove the entry for *slide_part*, if present, from the index."""
+        entry = self._entries_by_part.pop(slide_part, None)
+        if entry is not None and self._entries_by_id.get(entry[1]) is entry:
+            del self._entries_by_id[entry[1]]
+
+    def id_for_part(self, slide_part):
+        """Return slide id of *slide_part*, or |None| if not a slide here."""
+        entry = self._lookup(self._entries_by_part, slide_part)
+        return None if entry is None else entry[1]
+
+    def idx_for_part(self, slide_part):
+        """Return position of *slide_part* in slide sequence, or |None|."""
+        entry = self._lookup(self._entries_by_part, slide_part, check_idx=True)
+        return None if entry is None else entry[4]
+
+    def part_for_id(self, slide_id):
+        """Return slide part having *slide_id*, or |None| if not found."""
+        entry = self._lookup(self._entries_by_id, slide_id)
+        return None if entry is None else entry[3]
+
+    def sldId_for_part(self, slide_part):
+        """Return `p:sldId` element of *slide_part*, or |None| if not found."""
+        entry = self._lookup(self._entries_by_part, slide_part)
+        return None if entry is None else entry[0]
+
+    def _add_entries(self, sldIds, start_idx):
+        """Index each of *sldIds*, the first of which is at *start_idx*."""
+        related_parts = self._presentation_part.related_parts
+        for idx, sldId in enumerate(sldIds, start_idx):
+            rId = sldId.rId
+            entry = (sldId, sldId.id, rId, related_parts.get(rId), idx)
+            self._sldIds.append(sldId)
+            self._entries_by_id.setdefault(entry[1], entry)
+            if entry[3] is not None:
+                self._entries_by_part.setdefault(entry[3], entry)
+
+    def _extend(self):
+        """Index slides appended since last update.
+
+        Returns |False| when the slide list has changed in some other way,
+        leaving the index as it was.
+        """
+        sldIdLst = self._sldIdLst
+        if sldIdLst is None:
+            return False
+        sldIds, count = self._sldIds, len(self._sldIds)
+        if len(sldIdLst) < count:
+            return False
+        if count and sldIdLst[count - 1] is not sldIds[-1]:
+            return False
+        self._add_entries(sldIdLst[count:], count)
+        return True
+
+    def _is_current(self, entry, check_idx):
+        """True if *entry* still matches the XML and relationships."""
+        sldId, slide_id, rId, slide_part, idx = entry
+        sldIdLst = self._sldIdLst
+        if sldId.getparent() is not sldIdLst:
+            return False
+        if sldId.id != slide_id or sldId.rId != rId:
+            return False
+        if self._presentation_part.related_parts.get(rId) is not slide_part:
+            return False
+        if check_idx and sldIdLst[idx] is not sldId:
+            return False
+        return True
+
+    def _lookup(self, entries, key, check_idx=False):
+        """Return current entry for *key* in *entries*, or |None|.
+
+        When the entry is not found or is stale, the index is first extended
+        with any newly appended slides and, failing that, rebuilt.
+        """
+        entry = entries.get(key)
+        if entry is not None and self._is_current(entry, check_idx):
+            return entry
+        if self._extend():
+            entry = entries.get(key)
+            if entry is not None and self._is_current(entry, check_idx):
+                return entry
+        self._rebuild()
+        entry = entries.get(key)
+        if entry is not None and self._is_current(entry, check_idx):
+            return entry
+        return None
+
+    def _rebuild(self):
+        """Discard all entries and index every slide in the presentation."""
+        del self._sldIds[:]
+        self._entries_by_id.clear()
+        self._entries_by_part.clear()
+        sldIdLst = self._sldIdLst
+        if sldIdLst is not None:
+            self._add_entries(list(sldIdLst), 0)
+
+    @property
+    def _sldIdLst(self):
+        """The `p:sldIdLst` element of the presentation, or |None|."""
+        return self._presentation_part._element.sldIdLst
+
+
+class _SlideImporter(object):
+    """
+    Copies slides, of this or another presentation, into the presentation of
+    *presentation_part*, along with the slide masters they need.
+
+    Slide layouts are matched by content: a source layout is equivalent to a
+    layout of the presentation having the same XML, the same images, and
+    a slide master and theme that are themselves the same. The slide master
+    of a layout without an equivalent is imported whole, so it and its
+    layouts can be used by later imports too.
+
+    The layouts of the presentation are looked up by content in the
+    |_ImportIndex| object the package keeps between imports, along with its
+    images and media, so merging many presentations into one is not slowed
+    by the content already merged. A layout found there is checked against
+    its current content before it is used, since its XML may have been
+    changed since.
+    """
+
+    def __init__(self, presentation_part):
+        super(_SlideImporter, self).__init__()
+        self._presentation_part = presentation_part
+        self._part_map = {}
+        self._index = presentation_part.package._import_index
+        self._importer = PartImporter(
+            presentation_part.package, self._part_map, self._index
+        )
+        self._digests = {}
+        self._checked_layout_parts = set()
+        self._next_id = None
+
+    def import_slides(self, slide_parts):
+        """Return list of (rId, slide) pairs, one for a copy of each of *slide_parts*.
+
+        Each copy is related to the presentation but not yet in its slide
+        sequence.
+        """
+        slide_parts = list(slide_parts)
+        part_map = self._part_map
+
+        # ---a notes master the presentation lacks is added before the index
+        # ---is brought up to date, so the index includes its parts---
+        notes_slide_parts = [
+            rel.target_part
+            for slide_part in slide_parts
+            for rel in slide_part.rels.values()
+            if rel.reltype == RT.NOTES_SLIDE and not rel.is_external
+        ]
+        if notes_slide_parts:
+            notes_master_part = self._presentation_part.notes_master_part
+            for notes_slide_part in notes_slide_parts:
+                source_master_part = notes_slide_part.part_related_by(RT.NOTES_MASTER)
+                part_map[source_master_part] = notes_master_part
+        self._index.refresh()
+
+        for slide_part in slide_parts:
+            layout_part = slide_part.part_related_by(RT.SLIDE_LAYOUT)
+            if layout_part not in part_map:
+                self._map_slide_layout(layout_part)
+
+        part_copies = self._importer.copy_parts(slide_parts + notes_slide_parts)
+        presentation_part = self._presentation_part
+        slide_pairs = [
+            (presentation_part.relate_to(slide_copy, RT.SLIDE), slide_copy.slide)
+            for slide_copy in part_copies[: len(slide_parts)]
+        ]
+        # ---the relationships added since the refresh are all to parts the
+        # ---index already knows of---
+        self._index.mark_current()
+        return slide_pairs
+
+    def _digest(self, part):
+        """Return SHA1 digest of XML *part* and of the images it refers to.
+
+        The layout list of a slide master is left out, since the ids in it
+        differ from one presentation to another.
+        """
+        digest = self._digests.get(part)
+        if digest is None:
+            digest = self._digests[part] = self._compute_digest(part)
+        return digest
+
+    @staticmethod
+    def _compute_digest(part):
+        """Return SHA1 digest of *part* as described in :meth:`_digest`."""
+        element = getattr(part, "_element", None)
+        if element is None:
+            # ---a part not parsed as XML, like a theme, is taken as is---
+            sha1 = hashlib.sha1(part.blob)
+        else:
+            if element.find(qn("p:sldLayoutIdLst")) is not None:
+                element = copy.deepcopy(element)
+                element.remove(element.find(qn("p:sldLayoutIdLst")))
+            sha1 = hashlib.sha1(serialize_part_xml(element))
+        for rId, rel in sorted(part.rels.items()):
+            if rel.reltype == RT.IMAGE and not rel.is_external:
+                sha1.update(rId.encode("utf-8"))
+                image_sha1 = _ImportIndex.sha1_key(rel.target_part, RT.IMAGE)[1]
+                sha1.update(image_sha1.encode("utf-8"))
+        return sha1.hexdigest()
+
+    def _import_slide_master(self, master_part):
+        """Copy *master_part* with its layouts and theme into presentation."""
+        layout_parts, theme_parts = [], []
+        for rel in master_part.rels.values():
+            if rel.reltype == RT.SLIDE_LAYOUT:
+                layout_parts.append(rel.target_part)
+            elif rel.reltype == RT.THEME:
+                theme_parts.append(rel.target_part)
+        master_copy = self._importer.copy_parts(
+            [master_part] + layout_parts + theme_parts
+        )[0]
+
+        presentation_part = self._presentation_part
+        rId = presentation_part.relate_to(master_copy, RT.SLIDE_MASTER)
+        sldMasterIdLst = presentation_part._element.get_or_add_sldMasterIdLst()
+        sldMasterIdLst.add_sldMasterId(self._next_master_or_layout_id(), rId)
+        for sldLayoutId in master_copy._element.xpath(
+            "./p:sldLayoutIdLst/p:sldLayoutId"
+        ):
+            sldLayoutId.id = self._next_master_or_layout_id()
+
+        layout_parts_by_key = self._layout_parts_by_key
+        for layout_part in layout_parts:
+            layout_copy = self._part_map[layout_part]
+            layout_parts_by_key[self._layout_key(layout_part)] = layout_copy
+            self._checked_layout_parts.add(layout_copy)
+
+    def _is_current(self, layout_part, key):
+        """True if *key* still identifies the content of *layout_part*.
+
+        A layout part is checked once per import, its digests being computed
+        afresh the first time, since the index may have it from an earlier
+        import.
+        """
+        if layout_part in self._checked_layout_parts:
+            return True
+        master_part = layout_part.part_related_by(RT.SLIDE_MASTER)
+        for part in (layout_part, master_part, master_part.part_related_by(RT.THEME)):
+            self._digests.pop(part, None)
+        self._checked_layout_parts.add(layout_part)
+        return self._layout_key(layout_part) == key
+
+    def _layout_key(self, layout_part):
+        """Return key identifying content of *layout_part* and its master."""
+        master_part = layout_part.part_related_by(RT.SLIDE_MASTER)
+        theme_part = master_part.part_related_by(RT.THEME)
+        return (
+            self._digest(layout_part),
+            self._digest(master_part),
+            self._digest(theme_part),
+        )
+
+    @property
+    def _layout_parts_by_key(self):
+        """dict mapping layout key to each slide layout part of presentation.
+
+        The dict is kept in the import index, so it is built again only when
+        the index is rebuilt.
+        """
+        index = self._index
+        if index.layout_parts_by_key is None:
+            layout_parts_by_key = {}
+            for master_part in self._master_parts:
+                for rel in master_part.rels.values():
+                    if rel.reltype != RT.SLIDE_LAYOUT:
+                        continue
+                    key = self._layout_key(rel.target_part)
+                    layout_parts_by_key.setdefault(key, rel.target_part)
+            index.layout_parts_by_key = layout_parts_by_key
+            self._checked_layout_parts.update(layout_parts_by_key.values())
+        return index.layout_parts_by_key
+
+    def _map_slide_layout(self, layout_part):
+        """Map *layout_part* to an equivalent layout of the presentation.
+
+        The slide master of *layout_part* is imported when there is no such
+        layout. A layout found in the index by a previous import is used only
+        once its content is confirmed unchanged, the index being rebuilt
+        otherwise.
+        """
+        key = self._layout_key(layout_part)
+        target_layout_part = self._layout_parts_by_key.get(key)
+        if target_layout_part is not None and not self._is_current(
+            target_layout_part, key
+        ):
+            self._index.layout_parts_by_key = None
+            target_layout_part = self._layout_parts_by_key.get(key)
+        if target_layout_part is None:
+            self._import_slide_master(layout_part.part_related_by(RT.SLIDE_MASTER))
+            target_layout_part = self._layout_parts_by_key[key]
+        self._part_map[layout_part] = target_layout_part
+
+    @property
+    def _master_parts(self):
+        """Sequence of slide master parts of the presentation."""
+        return [
+            rel.target_part
+            for rel in self._presentation_part.rels.values()
+            if rel.reltype == RT.SLIDE_MASTER
+        ]
+
+    def _next_master_or_layout_id(self):
+        """Return an id not used by any slide master or layout of presentation.
+
+        Slide master and layout ids share a space starting at 2147483648.
+        """
+        next_id = self._next_id
+        if next_id is None:
+            ids = self._presentation_part._element.xpath(
+                "./p:sldMasterIdLst/p:sldMasterId/@id"
+            )
+            for master_part in self._master_parts:
+                ids.extend(
+                    master_part._element.xpath("./p:sldLayoutIdLst/p:sldLayoutId/@id")
+                )
+            next_id = max([2147483647] + [int(id_str) for id_str in ids]) + 1
+        self._next_id = next_id + 1
+        return next_id
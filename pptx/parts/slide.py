@@ -6,12 +6,15 @@ Slide and related objects.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+
 from .chart import ChartPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
 from ..oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from ..oxml.theme import CT_OfficeStyleSheet
+from ..package import PartImporter
 from ..slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
 from ..util import lazyproperty
 
@@ -22,6 +25,10 @@ class BaseSlidePart(XmlPart):
     notesSlide, notesMaster, and handoutMaster.
     """
 
+    # ---|_DeferredGroupExtents| object collecting group shapes to be
+    #    recalculated while shapes.deferred_extents() is active, else None---
+    deferred_group_extents = None
+
     def get_image(self, rId):
         """
         Return an |Image| object containing the image related to this slide
@@ -49,6 +56,33 @@ class BaseSlidePart(XmlPart):
         """
         return self._element.cSld.name
 
+    def placeholder_elm_by_idx(self, idx):
+        """
+        Return the first placeholder shape element in this part having *idx*,
+        or |None| if there is no such placeholder. Lookup uses an index that
+        is rebuilt only when the shape tree changes.
+        """
+        return self._placeholder_elms_by_idx.get(idx)
+
+    def placeholder_elm_by_type(self, ph_type):
+        """
+        Return the first placeholder shape element in this part having
+        *ph_type* (e.g. `PP_PLACEHOLDER.BODY`), or |None| if there is no such
+        placeholder. Lookup uses an index that is rebuilt only when the shape
+        tree changes.
+        """
+        return self._placeholder_elms_by_type.get(ph_type)
+
+    @lazyproperty
+    def _placeholder_elms_by_idx(self):
+        """|_PlaceholderIndex| object mapping ph idx to placeholder element."""
+        return _PlaceholderIndex(self._element.cSld.spTree, "ph_idx")
+
+    @lazyproperty
+    def _placeholder_elms_by_type(self):
+        """|_PlaceholderIndex| object mapping ph type to placeholder element."""
+        return _PlaceholderIndex(self._element.cSld.spTree, "ph_type")
+
 
 class NotesMasterPart(BaseSlidePart):
     """
@@ -74,6 +108,18 @@ class NotesMasterPart(BaseSlidePart):
         """
         return NotesMaster(self._element, self)
 
+    @lazyproperty
+    def notes_slide_prototype(self):
+        """
+        `p:notes` element having the placeholders of this notes master
+        cloned, of which each new notes slide is a copy. It is built on first
+        use, so changing the placeholders of the notes master after that is
+        not reflected in notes slides added later.
+        """
+        notes = CT_NotesSlide.new()
+        NotesSlide(notes, None).clone_master_placeholders(self.notes_master)
+        return notes
+
     @classmethod
     def _new(cls, package):
         """
@@ -105,18 +151,21 @@ class NotesSlidePart(BaseSlidePart):
     """
 
     @classmethod
-    def new(cls, package, slide_part):
+    def new(cls, package, slide_part, partname=None):
         """
         Create and return a new notes slide part based on the notes master
         and related to both the notes master part and *slide_part*. If no
         notes master is present, create one based on the default template.
+        The next available notes slide partname is used when *partname* is
+        |None|.
         """
         notes_master_part = package.presentation_part.notes_master_part
-        notes_slide_part = cls._add_notes_slide_part(
-            package, slide_part, notes_master_part
-        )
-        notes_slide = notes_slide_part.notes_slide
-        notes_slide.clone_master_placeholders(notes_master_part.notes_master)
+        if partname is None:
+            partname = package.next_notes_slide_partnames()[0]
+        notes = copy.deepcopy(notes_master_part.notes_slide_prototype)
+        notes_slide_part = cls(partname, CT.PML_NOTES_SLIDE, notes, package)
+        notes_slide_part.relate_to(notes_master_part, RT.NOTES_MASTER)
+        notes_slide_part.relate_to(slide_part, RT.SLIDE)
         return notes_slide_part
 
     @lazyproperty
@@ -134,20 +183,6 @@ class NotesSlidePart(BaseSlidePart):
         """
         return NotesSlide(self._element, self)
 
-    @classmethod
-    def _add_notes_slide_part(cls, package, slide_part, notes_master_part):
-        """
-        Create and return a new notes slide part that is fully related, but
-        has no shape content (i.e. placeholders not cloned).
-        """
-        partname = package.next_partname("/ppt/notesSlides/notesSlide%d.xml")
-        content_type = CT.PML_NOTES_SLIDE
-        notes = CT_NotesSlide.new()
-        notes_slide_part = NotesSlidePart(partname, content_type, notes, package)
-        notes_slide_part.relate_to(notes_master_part, RT.NOTES_MASTER)
-        notes_slide_part.relate_to(slide_part, RT.SLIDE)
-        return notes_slide_part
-
 
 class SlidePart(BaseSlidePart):
     """
@@ -165,16 +200,53 @@ class SlidePart(BaseSlidePart):
         slide_part.relate_to(slide_layout_part, RT.SLIDE_LAYOUT)
         return slide_part
 
-    def add_chart_part(self, chart_type, chart_data):
+    def add_chart_part(self, chart_type, chart_data, embed_workbook=True):
         """
         Return the rId of a new |ChartPart| object containing a chart of
         *chart_type*, displaying *chart_data*, and related to the slide
         contained in this part.
         """
-        chart_part = ChartPart.new(chart_type, chart_data, self.package)
+        chart_part = ChartPart.new(chart_type, chart_data, self.package, embed_workbook)
         rId = self.relate_to(chart_part, RT.CHART)
         return rId
 
+    def add_chart_part_from(self, template_chart, chart_data, embed_workbook=True):
+        """
+        Return the rId of a new |ChartPart| object containing a copy of
+        |Chart| object *template_chart* depicting *chart_data*, and related
+        to the slide contained in this part.
+        """
+        chart_part = ChartPart.new_from(
+            template_chart, chart_data, self.package, embed_workbook
+        )
+        return self.relate_to(chart_part, RT.CHART)
+
+    def duplicate(self, partname):
+        """
+        Return a new slide part having *partname* and the content of this one.
+
+        The copy is related to the same slide layout, images and media as
+        this slide, so no image or media blob is copied. Parts owned by this
+        slide, like its notes slide and charts (along with their embedded
+        workbooks), are copied. The copy is not yet part of the slide
+        sequence of the presentation.
+        """
+        package = self._package
+        slide_copy = SlidePart(
+            partname, self.content_type, copy.deepcopy(self._element), package
+        )
+        importer = PartImporter(package, {self: slide_copy})
+        for rel in self.rels.values():
+            if rel.is_external:
+                slide_copy.load_rel(rel.reltype, rel.target_ref, rel.rId, True)
+                continue
+            if rel.reltype == RT.NOTES_SLIDE:
+                related_part = importer.copy_part(rel.target_part)
+            else:
+                related_part = importer.import_part(rel.target_part, rel.reltype)
+            slide_copy.load_rel(rel.reltype, related_part, rel.rId)
+        return slide_copy
+
     def get_or_add_video_media_part(self, video):
         """Return rIds for media and video relationships to media part.
 
@@ -292,3 +364,66 @@ class SlideMasterPart(BaseSlidePart):
         The |SlideMaster| object representing this part.
         """
         return SlideMaster(self._element, self)
+
+
+class _PlaceholderIndex(object):
+    """
+    Mapping of a placeholder key, such as `ph_idx` or `ph_type`, to the first
+    placeholder shape element in *spTree* having that key value.
+
+    The mapping is built in a single pass over the shape tree and rebuilt
+    whenever a shape is added to or removed from the tree, when an indexed
+    element is found to have moved or changed its key value, and when a key
+    is not found, since a placeholder can be replaced or given that key
+    without a change in the shape count. This makes repeated inheritance
+    lookups that succeed, such as those performed when reading the position
+    and size of slide placeholders, constant-time.
+    """
+
+    def __init__(self, spTree, key_attr):
+        super(_PlaceholderIndex, self).__init__()
+        self._spTree = spTree
+        self._key_attr = key_attr
+        self._ph_elms = None
+        self._child_count = None
+
+    def get(self, key):
+        """
+        Return the first placeholder element having *key*, or |None| if not
+        found.
+        """
+        just_built = self._is_stale
+        ph_elm = self._ph_elms_by_key.get(key)
+        if ph_elm is not None and self._is_current(ph_elm, key):
+            return ph_elm
+        if ph_elm is None and just_built:
+            return None
+        self._ph_elms = None
+        return self._ph_elms_by_key.get(key)
+
+    def _is_current(self, ph_elm, key):
+        """True if *ph_elm* is still in the shape tree and still has *key*."""
+        if ph_elm.getparent() is not self._spTree:
+            return False
+        return getattr(ph_elm, self._key_attr) == key
+
+    @property
+    def _ph_elms_by_key(self):
+        """
+        Dict mapping each key value to the first placeholder element having
+        it, rebuilt when the shape count of the shape tree has changed.
+        """
+        if self._is_stale:
+            ph_elms = {}
+            for ph_elm in self._spTree.iter_ph_elms():
+                ph_elms.setdefault(getattr(ph_elm, self._key_attr), ph_elm)
+            self._ph_elms, self._child_count = ph_elms, len(self._spTree)
+        return self._ph_elms
+
+    @property
+    def _is_stale(self):
+        """
+        True if the mapping is to be rebuilt before use, when it hasn't been
+        built yet or a shape has been added to or removed from the tree.
+        """
+        return self._ph_elms is None or len(self._spTree) != self._child_count
@@ -36,13 +36,33 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file):
+    def save(self, file, compact=False):
         """
         Save this presentation to *file*, where *file* can be either a path
         to a file (a string) or a file-like object.
+
+        When *compact* is |True|, relationships no longer used by the XML of
+        their source part are removed first, so images, charts and other
+        parts left behind by shapes removed at the XML level are not saved.
         """
+        if compact:
+            self.part.package.compact()
         self.part.save(file)
 
+    def save_async(self, file, executor=None):
+        """
+        Return an awaitable that saves this presentation to *file* without
+        blocking the event loop, like `await prs.save_async("deck.pptx")`.
+
+        *file* can also be an asynchronous byte sink, like an `aiofiles` file
+        object or an `asyncio.StreamWriter`. The work is done in *executor*,
+        the default executor of the event loop when |None|. Python 3 only.
+        See :func:`pptx.aio.save_async`.
+        """
+        from .aio import save_async
+
+        return save_async(self, file, executor)
+
     @property
     def slide_height(self):
         """
@@ -278,7 +278,7 @@ class ChartPlaceholder(_BaseSlidePlaceholder):
     Placeholder shape that can only accept a chart.
     """
 
-    def insert_chart(self, chart_type, chart_data):
+    def insert_chart(self, chart_type, chart_data, embed_workbook=True):
         """
         Return a |PlaceholderGraphicFrame| object containing a new chart of
         *chart_type* depicting *chart_data* and having the same position and
@@ -288,9 +288,11 @@ class ChartPlaceholder(_BaseSlidePlaceholder):
         Note that the new |Chart| object is not returned directly. The chart
         object may be accessed using the
         :attr:`~.PlaceholderGraphicFrame.chart` property of the returned
-        |PlaceholderGraphicFrame| object.
+        |PlaceholderGraphicFrame| object. *embed_workbook* chooses how the
+        Excel workbook of the chart is embedded, as for
+        :meth:`.SlideShapes.add_chart`.
         """
-        rId = self.part.add_chart_part(chart_type, chart_data)
+        rId = self.part.add_chart_part(chart_type, chart_data, embed_workbook)
         graphicFrame = self._new_chart_graphicFrame(
             rId, self.left, self.top, self.width, self.height
         )
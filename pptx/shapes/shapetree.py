@@ -4,6 +4,9 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+from contextlib import contextmanager
+
 from pptx.compat import BytesIO
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
@@ -12,6 +15,7 @@ from pptx.oxml.ns import qn
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.simpletypes import ST_Direction
+from pptx.package import PartImporter
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -30,6 +34,7 @@ from pptx.shapes.placeholder import (
     SlidePlaceholder,
     TablePlaceholder,
 )
+from pptx.shapes.spatial import SpatialIndex
 from pptx.shared import ParentedElementProxy
 from pptx.util import lazyproperty
 
@@ -131,6 +136,17 @@ class _BaseShapes(ParentedElementProxy):
             PP_PLACEHOLDER.TITLE: "Title",
         }[ph_type]
 
+    def spatial_index(self, include_group_members=True):
+        """Return |SpatialIndex| of the shapes in this collection.
+
+        The index is built in a single pass over the shape tree and answers
+        intersection, containment, hit-test and nearest-shape queries without
+        visiting every shape. When *include_group_members* is |True|, each
+        group shape is represented by its member shapes, positioned in slide
+        coordinates. The index does not reflect later changes to the shapes.
+        """
+        return SpatialIndex.from_shapes(self, include_group_members)
+
     @property
     def turbo_add_enabled(self):
         """True if "turbo-add" mode is enabled. Read/Write.
@@ -234,7 +250,7 @@ class _BaseGroupShapes(_BaseShapes):
         super(_BaseGroupShapes, self).__init__(grpSp, parent)
         self._grpSp = grpSp
 
-    def add_chart(self, chart_type, x, y, cx, cy, chart_data):
+    def add_chart(self, chart_type, x, y, cx, cy, chart_data, embed_workbook=True):
         """Add a new chart of *chart_type* to the slide.
 
         The chart is positioned at (*x*, *y*), has size (*cx*, *cy*), and
@@ -242,12 +258,42 @@ class _BaseGroupShapes(_BaseShapes):
         enumeration values. *chart_data* is a |ChartData| object populated
         with the categories and series values for the chart.
 
+        *embed_workbook* chooses how the Excel workbook holding the chart
+        data is embedded: |True| writes it right away, `"lazy"` writes it
+        when the presentation is saved, so *chart_data* must not be changed
+        before then, and |False| embeds no workbook. A chart without
+        a workbook displays normally, from the values cached in its XML, but
+        its data cannot be edited in PowerPoint.
+
         Note that a |GraphicFrame| shape object is returned, not the |Chart|
         object contained in that graphic frame shape. The chart object may be
         accessed using the :attr:`chart` property of the returned
         |GraphicFrame| object.
         """
-        rId = self.part.add_chart_part(chart_type, chart_data)
+        rId = self.part.add_chart_part(chart_type, chart_data, embed_workbook)
+        graphicFrame = self._add_chart_graphicFrame(rId, x, y, cx, cy)
+        self._recalculate_extents()
+        return self._shape_factory(graphicFrame)
+
+    def add_chart_from(
+        self, template_chart, x, y, cx, cy, chart_data, embed_workbook=True
+    ):
+        """Add a new chart formatted like *template_chart*, depicting *chart_data*.
+
+        *template_chart* is a |Chart| object, on this or another slide, in
+        this or another presentation. The new chart is a copy of it, with
+        its colors, axes, data labels and other formatting, whose series
+        are replaced by those of *chart_data* as by
+        :meth:`.Chart.replace_data`. When *chart_data* has more series than
+        the template, the added series are formatted like its last one.
+        Styling many charts this way is much faster than adding each with
+        :meth:`add_chart` and formatting it property by property.
+
+        The chart is positioned at (*x*, *y*) and has size (*cx*, *cy*).
+        *embed_workbook* is as for :meth:`add_chart`. The |GraphicFrame|
+        shape containing the chart is returned.
+        """
+        rId = self.part.add_chart_part_from(template_chart, chart_data, embed_workbook)
         graphicFrame = self._add_chart_graphicFrame(rId, x, y, cx, cy)
         self._recalculate_extents()
         return self._shape_factory(graphicFrame)
@@ -277,7 +323,11 @@ class _BaseGroupShapes(_BaseShapes):
         for shape in shapes:
             grpSp.insert_element_before(shape._element, "p:extLst")
         if shapes:
-            grpSp.recalculate_extents()
+            deferred_group_extents = self.part.deferred_group_extents
+            if deferred_group_extents is None:
+                grpSp.recalculate_extents()
+            else:
+                deferred_group_extents.add(grpSp)
         return self._shape_factory(grpSp)
 
     def add_picture(self, image_file, left, top, width=None, height=None):
@@ -344,6 +394,72 @@ class _BaseGroupShapes(_BaseShapes):
 
         return FreeformBuilder.new(self, start_x, start_y, x_scale, y_scale)
 
+    def clone(self, shape):
+        """Return a copy of *shape* newly appended to this shape tree.
+
+        *shape* can be from this shape tree, from another slide, or from a
+        slide of another presentation. The copy, and each shape it contains
+        when *shape* is a group, is assigned a fresh shape id. Relationships
+        the shape depends on, like that to the image of a picture, are
+        reproduced on this slide. Image and media parts are shared, while a
+        chart or other embedded object is copied so the clone can be edited
+        independently. A reference that cannot be reproduced, such as a
+        hyperlink to a slide of another presentation, is blanked.
+        """
+        source_part, part = shape.part, self.part
+        shape_elm = copy.deepcopy(shape.element)
+
+        importer = PartImporter(part.package)
+        rIds = {}
+        for rId_attr in shape_elm.xpath("descendant-or-self::*/@r:*"):
+            rId = str(rId_attr)
+            if rId not in rIds:
+                rIds[rId] = (
+                    importer.import_rel(source_part, rId, part)
+                    if rId in source_part.rels
+                    else None
+                )
+            rId_attr.getparent().set(rId_attr.attrname, rIds[rId] or "")
+
+        self._assign_fresh_shape_ids(shape_elm, keep_connections=source_part is part)
+        self._element.insert_element_before(shape_elm, "p:extLst")
+        self._recalculate_extents()
+        return self._shape_factory(shape_elm)
+
+    @contextmanager
+    def deferred_extents(self):
+        """Context manager that postpones recalculation of group-shape extents.
+
+        Normally the position and size of a group shape, and of each group
+        containing it, are recalculated every time a shape is added to it.
+        Within this context, adding a shape to a group at any nesting level
+        only marks that group and its ancestors as needing recalculation.
+        When the context exits, each marked group is recalculated exactly
+        once, innermost groups first::
+
+            with slide.shapes.deferred_extents():
+                group = slide.shapes.add_group_shape()
+                for x in range(1000):
+                    group.shapes.add_shape(MSO_SHAPE.OVAL, x, 0, 10, 10)
+
+        This makes building large or deeply nested groups linear rather than
+        quadratic in the number of shapes added. The position and size of
+        groups are not reliable inside the context. Contexts may be nested,
+        in which case recalculation occurs when the outermost one exits.
+        """
+        part = self.part
+        if part.deferred_group_extents is not None:
+            yield
+            return
+
+        deferred_group_extents = _DeferredGroupExtents()
+        part.deferred_group_extents = deferred_group_extents
+        try:
+            yield
+        finally:
+            part.deferred_group_extents = None
+            deferred_group_extents.recalculate()
+
     def index(self, shape):
         """Return the index of *shape* in this sequence.
 
@@ -420,6 +536,28 @@ class _BaseGroupShapes(_BaseShapes):
         sp = self._spTree.add_textbox(id_, name, x, y, cx, cy)
         return sp
 
+    def _assign_fresh_shape_ids(self, shape_elm, keep_connections):
+        """Assign a new shape id to *shape_elm* and each shape it contains.
+
+        Connections between shapes within *shape_elm* are updated to the new
+        ids. Connections to shapes outside it are kept when
+        *keep_connections* is True and removed otherwise.
+        """
+        new_ids = {}
+        next_id = self._next_shape_id
+        for cNvPr in shape_elm.xpath("descendant-or-self::*/p:cNvPr"):
+            new_ids[cNvPr.id] = next_id
+            cNvPr.id = next_id
+            next_id += 1
+        if self._cached_max_shape_id is not None:
+            self._cached_max_shape_id = next_id - 1
+
+        for cxn in shape_elm.xpath(".//a:stCxn | .//a:endCxn"):
+            if cxn.id in new_ids:
+                cxn.id = new_ids[cxn.id]
+            elif not keep_connections:
+                cxn.getparent().remove(cxn)
+
     def _recalculate_extents(self):
         """Adjust position and size to incorporate all contained shapes.
 
@@ -442,8 +580,13 @@ class GroupShapes(_BaseGroupShapes):
         """Adjust position and size to incorporate all contained shapes.
 
         This would typically be called when a contained shape is added,
-        removed, or its position or size updated.
+        removed, or its position or size updated. When extents are deferred
+        for this part, the group is only marked for later recalculation.
         """
+        deferred_group_extents = self.part.deferred_group_extents
+        if deferred_group_extents is not None:
+            deferred_group_extents.add(self._grpSp)
+            return
         self._grpSp.recalculate_extents()
 
 
@@ -657,10 +800,10 @@ class LayoutPlaceholders(BasePlaceholders):
         Return the first placeholder shape with matching *idx* value, or
         *default* if not found.
         """
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
-        return default
+        ph_elm = self.part.placeholder_elm_by_idx(idx)
+        if ph_elm is None:
+            return default
+        return self._shape_factory(ph_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -682,10 +825,10 @@ class MasterPlaceholders(BasePlaceholders):
         or *default* if no such placeholder shape is present in the
         collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        ph_elm = self.part.placeholder_elm_by_type(ph_type)
+        if ph_elm is None:
+            return default
+        return self._shape_factory(ph_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -831,6 +974,38 @@ def SlideShapeFactory(shape_elm, parent):
     return BaseShapeFactory(shape_elm, parent)
 
 
+class _DeferredGroupExtents(object):
+    """Collects `p:grpSp` elements whose extents are pending recalculation.
+
+    Used by :meth:`_BaseGroupShapes.deferred_extents` to recalculate each
+    affected group shape once, rather than once per shape added.
+    """
+
+    def __init__(self):
+        super(_DeferredGroupExtents, self).__init__()
+        self._grpSps = set()
+
+    def add(self, grpSp):
+        """Mark *grpSp* and each group shape containing it for recalculation."""
+        grpSp_tag = qn("p:grpSp")
+        # ---once a group is marked, its ancestors are already marked too---
+        while (
+            grpSp is not None and grpSp.tag == grpSp_tag and grpSp not in self._grpSps
+        ):
+            self._grpSps.add(grpSp)
+            grpSp = grpSp.getparent()
+
+    def recalculate(self):
+        """Recalculate extents of each marked group, innermost first."""
+
+        def depth(grpSp):
+            return sum(1 for _ in grpSp.iterancestors())
+
+        for grpSp in sorted(self._grpSps, key=depth, reverse=True):
+            grpSp.fit_extents()
+        self._grpSps.clear()
+
+
 class _MoviePicElementCreator(object):
     """Functional service object for creating a new movie p:pic element.
 
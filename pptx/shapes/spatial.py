@@ -0,0 +1,265 @@
+# encoding: utf-8
+
+"""Spatial index over the shapes in a shape collection."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import math
+
+from pptx.oxml.ns import qn
+
+
+class SpatialIndex(object):
+    """Grid index of shape bounding boxes supporting region and point queries.
+
+    Each shape is indexed by its frame in slide coordinates (EMU), with the
+    offset and scaling applied by any containing group shape taken into
+    account. Rotation is not taken into account; like |BaseShape.left| and
+    friends, a box describes the unrotated frame of the shape.
+
+    The index is a snapshot. Shapes added, removed or moved after it is built
+    are not reflected; build a new index with `shapes.spatial_index()` after
+    making such changes.
+
+    Query results are in z-order, the shape drawn last (top-most) appearing
+    last.
+    """
+
+    def __init__(self, boxes):
+        super(SpatialIndex, self).__init__()
+        self._shapes = [box[0] for box in boxes]
+        self._boxes = [box[1:] for box in boxes]
+        self._build_grid()
+
+    def __len__(self):
+        return len(self._boxes)
+
+    @classmethod
+    def from_shapes(cls, shapes, include_group_members=True):
+        """Return |SpatialIndex| of the shapes in shape collection *shapes*.
+
+        When *include_group_members* is |True|, a group shape is represented
+        by its member shapes (recursively) rather than by the group itself.
+        Shapes having no position or size, even by inheritance, are omitted.
+        """
+        boxes = []
+
+        def add_boxes(shapes, transform):
+            for shape in shapes:
+                extents = _shape_extents(shape)
+                if extents is None:
+                    continue
+                if include_group_members and shape.element.tag == qn("p:grpSp"):
+                    xfrm = shape.element.grpSpPr.xfrm
+                    add_boxes(shape.shapes, _child_transform(transform, xfrm))
+                    continue
+                boxes.append((shape,) + _apply_transform(transform, extents))
+
+        add_boxes(shapes, (1.0, 1.0, 0, 0))
+        return cls(boxes)
+
+    def at_point(self, x, y):
+        """Return list of shapes whose bounding box contains point (*x*, *y*).
+
+        A point on the edge of a box is contained in it. The last shape in
+        the list is the top-most one, the one a click at that point would
+        select.
+        """
+        return self.intersecting(x, y, 0, 0)
+
+    def intersecting(self, x, y, cx, cy):
+        """Return list of shapes whose bounding box intersects the region.
+
+        The region has its top-left corner at (*x*, *y*) and extents *cx* by
+        *cy*. Boxes merely touching the region edge are included.
+        """
+        x1, y1 = x + cx, y + cy
+        boxes = self._boxes
+        return self._shapes_for(
+            i
+            for i in self._candidates(x, y, x1, y1)
+            if boxes[i][0] <= x1
+            and x <= boxes[i][2]
+            and boxes[i][1] <= y1
+            and y <= boxes[i][3]
+        )
+
+    def nearest(self, x, y):
+        """Return the shape whose bounding box is closest to point (*x*, *y*).
+
+        Distance is zero for a box containing the point. When several shapes
+        are equally close, the top-most is returned. Returns |None| when the
+        index is empty.
+        """
+        if not self._boxes:
+            return None
+
+        boxes, grid = self._boxes, self._grid
+        col, row = self._cell_clamped(x, y)
+        cell_span = min(self._cell_cx, self._cell_cy)
+        best_key, best_i = None, None
+        seen = set()
+
+        for radius in range(max(self._cols, self._rows)):
+            for key in _ring(col, row, radius):
+                for i in grid.get(key, ()):
+                    if i in seen:
+                        continue
+                    seen.add(i)
+                    x0, y0, x1, y1 = boxes[i]
+                    dx = max(x0 - x, 0, x - x1)
+                    dy = max(y0 - y, 0, y - y1)
+                    dist_key = (dx * dx + dy * dy, -i)
+                    if best_key is None or dist_key < best_key:
+                        best_key, best_i = dist_key, i
+            # ---boxes not yet seen are at least `radius` whole cells away---
+            if best_key is not None and best_key[0] <= (radius * cell_span) ** 2:
+                break
+
+        return self._shapes[best_i]
+
+    def overlaps(self):
+        """Return list of (shape, other_shape) pairs whose boxes overlap.
+
+        Only overlaps having a non-zero area are reported, so adjacent shapes
+        sharing an edge are not. Each pair appears once, with the lower shape
+        in z-order first.
+        """
+        boxes = self._boxes
+        pairs = set()
+        for cell_ids in self._grid.values():
+            for n, i in enumerate(cell_ids):
+                ax0, ay0, ax1, ay1 = boxes[i]
+                for j in cell_ids[n + 1 :]:
+                    bx0, by0, bx1, by1 = boxes[j]
+                    if ax0 < bx1 and bx0 < ax1 and ay0 < by1 and by0 < ay1:
+                        pairs.add((i, j))
+        shapes = self._shapes
+        return [(shapes[i], shapes[j]) for i, j in sorted(pairs)]
+
+    def within(self, x, y, cx, cy):
+        """Return list of shapes whose bounding box lies entirely in region.
+
+        The region has its top-left corner at (*x*, *y*) and extents *cx* by
+        *cy*. Use this to find out-of-bounds shapes, for example, by querying
+        with the slide extents.
+        """
+        x1, y1 = x + cx, y + cy
+        boxes = self._boxes
+        return self._shapes_for(
+            i
+            for i in self._candidates(x, y, x1, y1)
+            if x <= boxes[i][0]
+            and y <= boxes[i][1]
+            and boxes[i][2] <= x1
+            and boxes[i][3] <= y1
+        )
+
+    def _build_grid(self):
+        """Distribute box indices into a grid of roughly one box per cell."""
+        boxes = self._boxes
+        if boxes:
+            self._x0 = min(box[0] for box in boxes)
+            self._y0 = min(box[1] for box in boxes)
+            width = max(box[2] for box in boxes) - self._x0
+            height = max(box[3] for box in boxes) - self._y0
+        else:
+            self._x0 = self._y0 = width = height = 0
+
+        cells_per_side = max(1, int(math.sqrt(len(boxes))))
+        self._cols = self._rows = cells_per_side
+        self._cell_cx = max(1, int(math.ceil(width / cells_per_side)))
+        self._cell_cy = max(1, int(math.ceil(height / cells_per_side)))
+
+        grid = self._grid = {}
+        for i, (x0, y0, x1, y1) in enumerate(boxes):
+            for key in self._cell_keys(x0, y0, x1, y1):
+                grid.setdefault(key, []).append(i)
+
+    def _candidates(self, x0, y0, x1, y1):
+        """Generate index of each box in a grid cell overlapping the region."""
+        grid, seen = self._grid, set()
+        for key in self._cell_keys(x0, y0, x1, y1):
+            for i in grid.get(key, ()):
+                if i not in seen:
+                    seen.add(i)
+                    yield i
+
+    def _cell_clamped(self, x, y):
+        """Return (col, row) of grid cell containing or nearest to (*x*, *y*)."""
+        col = int((x - self._x0) // self._cell_cx)
+        row = int((y - self._y0) // self._cell_cy)
+        return (
+            min(max(col, 0), self._cols - 1),
+            min(max(row, 0), self._rows - 1),
+        )
+
+    def _cell_keys(self, x0, y0, x1, y1):
+        """Generate (col, row) key of each grid cell overlapping the region."""
+        col0, row0 = self._cell_clamped(x0, y0)
+        col1, row1 = self._cell_clamped(x1, y1)
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                yield (col, row)
+
+    def _shapes_for(self, box_idxs):
+        """Return list of shapes for *box_idxs*, in z-order."""
+        shapes = self._shapes
+        return [shapes[i] for i in sorted(box_idxs)]
+
+
+def _apply_transform(transform, extents):
+    """Return (x0, y0, x1, y1) box in slide coordinates for group *extents*."""
+    sx, sy, dx, dy = transform
+    x, y, cx, cy = extents
+    x0, y0 = int(round(x * sx + dx)), int(round(y * sy + dy))
+    return (x0, y0, x0 + int(round(cx * sx)), y0 + int(round(cy * sy)))
+
+
+def _child_transform(transform, xfrm):
+    """Return transform mapping child coordinates of group to slide coordinates.
+
+    *transform* maps the coordinates of the group itself to slide
+    coordinates. *xfrm* is the group's `a:xfrm` element, whose `a:chOff` and
+    `a:chExt` children define the coordinate space of its members.
+    """
+    sx, sy, dx, dy = transform
+    chOff, chExt = xfrm.chOff, xfrm.chExt
+    ch_x, ch_y = (0, 0) if chOff is None else (chOff.x, chOff.y)
+    scale_x = xfrm.cx / chExt.cx if chExt is not None and chExt.cx else 1.0
+    scale_y = xfrm.cy / chExt.cy if chExt is not None and chExt.cy else 1.0
+    return (
+        sx * scale_x,
+        sy * scale_y,
+        dx + sx * (xfrm.x - ch_x * scale_x),
+        dy + sy * (xfrm.y - ch_y * scale_y),
+    )
+
+
+def _ring(col, row, radius):
+    """Generate (col, row) grid keys at Chebyshev *radius* from (col, row)."""
+    if radius == 0:
+        yield (col, row)
+        return
+    for c in range(col - radius, col + radius + 1):
+        yield (c, row - radius)
+        yield (c, row + radius)
+    for r in range(row - radius + 1, row + radius):
+        yield (col - radius, r)
+        yield (col + radius, r)
+
+
+def _shape_extents(shape):
+    """Return (x, y, cx, cy) of *shape* in its own coordinate space, or None.
+
+    Extents are read directly from the shape's `a:xfrm` element when it is
+    complete. Otherwise the shape is asked, which lets a placeholder report
+    the position it inherits from its layout.
+    """
+    elm = shape.element
+    extents = (elm.x, elm.y, elm.cx, elm.cy)
+    if None in extents:
+        extents = (shape.left, shape.top, shape.width, shape.height)
+        if None in extents:
+            return None
+    return extents
@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from pptx.dml.fill import FillFormat
 from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.shapes.shapetree import (
     LayoutPlaceholders,
     LayoutShapes,
@@ -130,10 +131,7 @@ class NotesSlide(_BaseSlide):
         notes master does not have a body placeholder, or if the notes
         placeholder has been deleted from the notes slide.
         """
-        for placeholder in self.placeholders:
-            if placeholder.placeholder_format.type == PP_PLACEHOLDER.BODY:
-                return placeholder
-        return None
+        return self.placeholders.get(PP_PLACEHOLDER.BODY)
 
     @property
     def notes_text_frame(self):
@@ -294,6 +292,39 @@ class Slides(ParentedElementProxy):
         self._sldIdLst.add_sldId(rId)
         return slide
 
+    def delete(self, slide):
+        """
+        Remove *slide* from this slide collection.
+
+        The slide is also removed from any custom show or section it appears
+        in. Hyperlinks to it from other slides are removed when the
+        presentation is saved. Raises |ValueError| on *slide* not present.
+        """
+        try:
+            self.part.delete_slide(slide.part)
+        except ValueError:
+            raise ValueError("%s is not in slide collection" % slide)
+
+    def duplicate(self, slide, index=None):
+        """
+        Return a new slide having the content of *slide*.
+
+        The new slide uses the same slide layout, and its notes slide, if
+        any, is a copy of the notes of *slide*. Pictures and media are shared
+        with *slide* rather than stored again, while charts are copied so
+        each can be changed on its own. The new slide is appended to the
+        collection, or placed at zero-based position *index* when one is
+        specified. Raises |IndexError| on *index* out of range, leaving the
+        collection unchanged.
+        """
+        if index is not None and not 0 <= index <= len(self):
+            raise IndexError("slide index out of range")
+        rId, new_slide = self.part.duplicate_slide(slide.part)
+        self._sldIdLst.add_sldId(rId)
+        if index is not None:
+            self.part.move_slide(new_slide.part, index)
+        return new_slide
+
     def get(self, slide_id, default=None):
         """
         Return the slide identified by integer *slide_id* in this
@@ -304,15 +335,82 @@ class Slides(ParentedElementProxy):
             return default
         return slide
 
+    def import_slides(self, other_prs, slides=None):
+        """
+        Return list of new slides copied from presentation *other_prs*.
+
+        All slides of *other_prs* are copied, in order, unless a sequence of
+        some of its *slides* is specified. The new slides are appended to
+        this collection. Each uses the slide layout of this presentation that
+        is equivalent to the one it had, when there is one, otherwise the
+        slide master of its layout is copied into this presentation too,
+        once. Pictures and media already present are not stored again, and
+        notes slides are copied along with their slide.
+        """
+        if slides is None:
+            slides = other_prs.slides
+        slide_pairs = self.part.import_slides([slide.part for slide in slides])
+        self._sldIdLst.add_sldIds([rId for rId, _ in slide_pairs])
+        return [slide for _, slide in slide_pairs]
+
     def index(self, slide):
         """
         Map *slide* to an integer representing its zero-based position in
         this slide collection. Raises |ValueError| on *slide* not present.
         """
-        for idx, this_slide in enumerate(self):
-            if this_slide == slide:
-                return idx
-        raise ValueError("%s is not in slide collection" % slide)
+        try:
+            return self.part.slide_idx(slide.part)
+        except ValueError:
+            raise ValueError("%s is not in slide collection" % slide)
+
+    def move(self, slide, new_idx):
+        """
+        Move *slide* to zero-based position *new_idx* in this slide
+        collection, such that `slides.index(slide) == new_idx` afterward.
+        Raises |IndexError| on *new_idx* out of range and |ValueError| on
+        *slide* not present.
+        """
+        try:
+            self.part.move_slide(slide.part, new_idx)
+        except ValueError:
+            raise ValueError("%s is not in slide collection" % slide)
+
+    def reorder(self, order):
+        """
+        Arrange the slides in this collection in the sequence *order*.
+
+        *order* is an iterable containing each slide in this collection
+        exactly once, such as a sorted list of the slides. Raises
+        |ValueError| when a slide is missing, repeated or not in this
+        collection. Slide partnames are renumbered to match the new order
+        when the presentation is saved.
+        """
+        self.part.reorder_slides([slide.part for slide in order])
+
+    def set_notes(self, notes):
+        """
+        Set the speaker notes text of many slides in a single operation.
+
+        *notes* is a dict mapping zero-based slide position to notes text,
+        like `{0: "Welcome", 3: "Questions?"}`, or an iterable of (slide,
+        text) pairs in which each slide is a slide object or a position. A
+        notes slide is added to each slide not already having one, much
+        faster than accessing :attr:`Slide.notes_slide` for each in turn, and
+        its notes text is replaced by *text*. Raises |IndexError| on
+        a position out of range and |ValueError| on a slide not in this
+        collection.
+        """
+        items = notes.items() if hasattr(notes, "items") else notes
+        slide_texts = [
+            (self[slide] if isinstance(slide, int) else slide, text)
+            for slide, text in items
+        ]
+        try:
+            self.part.add_notes_slides([slide.part for slide, _ in slide_texts])
+        except ValueError:
+            raise ValueError("slide is not in slide collection")
+        for slide, text in slide_texts:
+            slide.notes_slide.notes_text_frame.text = text
 
 
 class SlideLayout(_BaseSlide):
@@ -363,10 +461,28 @@ class SlideLayout(_BaseSlide):
 
     @property
     def used_by_slides(self):
-        """Tuple of slide objects based on this slide layout."""
-        # ---getting Slides collection requires going around the horn a bit---
-        slides = self.part.package.presentation_part.presentation.slides
-        return tuple(s for s in slides if s.slide_layout == self)
+        """Tuple of slide objects based on this slide layout.
+
+        Slides appear in presentation order. The slides are found using the
+        package index of relationship sources, so only the slides related to
+        this layout are visited.
+        """
+        package = self.part.package
+        presentation_part = package.presentation_part
+        slide_parts_by_idx = {}
+        for part in package.parts_related_to(self.part, RT.SLIDE_LAYOUT):
+            # ---the slide master is also related to its layouts---
+            if part.content_type != CT.PML_SLIDE:
+                continue
+            try:
+                slide_idx = presentation_part.slide_idx(part)
+            except ValueError:
+                # ---slide part no longer in presentation---
+                continue
+            slide_parts_by_idx[slide_idx] = part
+        return tuple(
+            slide_parts_by_idx[idx].slide for idx in sorted(slide_parts_by_idx)
+        )
 
 
 class SlideLayouts(ParentedElementProxy):
@@ -445,6 +561,17 @@ class SlideLayouts(ParentedElementProxy):
         # --including images (not used elsewhere) and hyperlinks
         slide_layout.slide_master.part.drop_rel(target_sldLayoutId.rId)
 
+    def remove_unused(self):
+        """Remove each slide layout in this collection not used by any slide.
+
+        Useful for pruning the layouts of a template after generating
+        a presentation from it.
+        """
+        for slide_layout in list(self):
+            if slide_layout.used_by_slides:
+                continue
+            self.remove(slide_layout)
+
 
 class SlideMaster(_BaseMaster):
     """
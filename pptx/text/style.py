@@ -0,0 +1,330 @@
+# encoding: utf-8
+
+"""Resolution of effective text properties through the text-style hierarchy.
+
+A character or paragraph property not applied directly to a run or paragraph is
+inherited. It is taken from the first of these that defines it: the list style of
+the containing shape, the list style of the matching placeholder on the slide
+layout, the list style of the matching placeholder on the slide master, the
+master's title, body or other text style, and finally the presentation's default
+text style. Theme font references such as "+mn-lt" are resolved using the font
+scheme of the master's theme.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_UNDERLINE
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.util import Centipoints
+
+# ---maps a placeholder type to the type of the slide-master placeholder it
+#    inherits from and the name of the master text style that applies to it---
+_MASTER_PH_TYPE_AND_STYLE = {
+    PP_PLACEHOLDER.BITMAP: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.BODY: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.CENTER_TITLE: (PP_PLACEHOLDER.TITLE, "titleStyle"),
+    PP_PLACEHOLDER.CHART: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.DATE: (PP_PLACEHOLDER.DATE, "otherStyle"),
+    PP_PLACEHOLDER.FOOTER: (PP_PLACEHOLDER.FOOTER, "otherStyle"),
+    PP_PLACEHOLDER.HEADER: (PP_PLACEHOLDER.HEADER, "otherStyle"),
+    PP_PLACEHOLDER.MEDIA_CLIP: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.OBJECT: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.ORG_CHART: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.PICTURE: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.SLIDE_IMAGE: (PP_PLACEHOLDER.SLIDE_IMAGE, "otherStyle"),
+    PP_PLACEHOLDER.SLIDE_NUMBER: (PP_PLACEHOLDER.SLIDE_NUMBER, "otherStyle"),
+    PP_PLACEHOLDER.SUBTITLE: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.TABLE: (PP_PLACEHOLDER.BODY, "bodyStyle"),
+    PP_PLACEHOLDER.TITLE: (PP_PLACEHOLDER.TITLE, "titleStyle"),
+}
+
+
+class EffectiveFont(tuple):
+    """Read-only character properties in effect for a run or paragraph.
+
+    Unlike |Font|, which reports only directly-applied values, each property
+    reflects the value inherited through the text-style hierarchy when none is
+    applied directly. A property is |None| only when no level of the hierarchy
+    defines it.
+    """
+
+    def __new__(cls, name, sz, bold, italic, u):
+        return tuple.__new__(cls, (name, sz, bold, italic, u))
+
+    @property
+    def bold(self):
+        """|True| if text is bold, |False| if not, |None| if undefined."""
+        return self[2]
+
+    @property
+    def italic(self):
+        """|True| if text is italic, |False| if not, |None| if undefined."""
+        return self[3]
+
+    @property
+    def name(self):
+        """Typeface name, with theme font references like "+mn-lt" resolved."""
+        return self[0]
+
+    @property
+    def size(self):
+        """|Length| value of font height, or |None| if undefined."""
+        sz = self[1]
+        if sz is None:
+            return None
+        return Centipoints(sz)
+
+    @property
+    def underline(self):
+        """
+        |True| for single underline, |False| for none, |None| if undefined, or
+        a member of :ref:`MsoTextUnderlineType` for other underline styles.
+        """
+        u = self[4]
+        if u is MSO_UNDERLINE.NONE:
+            return False
+        if u is MSO_UNDERLINE.SINGLE_LINE:
+            return True
+        return u
+
+
+class EffectiveParagraphFormat(tuple):
+    """Read-only paragraph properties in effect for a paragraph.
+
+    Each property reflects the value inherited through the text-style
+    hierarchy when none is applied directly to the paragraph. A property is
+    |None| only when no level of the hierarchy defines it.
+    """
+
+    def __new__(cls, alignment, line_spacing, space_after, space_before):
+        return tuple.__new__(cls, (alignment, line_spacing, space_after, space_before))
+
+    @property
+    def alignment(self):
+        """Member of :ref:`PpParagraphAlignment`, or |None| if undefined."""
+        return self[0]
+
+    @property
+    def line_spacing(self):
+        """Multiple of line height (float) or |Length|, or |None| if undefined."""
+        return self[1]
+
+    @property
+    def space_after(self):
+        """|Length| of spacing after the paragraph, or |None| if undefined."""
+        return self[2]
+
+    @property
+    def space_before(self):
+        """|Length| of spacing before the paragraph, or |None| if undefined."""
+        return self[3]
+
+
+class TextStyleResolver(object):
+    """Resolves effective text properties for the text in a package.
+
+    Values inherited from outside the shape containing the text are cached,
+    keyed by (part, placeholder idx, placeholder type, outline level). After
+    the first lookup, resolving properties for text in the same placeholder
+    and at the same level costs a dict lookup instead of repeated walks of
+    the layout, master, presentation and theme XML.
+
+    python-pptx never modifies list styles, master text styles or themes
+    itself. Call :meth:`clear` after editing any of those in the XML
+    directly, so that cached values are recalculated.
+    """
+
+    def __init__(self, package):
+        super(TextStyleResolver, self).__init__()
+        self._package = package
+        self._inherited_styles = {}
+        self._theme_fonts = {}
+
+    def clear(self):
+        """Discard all cached inherited values."""
+        self._inherited_styles.clear()
+        self._theme_fonts.clear()
+
+    def effective_font(self, part, p, rPr=None):
+        """Return |EffectiveFont| for paragraph *p* contained in *part*.
+
+        When *rPr* is provided, the run-level properties it contains take
+        precedence, producing the effective font of that run.
+        """
+        pPr = p.pPr
+        local_rPrs = [rPr, None if pPr is None else pPr.defRPr] + [
+            lvl_pPr.defRPr for lvl_pPr in self._lstStyle_pPrs(p)
+        ]
+        inherited_font_values, _, theme_fonts = self._inherited_style(part, p)
+        name, sz, b, i, u = _first_defined(
+            [_font_values(rPr) for rPr in local_rPrs] + [inherited_font_values]
+        )
+        return EffectiveFont(theme_fonts.get(name, name), sz, b, i, u)
+
+    def effective_paragraph_format(self, part, p):
+        """Return |EffectiveParagraphFormat| for paragraph *p* in *part*."""
+        local_pPrs = [p.pPr] + list(self._lstStyle_pPrs(p))
+        _, inherited_paragraph_values, _ = self._inherited_style(part, p)
+        return EffectiveParagraphFormat(
+            *_first_defined(
+                [_paragraph_values(pPr) for pPr in local_pPrs]
+                + [inherited_paragraph_values]
+            )
+        )
+
+    def _inherited_pPrs(self, part, ph_idx, ph_type, lvl):
+        """Return (pPrs, master_part) pair for text in *part*.
+
+        *pPrs* is the sequence of paragraph-properties elements that text at
+        outline level *lvl* inherits from outside its own shape, most
+        specific first. *master_part* is the slide or notes master part whose
+        theme applies, or |None| when *part* is not a slide-type part.
+        """
+        content_type = part.content_type
+        pPrs = []
+
+        if content_type in (CT.PML_NOTES_SLIDE, CT.PML_NOTES_MASTER):
+            is_notes_slide = content_type == CT.PML_NOTES_SLIDE
+            master_part = (
+                part.part_related_by(RT.NOTES_MASTER) if is_notes_slide else part
+            )
+            if ph_type is not None and is_notes_slide:
+                pPrs.extend(
+                    self._ph_pPrs(master_part.placeholder_elm_by_type(ph_type), lvl)
+                )
+            if ph_type == PP_PLACEHOLDER.BODY:
+                pPrs.extend(self._style_pPrs(master_part._element.notesStyle, lvl))
+
+        elif content_type in (CT.PML_SLIDE, CT.PML_SLIDE_LAYOUT, CT.PML_SLIDE_MASTER):
+            if content_type == CT.PML_SLIDE:
+                layout_part = part.part_related_by(RT.SLIDE_LAYOUT)
+                if ph_type is not None:
+                    layout_ph = layout_part.placeholder_elm_by_idx(ph_idx)
+                    if layout_ph is not None:
+                        pPrs.extend(self._ph_pPrs(layout_ph, lvl))
+                        ph_type = layout_ph.ph_type
+                part = layout_part
+            if content_type == CT.PML_SLIDE_MASTER:
+                master_part = part
+            else:
+                master_part = part.part_related_by(RT.SLIDE_MASTER)
+            if ph_type is not None:
+                master_ph_type, style_name = _MASTER_PH_TYPE_AND_STYLE.get(
+                    ph_type, (ph_type, "otherStyle")
+                )
+                if content_type != CT.PML_SLIDE_MASTER:
+                    master_ph = master_part.placeholder_elm_by_type(master_ph_type)
+                    pPrs.extend(self._ph_pPrs(master_ph, lvl))
+                txStyles = master_part._element.txStyles
+                if txStyles is not None:
+                    pPrs.extend(self._style_pPrs(getattr(txStyles, style_name), lvl))
+
+        else:
+            return pPrs, None
+
+        presentation_part = self._package.presentation_part
+        defaultTextStyle = presentation_part._element.defaultTextStyle
+        pPrs.extend(self._style_pPrs(defaultTextStyle, lvl))
+        return pPrs, master_part
+
+    def _inherited_style(self, part, p):
+        """Return (font_values, paragraph_values, theme_fonts) for *p*.
+
+        The values are those inherited from outside the shape containing
+        paragraph *p*, and are computed once per cache key.
+        """
+        sp = p.getparent().getparent()
+        has_ph_elm = getattr(sp, "has_ph_elm", False)
+        ph_idx, ph_type = (sp.ph_idx, sp.ph_type) if has_ph_elm else (None, None)
+        lvl = _lvl(p)
+        key = (part, ph_idx, ph_type, lvl)
+
+        inherited_style = self._inherited_styles.get(key)
+        if inherited_style is not None:
+            return inherited_style
+
+        pPrs, master_part = self._inherited_pPrs(part, ph_idx, ph_type, lvl)
+        inherited_style = (
+            _first_defined(
+                [_font_values(pPr.defRPr) for pPr in pPrs] + [_font_values(None)]
+            ),
+            _first_defined(
+                [_paragraph_values(pPr) for pPr in pPrs] + [_paragraph_values(None)]
+            ),
+            self._theme_fonts_for(master_part),
+        )
+        self._inherited_styles[key] = inherited_style
+        return inherited_style
+
+    @staticmethod
+    def _lstStyle_pPrs(p):
+        """Paragraph-properties elements applying to *p* from its own text body."""
+        lstStyle = p.getparent().lstStyle
+        if lstStyle is None:
+            return ()
+        return lstStyle.level_pPrs(_lvl(p))
+
+    @classmethod
+    def _ph_pPrs(cls, ph_elm, lvl):
+        """Paragraph-properties elements from list style of *ph_elm* at *lvl*."""
+        if ph_elm is None or ph_elm.txBody is None:
+            return ()
+        return cls._style_pPrs(ph_elm.txBody.lstStyle, lvl)
+
+    @staticmethod
+    def _style_pPrs(style, lvl):
+        """Paragraph-properties elements from list-style element *style*."""
+        if style is None:
+            return ()
+        return style.level_pPrs(lvl)
+
+    def _theme_fonts_for(self, master_part):
+        """Dict of theme font references to typefaces for theme of *master_part*."""
+        if master_part is None:
+            return {}
+        theme_fonts = self._theme_fonts.get(master_part)
+        if theme_fonts is None:
+            try:
+                theme_part = master_part.part_related_by(RT.THEME)
+            except KeyError:
+                theme_fonts = {}
+            else:
+                theme_fonts = parse_xml(theme_part.blob).font_typefaces
+            self._theme_fonts[master_part] = theme_fonts
+        return theme_fonts
+
+
+def _first_defined(value_seqs):
+    """Return tuple of first value that is not |None| in each position.
+
+    *value_seqs* is a sequence of same-length value tuples, most specific
+    first.
+    """
+    return tuple(
+        next((value for value in values if value is not None), None)
+        for values in zip(*value_seqs)
+    )
+
+
+def _font_values(rPr):
+    """Return (typeface, sz, b, i, u) tuple of directly-applied values in *rPr*."""
+    if rPr is None:
+        return (None, None, None, None, None)
+    latin = rPr.latin
+    typeface = None if latin is None else latin.typeface
+    return (typeface, rPr.sz, rPr.b, rPr.i, rPr.u)
+
+
+def _lvl(p):
+    """Zero-based outline level of paragraph *p*."""
+    pPr = p.pPr
+    return 0 if pPr is None else pPr.lvl
+
+
+def _paragraph_values(pPr):
+    """Return (algn, line_spacing, space_after, space_before) tuple for *pPr*."""
+    if pPr is None:
+        return (None, None, None, None)
+    return (pPr.algn, pPr.line_spacing, pPr.space_after, pPr.space_before)
@@ -533,6 +533,26 @@ class _Paragraph(Subshape):
         """
         return Font(self._defRPr)
 
+    @property
+    def effective_font(self):
+        """|EffectiveFont| object describing character properties in effect.
+
+        Reflects the paragraph's default run properties and, for those not
+        defined there, the values inherited from the text frame, placeholder,
+        layout, master and presentation text styles. Read-only.
+        """
+        return self.part.package.text_styles.effective_font(self.part, self._p)
+
+    @property
+    def effective_paragraph_format(self):
+        """|EffectiveParagraphFormat| object describing paragraph properties.
+
+        Like :attr:`effective_font`, includes values inherited through the
+        text-style hierarchy. Read-only.
+        """
+        text_styles = self.part.package.text_styles
+        return text_styles.effective_paragraph_format(self.part, self._p)
+
     @property
     def level(self):
         """
@@ -687,6 +707,18 @@ class _Run(Subshape):
         rPr = self._r.get_or_add_rPr()
         return Font(rPr)
 
+    @property
+    def effective_font(self):
+        """|EffectiveFont| object describing character properties in effect.
+
+        Unlike :attr:`font`, includes values this run inherits from its
+        paragraph and through the text-style hierarchy. Read-only.
+        """
+        r = self._r
+        return self.part.package.text_styles.effective_font(
+            self.part, r.getparent(), r.rPr
+        )
+
     @lazyproperty
     def hyperlink(self):
         """
@@ -42,7 +42,8 @@ LICENSE = license
 PACKAGES = find_packages(exclude=["tests", "tests.*"])
 PACKAGE_DATA = {"pptx": ["templates/*"]}
 
-INSTALL_REQUIRES = ["lxml>=3.1.0", "Pillow>=3.3.2", "XlsxWriter>=0.5.7"]
+INSTALL_REQUIRES = ["lxml>=3.1.0", "Pillow>=3.3.2"]
+EXTRAS_REQUIRE = {"xlsxwriter": ["XlsxWriter>=0.5.7"]}
 
 TEST_SUITE = "tests"
 TESTS_REQUIRE = ["behave", "mock", "pyparsing>=2.0.1", "pytest"]
@@ -78,6 +79,7 @@ params = {
     "packages": PACKAGES,
     "package_data": PACKAGE_DATA,
     "install_requires": INSTALL_REQUIRES,
+    "extras_require": EXTRAS_REQUIRE,
     "tests_require": TESTS_REQUIRE,
     "test_suite": TEST_SUITE,
     "classifiers": CLASSIFIERS,
@@ -0,0 +1,70 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.chart.cache` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+
+from pptx.chart import cache
+from pptx.chart.cache import ChartPayloadCache, get_payload_cache, set_payload_cache
+
+
+class DescribeChartPayloadCache(object):
+    """Unit-test suite for `pptx.chart.cache.ChartPayloadCache` objects."""
+
+    def it_returns_the_blob_stored_under_a_key(self):
+        payload_cache = ChartPayloadCache()
+        blob = b"foobar"
+
+        payload_cache.put("key", blob)
+
+        assert payload_cache.get("key") is blob
+        assert payload_cache.get("other") is None
+
+    def it_discards_the_least_recently_used_blob_beyond_its_max_size(self):
+        payload_cache = ChartPayloadCache(max_size=2)
+        payload_cache.put("a", b"1")
+        payload_cache.put("b", b"2")
+        payload_cache.get("a")
+
+        payload_cache.put("c", b"3")
+
+        assert len(payload_cache) == 2
+        assert payload_cache.get("b") is None
+        assert payload_cache.get("a") == b"1"
+        assert payload_cache.get("c") == b"3"
+
+    def it_can_keep_its_blobs_in_a_directory(self, tmpdir):
+        directory = os.path.join(str(tmpdir), "charts")
+        ChartPayloadCache(directory=directory).put("key", b"foobar")
+
+        payload_cache = ChartPayloadCache(max_size=1, directory=directory)
+
+        assert os.listdir(directory) == ["key"]
+        assert payload_cache.get("key") == b"foobar"
+        assert len(payload_cache) == 1
+
+    def it_can_clear_the_blobs_it_holds_in_memory(self, tmpdir):
+        payload_cache = ChartPayloadCache(directory=str(tmpdir))
+        payload_cache.put("key", b"foobar")
+
+        payload_cache.clear()
+
+        assert len(payload_cache) == 0
+        assert payload_cache.get("key") == b"foobar"
+
+
+class Describe_payload_cache(object):
+    """Unit-test suite for `get_payload_cache()` and `set_payload_cache()`."""
+
+    def it_has_no_payload_cache_by_default(self):
+        assert get_payload_cache() is None
+
+    def it_can_change_the_payload_cache_in_use(self, monkeypatch):
+        monkeypatch.setattr(cache, "_payload_cache", None)
+        payload_cache = ChartPayloadCache()
+
+        set_payload_cache(payload_cache)
+
+        assert get_payload_cache() is payload_cache
@@ -123,6 +123,33 @@ class DescribeChart(object):
         chart.chart_style = new_value
         assert chart._chartSpace.xml == expected_xml
 
+    @pytest.mark.parametrize(
+        "plot_cxml, expected_value",
+        (
+            ("c:barChart", []),
+            (
+                "c:barChart/c:ser/(c:idx{val=0},c:order{val=0},c:tx/c:strRef/c:strC"
+                'ache/c:pt{idx=0}/c:v"S1",c:cat/c:strRef/c:strCache/(c:ptCount{val='
+                '2},c:pt{idx=0}/c:v"a",c:pt{idx=1}/c:v"b"),c:val/c:numRef/c:numCache'
+                '/(c:ptCount{val=2},c:pt{idx=1}/c:v"2.5"))',
+                [(None, ("a", "b")), ("S1", (None, 2.5))],
+            ),
+            (
+                "c:bubbleChart/c:ser/(c:idx{val=0},c:order{val=0},c:tx/c:strRef/c:st"
+                'rCache/c:pt{idx=0}/c:v"S1",c:xVal/c:numRef/c:numCache/(c:ptCount{v'
+                'al=2},c:pt{idx=0}/c:v"1",c:pt{idx=1}/c:v"2"),c:yVal/c:numRef/c:numC'
+                'ache/(c:ptCount{val=2},c:pt{idx=0}/c:v"3",c:pt{idx=1}/c:v"4"),c:bub'
+                'bleSize/c:numRef/c:numCache/(c:ptCount{val=2},c:pt{idx=1}/c:v"6"))',
+                [(None, (1.0, 2.0)), ("S1", (3.0, 4.0)), ("Size", (None, 6.0))],
+            ),
+        ),
+    )
+    def it_can_read_its_data_as_columns(self, plot_cxml, expected_value):
+        chartSpace = element("c:chartSpace/c:chart/c:plotArea/%s" % plot_cxml)
+        chart = Chart(chartSpace, None)
+
+        assert chart.to_columns() == expected_value
+
     def it_can_replace_the_chart_data(self, replace_fixture):
         (
             chart,
@@ -139,7 +166,38 @@ class DescribeChart(object):
 
         SeriesXmlRewriterFactory_.assert_called_once_with(chart_type, chart_data_)
         rewriter_.replace_series_data.assert_called_once_with(chartSpace)
-        workbook_.update_from_xlsx_blob.assert_called_once_with(xlsx_blob)
+        workbook_.update_from_chart_data.assert_called_once_with(chart_data_, True)
+
+    @pytest.mark.parametrize(
+        "cells, cells_updated, replaced, workbook_rewritten",
+        (
+            ({"B2": 42.0}, True, False, False),
+            ({"B2": 42.0}, False, False, True),
+            (None, None, True, True),
+        ),
+    )
+    def it_can_replace_only_the_changed_chart_values(
+        self,
+        cells,
+        cells_updated,
+        replaced,
+        workbook_rewritten,
+        chart_data_,
+        SeriesXmlRewriterFactory_,
+        series_rewriter_,
+        workbook_,
+        workbook_prop_,
+    ):
+        chartSpace = element("c:chartSpace/c:chart/c:plotArea/c:pieChart")
+        chart = Chart(chartSpace, None)
+        series_rewriter_.update_series_values.return_value = cells
+        workbook_.update_cells.return_value = cells_updated
+
+        chart.replace_data(chart_data_, incremental=True)
+
+        series_rewriter_.update_series_values.assert_called_once_with(chartSpace)
+        assert series_rewriter_.replace_series_data.called is replaced
+        assert workbook_.update_from_chart_data.called is workbook_rewritten
 
     # fixtures -------------------------------------------------------
 
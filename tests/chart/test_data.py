@@ -6,10 +6,13 @@ Test suite for pptx.chart.data module
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import math
+from array import array
 from datetime import date, datetime
 
 import pytest
 
+from pptx.chart.cache import ChartPayloadCache
 from pptx.chart.data import (
     _BaseChartData,
     _BaseDataPoint,
@@ -23,12 +26,17 @@ from pptx.chart.data import (
     CategoryDataPoint,
     CategorySeriesData,
     ChartData,
+    ColumnarBubbleChartData,
+    ColumnarCategoryChartData,
+    ColumnarCategorySeriesData,
+    ColumnarXyChartData,
     XyChartData,
     XyDataPoint,
     XySeriesData,
 )
 from pptx.chart.xlsx import CategoryWorkbookWriter
 from pptx.enum.base import EnumValue
+from pptx.enum.chart import XL_CHART_TYPE
 
 from ..unitutil.mock import call, class_mock, instance_mock, property_mock
 
@@ -50,6 +58,106 @@ class Describe_BaseChartData(object):
         chart_data, expected_value = number_format_fixture
         assert chart_data.number_format == expected_value
 
+    def it_knows_the_index_and_data_point_offset_of_a_series(self):
+        chart_data = CategoryChartData()
+        series = [chart_data.add_series(name, (1, 2)) for name in ("A", "B", "C")]
+
+        assert [chart_data.series_index(s) for s in series] == [0, 1, 2]
+        assert [chart_data.data_point_offset(s) for s in series] == [0, 2, 4]
+
+        series[0].add_data_point(3)
+        series.append(chart_data.add_series("D", (4,)))
+
+        assert chart_data.series_index(series[3]) == 3
+        assert [chart_data.data_point_offset(s) for s in series] == [0, 3, 5, 7]
+
+    def but_it_raises_on_a_series_not_in_the_chart_data(self):
+        chart_data = CategoryChartData()
+        chart_data.add_series("A", (1, 2))
+        with pytest.raises(ValueError):
+            chart_data.series_index(CategorySeriesData(chart_data, "B", None))
+
+    def it_knows_its_xlsx_backend(self):
+        assert _BaseChartData().xlsx_backend == "native"
+        assert _BaseChartData(xlsx_backend="xlsxwriter").xlsx_backend == "xlsxwriter"
+
+    def but_it_raises_on_an_unknown_xlsx_backend(self):
+        with pytest.raises(ValueError):
+            _BaseChartData(xlsx_backend="openpyxl")
+
+    def it_reuses_the_blobs_of_the_same_content_from_the_payload_cache(
+        self, monkeypatch
+    ):
+        payload_cache = ChartPayloadCache()
+        monkeypatch.setattr("pptx.chart.cache._payload_cache", payload_cache)
+        chart_data, same_chart_data = CategoryChartData(), CategoryChartData()
+        for data in (chart_data, same_chart_data):
+            data.categories = ("Foo", "Bar")
+            data.add_series("S1", (1, 2), "0.0")
+        chart_type = XL_CHART_TYPE.COLUMN_CLUSTERED
+
+        xml_bytes = chart_data.xml_bytes(chart_type)
+        xlsx_blob = chart_data.xlsx_blob
+
+        assert same_chart_data.xml_bytes(chart_type) is xml_bytes
+        assert same_chart_data.xlsx_blob is xlsx_blob
+        assert chart_data.xml_bytes(XL_CHART_TYPE.BAR_CLUSTERED) != xml_bytes
+        assert len(payload_cache) == 3
+
+    @pytest.mark.parametrize(
+        "change",
+        (
+            lambda chart_data: chart_data[0].add_data_point(3),
+            lambda chart_data: chart_data.add_series("S2", (1, 2)),
+            lambda chart_data: setattr(chart_data[0], "_name", "S2"),
+            lambda chart_data: setattr(chart_data[0], "_number_format", "0%"),
+            lambda chart_data: setattr(chart_data, "_number_format", "0%"),
+            lambda chart_data: chart_data.add_category("Baz"),
+            lambda chart_data: setattr(chart_data.categories, "number_format", "@"),
+            lambda chart_data: [c.add_sub_category("x") for c in chart_data.categories],
+        ),
+    )
+    def it_keys_each_change_of_content_differently(self, change):
+        chart_data = CategoryChartData()
+        chart_data.categories = ("Foo", "Bar")
+        chart_data.add_series("S1", (1, 2))
+        key = chart_data._content_key("xml", 51)
+
+        change(chart_data)
+
+        assert chart_data._content_key("xml", 51) != key
+        assert chart_data._content_key("xlsx", "native") != key
+
+    def it_keys_the_version_of_python_pptx(self, monkeypatch):
+        chart_data = CategoryChartData()
+        chart_data.add_series("S1", (1, 2))
+        key = chart_data._content_key("xml", 51)
+
+        monkeypatch.setattr("pptx.chart.data.__version__", "99.0.0")
+
+        assert chart_data._content_key("xml", 51) != key
+
+    def it_keys_the_version_of_XlsxWriter_when_it_writes_the_workbook(
+        self, monkeypatch
+    ):
+        xlsxwriter = pytest.importorskip("xlsxwriter")
+        monkeypatch.setattr(xlsxwriter, "__version__", "0.0.1")
+
+        chart_data = CategoryChartData(xlsx_backend="xlsxwriter")
+
+        assert chart_data._xlsx_writer_id == "xlsxwriter 0.0.1"
+        assert CategoryChartData()._xlsx_writer_id == "native"
+
+    @pytest.mark.parametrize("ChartData_", (BubbleChartData, ColumnarBubbleChartData))
+    def it_keys_each_column_of_a_series(self, ChartData_):
+        def key(x, y, size):
+            chart_data = ChartData_()
+            chart_data.add_series("S1").add_data_point(x, y, size)
+            return chart_data._content_key("xml", 15)
+
+        assert len({key(1, 2, 3), key(0, 2, 3), key(1, 0, 3), key(1, 2, 0)}) == 4
+        assert key(1, 2, 3) == key(1, 2, 3)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[(None, "General"), (42, 42)])
@@ -175,6 +283,46 @@ class DescribeCategoryChartData(object):
         assert categories_.add_category.call_args_list == calls
         assert chart_data._categories is categories_
 
+    def it_can_downsample_its_categories_and_series(self):
+        chart_data = CategoryChartData()
+        chart_data.categories = ["a", "b", "c", "d", "e", "f", "g", "h"]
+        chart_data.add_series("S1", (1, 9, 2, 3, 4, 0, 5, 6))
+        chart_data.add_series("S2", (5, 5, 5, 7, 5, 5, 5, 5))
+
+        chart_data.downsample(4)
+
+        assert [c.label for c in chart_data.categories] == ["a", "b", "d", "f"]
+        assert [c.idx for c in chart_data.categories] == [0, 1, 2, 3]
+        assert [s.values for s in chart_data] == [[1, 9, 3, 0], [5, 5, 7, 5]]
+        assert chart_data.values_ref(chart_data[1]) == "Sheet1!$C$2:$C$5"
+
+    def but_it_leaves_few_enough_categories_alone(self):
+        chart_data = CategoryChartData()
+        chart_data.categories = ["a", "b", "c"]
+        chart_data.add_series("S1", (1, 2, 3))
+
+        chart_data.downsample(3)
+
+        assert chart_data[0].values == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "categories, values",
+        (
+            ((("a", ("a1", "a2")), ("b", ("b1", "b2"))), (1, 2, 3, 4)),
+            ((("a", ()), ("b", ()), ("c", ()), ("d", ())), (1, 2, 3)),
+        ),
+    )
+    def but_it_raises_on_categories_it_cannot_downsample(self, categories, values):
+        chart_data = CategoryChartData()
+        for label, sub_labels in categories:
+            category = chart_data.add_category(label)
+            for sub_label in sub_labels:
+                category.add_sub_category(sub_label)
+        chart_data.add_series("S1", values)
+
+        with pytest.raises(ValueError):
+            chart_data.downsample(3)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -310,6 +458,25 @@ class DescribeCategories(object):
         with pytest.raises(ValueError):
             categories.depth
 
+    def it_updates_its_hierarchy_as_categories_are_added(self):
+        categories = Categories()
+        foo = categories.add_category("Foo")
+        foo.add_sub_category("A")
+        assert (categories.depth, categories.leaf_count) == (2, 1)
+        assert list(categories.levels) == [[(0, "A")], [(0, "Foo")]]
+
+        foo.add_sub_category("B")
+        bar = categories.add_category("Bar")
+        bar.add_sub_category("C")
+
+        assert (categories.depth, categories.leaf_count) == (2, 3)
+        assert bar.idx == 2
+        assert bar.sub_categories[0].idx == 2
+        assert list(categories.levels) == [
+            [(0, "A"), (1, "B"), (2, "C")],
+            [(0, "Foo"), (2, "Bar")],
+        ]
+
     def it_can_add_a_category(self, add_fixture):
         categories, name, Category_, category_ = add_fixture
         category = categories.add_category(name)
@@ -756,6 +923,31 @@ class DescribeXyChartData(object):
         assert chart_data[-1] is series_data_
         assert series_data is series_data_
 
+    @pytest.mark.parametrize(
+        "method, expected_points",
+        (
+            ("lttb", [(0, 0), (1, 8), (4, 9), (5, 3)]),
+            ("min_max", [(0, 0), (1, 8), (3, 1), (4, 9)]),
+        ),
+    )
+    def it_can_downsample_its_series(self, method, expected_points):
+        chart_data = XyChartData()
+        series_data = chart_data.add_series("S1")
+        for x, y in ((0, 0), (1, 8), (2, 2), (3, 1), (4, 9), (5, 3)):
+            series_data.add_data_point(x, y)
+        short_series_data = chart_data.add_series("S2")
+        short_series_data.add_data_point(1, 2)
+
+        chart_data.downsample(4, method)
+
+        assert [(p.x, p.y) for p in series_data] == expected_points
+        assert len(short_series_data) == 1
+        assert chart_data.data_point_offset(short_series_data) == 4
+
+    def but_it_raises_on_an_unknown_downsample_method(self):
+        with pytest.raises(ValueError):
+            XyChartData().downsample(100, "average")
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -847,6 +1039,130 @@ class DescribeXySeriesData(object):
         )
 
 
+class DescribeColumnarCategoryChartData(object):
+    def it_can_add_a_series_from_a_column_of_values(self):
+        chart_data = ColumnarCategoryChartData()
+
+        series_data = chart_data.add_series("S1", [1, None, 2.5], "0.0")
+
+        assert isinstance(series_data, ColumnarCategorySeriesData)
+        assert chart_data[-1] is series_data
+        assert series_data.name == "S1"
+        assert series_data.number_format == "0.0"
+        assert isinstance(series_data.values, array)
+        assert len(series_data) == 3
+        assert series_data[0] == 1.0
+        assert math.isnan(series_data[1])
+        assert series_data[2] == 2.5
+
+    def it_can_add_a_series_from_a_numpy_array(self):
+        numpy = pytest.importorskip("numpy")
+        chart_data = ColumnarCategoryChartData()
+        values = numpy.ma.masked_array([1, 2, 3], mask=[False, True, False])
+
+        series_data = chart_data.add_series("S1", values)
+
+        assert series_data.values[0] == 1.0
+        assert math.isnan(series_data.values[1])
+        assert series_data.values[2] == 3.0
+
+    def it_can_add_a_value_to_a_series(self):
+        series_data = ColumnarCategorySeriesData(None, None, None, [1])
+
+        series_data.add_data_point(None)
+        series_data.add_data_point(2)
+
+        assert len(series_data) == 3
+        assert math.isnan(series_data[1])
+        assert series_data[2] == 2.0
+
+    def it_writes_no_point_for_a_blank_value(self):
+        chart_data = ColumnarCategoryChartData()
+        chart_data.categories = ["Foo", "Bar", "Baz"]
+        chart_data.add_series("S1", [1, None, 3])
+
+        xml = chart_data.xml_bytes(XL_CHART_TYPE.COLUMN_CLUSTERED).decode("utf-8")
+
+        assert '<c:pt idx="0"><c:v>1.0</c:v></c:pt>' in xml
+        assert '<c:pt idx="1"><c:v>' not in xml.split("<c:val>")[1]
+        assert '<c:pt idx="2"><c:v>3.0</c:v></c:pt>' in xml
+
+    def it_can_downsample_its_series(self):
+        chart_data = ColumnarCategoryChartData()
+        chart_data.categories = range(8)
+        series_data = chart_data.add_series("S1", [1, 9, 2, 3, None, 0, 5, 6])
+
+        chart_data.downsample(4)
+
+        assert [c.label for c in chart_data.categories] == [0, 1, 5, 7]
+        assert isinstance(series_data.values, array)
+        assert list(series_data.values) == [1.0, 9.0, 0.0, 6.0]
+
+
+class DescribeColumnarXyChartData(object):
+    def it_can_add_a_series_from_columns_of_values(self):
+        chart_data = ColumnarXyChartData()
+
+        series_data = chart_data.add_series("S1", [1, 2], [3, None])
+
+        assert chart_data[-1] is series_data
+        assert isinstance(series_data, XySeriesData)
+        assert list(series_data.x_values) == [1.0, 2.0]
+        assert series_data[0] == (1.0, 3.0)
+        assert math.isnan(series_data.y_values[1])
+
+    def it_can_add_a_data_point_to_a_series(self):
+        series_data = ColumnarXyChartData().add_series("S1")
+
+        series_data.add_data_point(1, 2)
+
+        assert len(series_data) == 1
+        assert series_data[0] == (1.0, 2.0)
+
+    def it_raises_on_columns_of_different_length(self):
+        with pytest.raises(ValueError):
+            ColumnarXyChartData().add_series("S1", [1, 2], [3])
+
+    def it_can_downsample_a_series(self):
+        chart_data = ColumnarXyChartData()
+        series_data = chart_data.add_series("S1", range(6), [0, 8, None, 1, 9, 0])
+
+        chart_data.downsample(4)
+
+        assert isinstance(series_data.x_values, array)
+        assert list(series_data.x_values) == [0.0, 1.0, 4.0, 5.0]
+        assert list(series_data.y_values) == [0.0, 8.0, 9.0, 0.0]
+
+
+class DescribeColumnarBubbleChartData(object):
+    def it_can_add_a_series_from_columns_of_values(self):
+        chart_data = ColumnarBubbleChartData()
+
+        series_data = chart_data.add_series("S1", [1, 2], [3, 4], [5, 6])
+        series_data.add_data_point(7, 8, 9)
+
+        assert chart_data[-1] is series_data
+        assert isinstance(series_data, BubbleSeriesData)
+        assert len(series_data) == 3
+        assert series_data[2] == (7.0, 8.0, 9.0)
+        assert list(series_data.bubble_sizes) == [5.0, 6.0, 9.0]
+
+    def it_raises_on_columns_of_different_length(self):
+        with pytest.raises(ValueError):
+            ColumnarBubbleChartData().add_series("S1", [1, 2], [3, 4], [5])
+
+    def it_can_downsample_a_series(self):
+        chart_data = ColumnarBubbleChartData()
+        series_data = chart_data.add_series(
+            "S1", range(5), [0, 8, 2, 9, 0], [10, 11, 12, 13, 14]
+        )
+
+        chart_data.downsample(4, "min_max")
+
+        assert list(series_data.x_values) == [0.0, 1.0, 3.0, 4.0]
+        assert list(series_data.bubble_sizes) == [10.0, 11.0, 13.0, 14.0]
+
+
 class DescribeCategoryDataPoint(object):
     def it_is_a__BaseDataPoint_object(self, series_data_):
         data_point = CategoryDataPoint(series_data_, 42, "#,##0.0")
@@ -0,0 +1,103 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.chart.downsample` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import random
+
+import pytest
+
+from pptx.chart import downsample
+from pptx.chart.downsample import lttb, min_max
+
+
+class DescribeLttb(object):
+    """Unit-test suite for `pptx.chart.downsample.lttb()`."""
+
+    def it_keeps_the_ends_and_the_point_of_each_bucket_with_the_largest_triangle(
+        self, numpy_or_not
+    ):
+        x_values = [0, 1, 2, 3, 4, 5]
+        y_values = [0, 8, 2, 1, 9, 3]
+
+        assert lttb(x_values, y_values, 4) == [0, 1, 4, 5]
+
+    def it_drops_the_points_having_a_blank_value(self, numpy_or_not):
+        x_values = [0, 1, None, 3, 4, 5]
+        y_values = [0, 8, 2, float("nan"), 9, 3]
+
+        assert lttb(x_values, y_values, 5) == [0, 1, 4, 5]
+
+    def it_chooses_the_same_points_with_or_without_numpy(self, monkeypatch):
+        pytest.importorskip("numpy")
+        rng = random.Random(42)
+        x_values = list(range(5000))
+        y_values = [rng.gauss(0, 1) for _ in x_values]
+        y_values[1234] = None
+
+        with_numpy = lttb(x_values, y_values, 200)
+        monkeypatch.setattr(downsample, "numpy", None)
+        without_numpy = lttb(x_values, y_values, 200)
+
+        assert len(with_numpy) == 200
+        assert with_numpy == without_numpy
+
+    def it_raises_on_too_few_max_points(self):
+        with pytest.raises(ValueError):
+            lttb([1, 2, 3], [1, 2, 3], 2)
+
+
+class DescribeMinMax(object):
+    """Unit-test suite for `pptx.chart.downsample.min_max()`."""
+
+    def it_keeps_the_minimum_and_maximum_of_each_column_in_each_bucket(
+        self, numpy_or_not
+    ):
+        columns = ([1, 9, 2, 3, 4, 0, 5, 6], [5, 5, 5, 7, 5, 5, 5, 5])
+
+        assert min_max(columns, 4) == [0, 1, 3, 5]
+
+    def it_keeps_the_first_point_of_a_bucket_of_blank_values(self, numpy_or_not):
+        column = [1, 2, None, float("nan"), None, 3, 4, 5]
+
+        assert min_max((column,), 7) == [0, 1, 2, 5, 7]
+
+    def it_keeps_every_point_when_there_are_few_enough(self, numpy_or_not):
+        assert min_max(([3, 1, 2],), 3) == [0, 1, 2]
+
+    def it_keeps_at_most_max_points_points(self, numpy_or_not):
+        columns = [[(i * 7 + j) % 11 for i in range(100)] for j in range(10)]
+
+        assert len(min_max(columns, 20)) <= 20
+        assert len(min_max(columns, 29)) <= 29
+
+    def it_raises_on_fewer_than_two_max_points_per_column(self, numpy_or_not):
+        columns = [list(range(100))] * 10
+
+        with pytest.raises(ValueError):
+            min_max(columns, 5)
+
+    def it_chooses_the_same_points_with_or_without_numpy(self, monkeypatch):
+        pytest.importorskip("numpy")
+        rng = random.Random(42)
+        columns = [[rng.gauss(0, 1) for _ in range(5000)] for _ in range(3)]
+        columns[1][10:400] = [float("nan")] * 390
+
+        with_numpy = min_max(columns, 300)
+        monkeypatch.setattr(downsample, "numpy", None)
+        without_numpy = min_max(columns, 300)
+
+        assert len(with_numpy) <= 300
+        assert with_numpy == without_numpy
+
+
+# fixtures -----------------------------------------------------------
+
+
+@pytest.fixture(params=["numpy", "python"])
+def numpy_or_not(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(downsample, "numpy", None)
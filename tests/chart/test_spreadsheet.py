@@ -0,0 +1,218 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.chart.spreadsheet` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+import zipfile
+from decimal import Decimal
+
+import pytest
+
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.chart.spreadsheet import _col_ref, _excel_serial, update_cells, Workbook
+from pptx.compat import BytesIO
+
+_SML_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+
+class DescribeWorkbook(object):
+    """Unit-test suite for `pptx.chart.spreadsheet.Workbook` objects."""
+
+    def it_writes_a_single_worksheet_package(self):
+        xlsx_file = BytesIO()
+        workbook = Workbook(xlsx_file, {"in_memory": True})
+        workbook.add_worksheet().write(0, 0, 42)
+
+        workbook.close()
+
+        names = zipfile.ZipFile(xlsx_file).namelist()
+        assert sorted(names) == [
+            "[Content_Types].xml",
+            "_rels/.rels",
+            "xl/_rels/workbook.xml.rels",
+            "xl/sharedStrings.xml",
+            "xl/styles.xml",
+            "xl/workbook.xml",
+            "xl/worksheets/sheet1.xml",
+        ]
+
+    def it_writes_a_cell_format_for_each_number_format(self):
+        xlsx_file = BytesIO()
+        workbook = Workbook(xlsx_file)
+        general = workbook.add_format({"num_format": "General"})
+        money = workbook.add_format({"num_format": '"$"0.00'})
+
+        workbook.close()
+
+        assert (general.xf_id, money.xf_id) == (1, 2)
+        assert workbook.add_format({"num_format": '"$"0.00'}).xf_id == 2
+        styles_xml = _part_xml(xlsx_file, "xl/styles.xml")
+        assert '<numFmt numFmtId="164" formatCode="&quot;$&quot;0.00"/>' in styles_xml
+        assert '<cellXfs count="3">' in styles_xml
+
+
+class DescribeWorksheet(object):
+    """Unit-test suite for `pptx.chart.spreadsheet.Worksheet` objects."""
+
+    def it_writes_each_kind_of_value_to_its_cell(self):
+        xlsx_file = BytesIO()
+        workbook = Workbook(xlsx_file)
+        worksheet = workbook.add_worksheet()
+        date_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+        worksheet.write_column(1, 0, ["a & b", "c", "a & b"])
+        worksheet.write_column(0, 1, (1.5, None, float("nan"), 3, True))
+        worksheet.write(2, 2, datetime.date(2020, 1, 1), date_format)
+        worksheet.write(3, 2, None, date_format)
+
+        workbook.close()
+
+        assert _part_xml(xlsx_file, "xl/worksheets/sheet1.xml").endswith(
+            "<sheetData>"
+            '<row r="1"><c r="B1"><v>1.5</v></c></row>'
+            '<row r="2"><c r="A2" t="s"><v>0</v></c></row>'
+            '<row r="3"><c r="A3" t="s"><v>1</v></c>'
+            '<c r="C3" s="1"><v>43831.0</v></c></row>'
+            '<row r="4"><c r="A4" t="s"><v>0</v></c><c r="B4"><v>3</v></c>'
+            '<c r="C4" s="1"/></row>'
+            '<row r="5"><c r="B5" t="b"><v>1</v></c></row>'
+            "</sheetData></worksheet>"
+        )
+        assert _part_xml(xlsx_file, "xl/sharedStrings.xml").endswith(
+            '<si><t xml:space="preserve">a &amp; b</t></si>'
+            '<si><t xml:space="preserve">c</t></si></sst>'
+        )
+
+    @pytest.mark.parametrize(
+        "values", ((1.5, float("inf")), (float("-inf"),), (Decimal("Infinity"),))
+    )
+    def but_it_raises_on_an_infinite_number(self, values):
+        workbook = Workbook(BytesIO())
+        workbook.add_worksheet().write_column(0, 0, values)
+
+        with pytest.raises(ValueError):
+            workbook.close()
+
+    def it_writes_no_cell_for_an_empty_column(self):
+        xlsx_file = BytesIO()
+        workbook = Workbook(xlsx_file)
+        worksheet = workbook.add_worksheet()
+        worksheet.write_column(1, 0, ["a", "b"])
+        worksheet.write_column(1, 1, [])
+        worksheet.write_column(5, 2, [])
+
+        workbook.close()
+
+        assert _part_xml(xlsx_file, "xl/worksheets/sheet1.xml").endswith(
+            "<sheetData>"
+            '<row r="2"><c r="A2" t="s"><v>0</v></c></row>'
+            '<row r="3"><c r="A3" t="s"><v>1</v></c></row>'
+            "</sheetData></worksheet>"
+        )
+
+    def it_writes_the_workbook_of_a_category_chart_having_an_empty_series(self):
+        chart_data = CategoryChartData()
+        chart_data.categories = ["a", "b", "c"]
+        chart_data.add_series("s1", [])
+
+        sheet_xml = _part_xml(BytesIO(chart_data.xlsx_blob), "xl/worksheets/sheet1.xml")
+
+        assert '<c r="B1" t="s"><v>' in sheet_xml
+        assert '<c r="A4" s="1" t="s"><v>3</v></c>' in sheet_xml
+        assert '<c r="B2"' not in sheet_xml
+
+    def it_writes_the_workbook_of_an_XY_chart_having_an_empty_series(self):
+        chart_data = XyChartData()
+        chart_data.add_series("x")
+
+        sheet_xml = _part_xml(BytesIO(chart_data.xlsx_blob), "xl/worksheets/sheet1.xml")
+
+        assert '<c r="B1" t="s"><v>0</v></c>' in sheet_xml
+        assert '<row r="2">' not in sheet_xml
+
+    def it_writes_the_column_widths(self):
+        xlsx_file = BytesIO()
+        workbook = Workbook(xlsx_file)
+        workbook.add_worksheet().set_column(1, 2, 10)
+
+        workbook.close()
+
+        assert (
+            '<cols><col min="2" max="2" width="10" customWidth="1"/>'
+            '<col min="3" max="3" width="10" customWidth="1"/></cols>'
+        ) in _part_xml(xlsx_file, "xl/worksheets/sheet1.xml")
+
+
+class Describe_update_cells(object):
+    """Unit-test suite for `pptx.chart.spreadsheet.update_cells()` function."""
+
+    def it_writes_the_numbers_to_their_cells(self):
+        xlsx_file = BytesIO()
+        workbook = Workbook(xlsx_file)
+        worksheet = workbook.add_worksheet()
+        worksheet.write_column(0, 0, ("x", 1, 2))
+        worksheet.write_column(1, 2, (3,), workbook.add_format({"num_format": "0"}))
+        workbook.close()
+
+        xlsx_blob = update_cells(
+            xlsx_file.getvalue(), {"A2": None, "A3": 2.5, "B2": 4, "C2": 5, "A5": 6}
+        )
+
+        assert _part_xml(BytesIO(xlsx_blob), "xl/worksheets/sheet1.xml").endswith(
+            "<sheetData>"
+            '<row r="1"><c r="A1" t="s"><v>0</v></c></row>'
+            '<row r="2"><c r="A2"/><c r="B2"><v>4.0</v></c>'
+            '<c r="C2" s="1"><v>5.0</v></c></row>'
+            '<row r="3"><c r="A3"><v>2.5</v></c></row>'
+            '<row r="5"><c r="A5"><v>6.0</v></c></row>'
+            "</sheetData></worksheet>"
+        )
+        assert _part_xml(BytesIO(xlsx_blob), "xl/styles.xml") == _part_xml(
+            xlsx_file, "xl/styles.xml"
+        )
+
+    def but_not_to_a_cell_having_a_formula(self):
+        xlsx_file = BytesIO()
+        with zipfile.ZipFile(xlsx_file, "w") as zip_file:
+            for name in ("xl/workbook.xml", "xl/_rels/workbook.xml.rels"):
+                zip_file.writestr(name, _package_xml(name))
+            zip_file.writestr(
+                "xl/worksheets/sheet1.xml",
+                '<worksheet xmlns="%s"><sheetData><row r="1"><c r="A1"><f>1+1</f>'
+                "<v>2</v></c></row></sheetData></worksheet>" % _SML_NS,
+            )
+
+        assert update_cells(xlsx_file.getvalue(), {"A1": 3}) is None
+
+
+@pytest.mark.parametrize(
+    "col, expected_value", ((0, "A"), (25, "Z"), (26, "AA"), (701, "ZZ"), (702, "AAA"))
+)
+def it_knows_the_letters_of_a_column(col, expected_value):
+    assert _col_ref(col) == expected_value
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    (
+        (datetime.date(1900, 1, 1), 1),
+        (datetime.date(1900, 2, 28), 59),
+        (datetime.date(1900, 3, 1), 61),
+        (datetime.datetime(2020, 1, 1, 12), 43831.5),
+    ),
+)
+def it_computes_the_serial_number_of_a_date(value, expected_value):
+    assert _excel_serial(value) == expected_value
+
+
+def _package_xml(name):
+    """Return the XML of part *name* in a workbook written by |Workbook|."""
+    xlsx_file = BytesIO()
+    Workbook(xlsx_file).close()
+    return _part_xml(xlsx_file, name)
+
+
+def _part_xml(xlsx_file, name):
+    """Return the XML of the part *name* in the package written to *xlsx_file*."""
+    return zipfile.ZipFile(xlsx_file).read(name).decode("utf-8")
@@ -11,11 +11,13 @@ import pytest
 from xlsxwriter import Workbook
 from xlsxwriter.worksheet import Worksheet
 
+from pptx.chart import spreadsheet
 from pptx.chart.data import (
     BubbleChartData,
     Categories,
     CategoryChartData,
     CategorySeriesData,
+    ColumnarXyChartData,
     XyChartData,
 )
 from pptx.chart.xlsx import (
@@ -52,6 +54,16 @@ class Describe_BaseWorkbookWriter(object):
             assert worksheet is worksheet_
         workbook_.close.assert_called_once_with()
 
+    @pytest.mark.parametrize(
+        "xlsx_backend, expected_value",
+        (("native", spreadsheet.Workbook), ("xlsxwriter", Workbook)),
+    )
+    def it_uses_the_workbook_of_the_xlsx_backend(self, xlsx_backend, expected_value):
+        workbook_writer = _BaseWorkbookWriter(
+            CategoryChartData(xlsx_backend=xlsx_backend)
+        )
+        assert workbook_writer._Workbook is expected_value
+
     def it_raises_on_no_override_of_populate(self, populate_fixture):
         workbook_writer = populate_fixture
         with pytest.raises(NotImplementedError):
@@ -61,7 +73,7 @@ class Describe_BaseWorkbookWriter(object):
 
     @pytest.fixture
     def open_fixture(self, xlsx_file_, workbook_, worksheet_, Workbook_):
-        workbook_writer = _BaseWorkbookWriter(None)
+        workbook_writer = _BaseWorkbookWriter(CategoryChartData())
         workbook_.add_worksheet.return_value = worksheet_
         return workbook_writer, xlsx_file_, workbook_, worksheet_, Workbook_
 
@@ -429,6 +441,19 @@ class DescribeXyWorkbookWriter(object):
         workbook_writer._populate_worksheet(workbook_, worksheet_)
         assert worksheet_.mock_calls == expected_calls
 
+    def it_writes_an_empty_cell_for_a_blank_columnar_value(self, workbook_, worksheet_):
+        chart_data = ColumnarXyChartData()
+        chart_data.add_series("Series 1", [1, 2], [None, 2.2])
+        workbook_writer = XyWorkbookWriter(chart_data)
+
+        workbook_writer._populate_worksheet(workbook_, worksheet_)
+
+        assert worksheet_.mock_calls == [
+            call.write_column(1, 0, [1.0, 2.0], ANY),
+            call.write(0, 1, "Series 1"),
+            call.write_column(1, 1, [None, 2.2], ANY),
+        ]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
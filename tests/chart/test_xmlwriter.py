@@ -620,6 +620,17 @@ class Describe_BubbleSeriesXmlRewriter(object):
         rewriter._rewrite_ser_data(ser, series_data, None)
         assert ser.xml == expected_xml
 
+    def it_can_update_only_the_changed_values(self):
+        chartSpace = _chartSpace(
+            XL_CHART_TYPE.BUBBLE, _bubble_data(((1, 2, 3), (4, 5, 6)))
+        )
+        rewriter = _BubbleSeriesXmlRewriter(_bubble_data(((1, 2, 3), (4, 5, 7))))
+
+        cells = rewriter.update_series_values(chartSpace)
+
+        assert cells == {"C3": 7}
+        assert chartSpace.plotArea.sers[0].bubbleSize.pt_values() == (3.0, 7.0)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -642,6 +653,35 @@ class Describe_CategorySeriesXmlRewriter(object):
         rewriter._rewrite_ser_data(ser, series_data, False)
         assert ser.xml == expected_xml
 
+    def it_can_update_only_the_changed_values(self):
+        chartSpace = _chartSpace(XL_CHART_TYPE.LINE, _category_data((1, 2, None, 4)))
+        rewriter = _CategorySeriesXmlRewriter(_category_data((1, 2.5, 3, None)))
+
+        cells = rewriter.update_series_values(chartSpace)
+
+        assert cells == {"B3": 2.5, "B4": 3, "B5": None}
+        val = chartSpace.plotArea.sers[0].val
+        assert val.pt_values() == (1.0, 2.5, 3.0, None)
+        assert [pt.idx for pt in val.xpath(".//c:pt")] == [0, 1, 2]
+
+    @pytest.mark.parametrize(
+        "values, kwargs",
+        (
+            ((1, 2, 3), {"series_name": "Series 2"}),
+            ((1, 2, 3), {"categories": ("a", "b", "d")}),
+            ((1, 2, 3, 4), {"categories": ("a", "b", "c", "d")}),
+            ((1, 2, 3), {"number_format": "0.0"}),
+            ((1, 2, 3), {"series_count": 2}),
+        ),
+    )
+    def but_not_when_more_than_the_values_changed(self, values, kwargs):
+        chartSpace = _chartSpace(XL_CHART_TYPE.LINE, _category_data((1, 2, 3)))
+        xml = chartSpace.xml
+        rewriter = _CategorySeriesXmlRewriter(_category_data(values, **kwargs))
+
+        assert rewriter.update_series_values(chartSpace) is None
+        assert chartSpace.xml == xml
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(
@@ -670,6 +710,20 @@ class Describe_XySeriesXmlRewriter(object):
         rewriter._rewrite_ser_data(ser, series_data, None)
         assert ser.xml == expected_xml
 
+    def it_can_update_only_the_changed_values(self):
+        chart_data = XyChartData()
+        chart_data.add_series("Series 1").add_data_point(1, 2)
+        chartSpace = _chartSpace(XL_CHART_TYPE.XY_SCATTER, chart_data)
+        chart_data = XyChartData()
+        chart_data.add_series("Series 1").add_data_point(42, 24)
+        rewriter = _XySeriesXmlRewriter(chart_data)
+
+        cells = rewriter.update_series_values(chartSpace)
+
+        assert cells == {"A2": 42, "B2": 24}
+        ser = chartSpace.plotArea.sers[0]
+        assert (ser.xVal.pt_values(), ser.yVal.pt_values()) == ((42.0,), (24.0,))
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -689,6 +743,45 @@ class Describe_XySeriesXmlRewriter(object):
 # helpers ------------------------------------------------------------
 
 
+def _bubble_data(points):
+    """
+    Return a |BubbleChartData| object having one series of *points*, each an
+    `(x, y, size)` tuple.
+    """
+    chart_data = BubbleChartData()
+    series_data = chart_data.add_series("Series 1")
+    for x, y, size in points:
+        series_data.add_data_point(x, y, size)
+    return chart_data
+
+
+def _category_data(
+    values,
+    categories=("a", "b", "c"),
+    series_name="Series 1",
+    number_format="General",
+    series_count=1,
+):
+    """
+    Return a |CategoryChartData| object having *categories* and a series
+    of *values* named *series_name*, followed by `series_count - 1` more.
+    """
+    chart_data = CategoryChartData(number_format)
+    chart_data.categories = categories
+    chart_data.add_series(series_name, values)
+    for idx in range(1, series_count):
+        chart_data.add_series("Series %d" % (idx + 1), values)
+    return chart_data
+
+
+def _chartSpace(chart_type, chart_data):
+    """
+    Return the `c:chartSpace` element of a chart of *chart_type* depicting
+    *chart_data*.
+    """
+    return parse_xml(ChartXmlWriter(chart_type, chart_data).xml.encode("utf-8"))
+
+
 def make_bubble_chart_data(ser_count, point_count):
     """
     Return an |BubbleChartData| object populated with *ser_count* series,
@@ -0,0 +1,8 @@
+# encoding: utf-8
+
+"""pytest configuration for the unit-test suite."""
+
+import sys
+
+# ---`async def` syntax of these modules does not compile on Python 2---
+collect_ignore = ["test_aio.py"] if sys.version_info < (3, 5) else []
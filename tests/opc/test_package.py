@@ -8,6 +8,7 @@ from __future__ import absolute_import
 
 import pytest
 
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.oxml import CT_Relationships
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.package import (
@@ -16,6 +17,7 @@ from pptx.opc.package import (
     PartFactory,
     _Relationship,
     RelationshipCollection,
+    _RelationshipSourceIndex,
     Unmarshaller,
     XmlPart,
 )
@@ -110,6 +112,52 @@ class DescribeOpcPackage(object):
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(pkg_file_, pkg._rels, parts_)
 
+    def it_can_take_a_snapshot(self, PackageWriter_, parts, parts_):
+        pkg = OpcPackage()
+
+        snapshot = pkg.snapshot()
+
+        for part in parts_:
+            part.before_marshal.assert_called_once_with()
+        PackageWriter_.snapshot.assert_called_once_with(pkg._rels, parts_)
+        assert snapshot is PackageWriter_.snapshot.return_value
+
+    def it_can_load_a_snapshot(self, request, PartFactory_, Unmarshaller_):
+        SnapshotReader_ = class_mock(request, "pptx.opc.package.SnapshotReader")
+        snapshot_reader = SnapshotReader_.from_snapshot.return_value
+
+        pkg = OpcPackage.from_snapshot(b"snapshot")
+
+        SnapshotReader_.from_snapshot.assert_called_once_with(b"snapshot")
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            snapshot_reader, pkg, PartFactory_
+        )
+        assert isinstance(pkg, OpcPackage)
+
+    def it_restores_an_equivalent_package_from_a_snapshot(self):
+        package = Package.open("tests/test_files/test.pptx")
+
+        copy = Package.from_snapshot(package.snapshot())
+
+        def rels(pkg):
+            return sorted(
+                (
+                    source.partname,
+                    rel.rId,
+                    rel.reltype,
+                    rel.target_ref if rel.is_external else rel.target_part.partname,
+                )
+                for source in pkg.iter_parts()
+                for rel in source.rels.values()
+            )
+
+        assert isinstance(copy, Package)
+        assert sorted((p.partname, p.content_type, p.blob) for p in copy.parts) == (
+            sorted((p.partname, p.content_type, p.blob) for p in package.parts)
+        )
+        assert rels(copy) == rels(package)
+        assert copy.presentation_part is not package.presentation_part
+
     def it_can_be_notified_after_unmarshalling_is_complete(self, pkg):
         pkg.after_unmarshal()
 
@@ -389,7 +437,7 @@ class DescribePartRelationshipManagementInterface(object):
     def it_provides_access_to_its_relationships(self, rels_fixture):
         part, Relationships_, partname_, rels_ = rels_fixture
         rels = part.rels
-        Relationships_.assert_called_once_with(partname_.baseURI)
+        Relationships_.assert_called_once_with(partname_.baseURI, part)
         assert rels is rels_
 
     def it_can_load_a_relationship(self, load_rel_fixture):
@@ -753,6 +801,49 @@ class DescribeRelationshipCollection(object):
         assert rels[rId] == rel
         assert rel == _Relationship_.return_value
 
+    def it_keeps_the_package_index_of_relationship_sources_current(self):
+        package = OpcPackage()
+        source = Part(PackURI("/ppt/slides/slide1.xml"), None, package=package)
+        target = Part(PackURI("/ppt/slideLayouts/slideLayout1.xml"), None)
+        rels = RelationshipCollection(source.partname.baseURI, source)
+
+        rels.add_relationship(RT.SLIDE_LAYOUT, target, "rId1")
+        rels.add_relationship(RT.SLIDE_LAYOUT, target, "rId2")
+        rels.add_relationship(RT.HYPERLINK, "http://x.com", "rId3", True)
+        assert package.parts_related_to(target, RT.SLIDE_LAYOUT) == [source]
+        assert package.parts_related_by_type(RT.SLIDE_LAYOUT) == [target]
+
+        del rels["rId1"]
+        assert package.parts_related_to(target, RT.SLIDE_LAYOUT) == [source]
+        del rels["rId2"]
+        del rels["rId3"]
+        assert package.parts_related_to(target, RT.SLIDE_LAYOUT) == []
+        assert package.parts_related_by_type(RT.SLIDE_LAYOUT) == []
+        assert rels.related_parts == {}
+
+    def it_finds_a_matching_relationship_as_the_collection_changes(self):
+        target, other_target = Part(None, None), Part(None, None)
+        rels = RelationshipCollection("/ppt/slides")
+        rels.add_relationship(RT.IMAGE, target, "rId1")
+        rels.add_relationship(RT.IMAGE, target, "rId2")
+
+        assert rels.get_or_add(RT.IMAGE, target).rId == "rId1"
+        del rels["rId1"]
+        assert rels.get_or_add(RT.IMAGE, target).rId == "rId2"
+        rels.add_relationship(RT.IMAGE, other_target, "rId2")
+        assert rels.get_or_add(RT.IMAGE, target).rId == "rId1"
+
+    def it_reuses_the_lowest_rId_freed_by_a_deletion(self):
+        rels = RelationshipCollection("/ppt/slides")
+        for _ in range(4):
+            rels.get_or_add(RT.IMAGE, Part(None, None))
+        assert rels._next_rId == "rId5"
+
+        del rels["rId2"]
+        assert rels._next_rId == "rId2"
+        rels.get_or_add(RT.IMAGE, Part(None, None))
+        assert rels._next_rId == "rId5"
+
     def it_can_add_an_external_relationship(self, add_ext_rel_fixture_):
         rels, reltype, url = add_ext_rel_fixture_
         rId = rels.get_or_add_ext_rel(reltype, url)
@@ -845,6 +936,56 @@ class DescribeRelationshipCollection(object):
         return "https://github.com/scanny/python-pptx"
 
 
+class Describe_RelationshipSourceIndex(object):
+    """Unit-test suite for `pptx.opc.package._RelationshipSourceIndex` object."""
+
+    def it_maps_a_target_and_reltype_to_its_sources(self):
+        index = _RelationshipSourceIndex()
+        index.add("source_1", "target", "reltype")
+        index.add("source_2", "target", "reltype")
+        index.add("source_3", "target", "other_reltype")
+        assert sorted(index.sources("target", "reltype")) == ["source_1", "source_2"]
+        assert index.sources("other_target", "reltype") == []
+
+    def it_maps_a_reltype_to_its_targets(self):
+        index = _RelationshipSourceIndex()
+        index.add("source_1", "target_1", "reltype")
+        index.add("source_2", "target_1", "reltype")
+        index.add("source_2", "target_2", "reltype")
+
+        assert sorted(index.targets("reltype")) == ["target_1", "target_2"]
+        index.remove("source_1", "target_1", "reltype")
+        assert sorted(index.targets("reltype")) == ["target_1", "target_2"]
+        index.remove("source_2", "target_1", "reltype")
+        assert index.targets("reltype") == ["target_2"]
+        assert index.targets("other_reltype") == []
+
+    def it_counts_repeated_relationships_from_a_source(self):
+        index = _RelationshipSourceIndex()
+        index.add("source", "target", "reltype")
+        index.add("source", "target", "reltype")
+
+        index.remove("source", "target", "reltype")
+        assert index.sources("target", "reltype") == ["source"]
+        index.remove("source", "target", "reltype")
+        assert index.sources("target", "reltype") == []
+        index.remove("source", "target", "reltype")
+        assert index._source_counts == {}
+
+    def it_changes_its_version_when_a_relationship_is_added_or_removed(self):
+        index = _RelationshipSourceIndex()
+        versions = [index.version]
+        index.add("source", "target", "reltype")
+        versions.append(index.version)
+        index.remove("source", "target", "reltype")
+        versions.append(index.version)
+        index.remove("source", "target", "reltype")
+        versions.append(index.version)
+
+        assert len(set(versions)) == 3
+        assert versions[2] == versions[3]
+
+
 class DescribeUnmarshaller(object):
     def it_can_unmarshal_from_a_pkg_reader(
         self,
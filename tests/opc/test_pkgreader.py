@@ -6,9 +6,16 @@ Test suite for opc.pkgreader module
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import pickle
+import struct
+
 import pytest
 
-from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import (
+    CONTENT_TYPE as CT,
+    RELATIONSHIP_TARGET_MODE as RTM,
+    RELATIONSHIP_TYPE as RT,
+)
 from pptx.opc.oxml import CT_Relationship
 from pptx.opc.packuri import PackURI
 from pptx.opc.phys_pkg import _ZipPkgReader
@@ -18,7 +25,10 @@ from pptx.opc.pkgreader import (
     _SerializedPart,
     _SerializedRelationship,
     _SerializedRelationshipCollection,
+    SnapshotReader,
 )
+from pptx.opc.pkgwriter import PackageWriter
+from pptx.opc.shared import SNAPSHOT_FORMAT
 
 from .unitdata.types import a_Default, a_Types, an_Override
 from ..unitutil.mock import (
@@ -215,6 +225,73 @@ class DescribePackageReader(object):
         assert retval == srels
 
 
+class DescribeSnapshotReader(object):
+    """Unit-test suite for `pptx.opc.pkgreader.SnapshotReader` object."""
+
+    def it_provides_access_to_the_contents_of_a_snapshot(self):
+        snapshot = _snapshot(
+            [("rId1", RT.OFFICE_DOCUMENT, "/ppt/presentation.xml", False)],
+            [
+                (
+                    "/ppt/presentation.xml",
+                    CT.PML_PRESENTATION_MAIN,
+                    b"<foo/>",
+                    [("rId2", RT.HYPERLINK, "http://x.com", True)],
+                )
+            ],
+        )
+
+        snapshot_reader = SnapshotReader.from_snapshot(snapshot)
+        sparts = list(snapshot_reader.iter_sparts())
+        srels = list(snapshot_reader.iter_srels())
+
+        assert sparts == [
+            ("/ppt/presentation.xml", CT.PML_PRESENTATION_MAIN, b"<foo/>")
+        ]
+        assert isinstance(sparts[0][0], PackURI)
+        assert [(source_uri, srel.rId) for source_uri, srel in srels] == [
+            ("/", "rId1"),
+            ("/ppt/presentation.xml", "rId2"),
+        ]
+        pkg_srel, part_srel = srels[0][1], srels[1][1]
+        assert pkg_srel.reltype == RT.OFFICE_DOCUMENT
+        assert pkg_srel.is_external is False
+        assert pkg_srel.target_partname == PackURI("/ppt/presentation.xml")
+        assert part_srel.is_external is True
+        assert part_srel.target_ref == "http://x.com"
+
+    @pytest.mark.parametrize(
+        "snapshot",
+        (
+            b"foobar",
+            "python-pptx package snapshot 2\n",
+            pickle.dumps((SNAPSHOT_FORMAT, [], [])),
+            b"python-pptx package snapshot 1\n" + struct.pack(">II", 0, 0),
+        ),
+    )
+    def but_it_raises_on_data_that_is_not_a_snapshot(self, snapshot):
+        with pytest.raises(ValueError) as e:
+            SnapshotReader.from_snapshot(snapshot)
+        assert str(e.value) == "not a python-pptx package snapshot"
+
+    @pytest.mark.parametrize(
+        "cut",
+        (
+            lambda snapshot: snapshot[:-1],
+            lambda snapshot: snapshot + b"\0",
+            lambda snapshot: snapshot[:-14] + struct.pack(">I", 999) + b"<foo/>",
+            lambda snapshot: snapshot.replace(b"/ppt", b"/\xffpt"),
+        ),
+    )
+    def and_it_raises_on_a_damaged_snapshot(self, cut):
+        snapshot = _snapshot([], [("/ppt/foo.xml", CT.XML, b"<foo/>", [])])
+        SnapshotReader.from_snapshot(snapshot)
+
+        with pytest.raises(ValueError) as e:
+            SnapshotReader.from_snapshot(cut(snapshot))
+        assert str(e.value) == "damaged python-pptx package snapshot"
+
+
 class Describe_ContentTypeMap(object):
     def it_can_construct_from_ct_item_xml(self, from_xml_fixture):
         content_types_xml, expected_defaults, expected_overrides = from_xml_fixture
@@ -430,3 +507,29 @@ class Describe_SerializedRelationshipCollection(object):
     @pytest.fixture
     def _SerializedRelationship_(self, request):
         return class_mock(request, "pptx.opc.pkgreader._SerializedRelationship")
+
+
+def _snapshot(pkg_rels_data, parts_data):
+    """Return snapshot bytes written by `PackageWriter.snapshot()` for the data.
+
+    *pkg_rels_data* is a list of `(rId, reltype, target, is_external)` tuples
+    and *parts_data* a list of `(partname, content_type, blob, rels_data)`.
+    """
+
+    def rels(rels_data):
+        return {
+            rId: Mock(
+                rId=rId,
+                reltype=reltype,
+                target_ref=target,
+                is_external=is_external,
+                target_part=Mock(partname=target),
+            )
+            for rId, reltype, target, is_external in rels_data
+        }
+
+    parts = [
+        Mock(partname=partname, content_type=content_type, blob=blob, _rels=rels(r))
+        for partname, content_type, blob, r in parts_data
+    ]
+    return PackageWriter.snapshot(rels(pkg_rels_data), parts)
@@ -17,6 +17,17 @@ class DescribeCT_SlideIdList(object):
         sldIdLst.add_sldId("rId1")
         assert sldIdLst.xml == expected_xml
 
+    def it_can_add_several_sldId_elements_at_once(self):
+        sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId4,id=300}")
+
+        sldIds = sldIdLst.add_sldIds(["rId1", "rId2"])
+
+        assert [sldId.id for sldId in sldIds] == [301, 302]
+        assert sldIdLst.xml == xml(
+            "p:sldIdLst/(p:sldId{r:id=rId4,id=300},p:sldId{id=301,r:id=rId1},p:sldI"
+            "d{id=302,r:id=rId2})"
+        )
+
     def it_knows_the_next_available_slide_id(self, next_id_fixture):
         sldIdLst, expected_id = next_id_fixture
         assert sldIdLst._next_id == expected_id
@@ -44,3 +55,14 @@ class DescribeCT_SlideIdList(object):
         sldIdLst_cxml, expected_value = request.param
         sldIdLst = element(sldIdLst_cxml)
         return sldIdLst, expected_value
+
+
+class DescribeCT_SlideMasterIdList(object):
+    def it_can_add_a_sldMasterId_element_as_a_child(self):
+        sldMasterIdLst = element("p:sldMasterIdLst")
+
+        sldMasterId = sldMasterIdLst.add_sldMasterId(2147483660, "rId3")
+
+        assert sldMasterIdLst.sldMasterId_lst == [sldMasterId]
+        assert sldMasterId.id == 2147483660
+        assert sldMasterId.rId == "rId3"
@@ -10,6 +10,7 @@ import pytest
 
 from pptx.oxml.theme import CT_OfficeStyleSheet
 
+from ..unitutil.cxml import element
 from ..unitutil.file import snippet_text
 
 
@@ -19,6 +20,18 @@ class DescribeCT_OfficeStyleSheet(object):
         theme = CT_OfficeStyleSheet.new_default()
         assert theme.xml == expected_xml
 
+    def it_maps_theme_font_references_to_typefaces(self):
+        theme = element(
+            "a:theme/a:themeElements/a:fontScheme/(a:majorFont/(a:latin{typeface=Ca"
+            "mbria},a:ea),a:minorFont/(a:latin{typeface=Calibri},a:cs{typeface=Aria"
+            "l}))"
+        )
+        assert theme.font_typefaces == {
+            "+mj-lt": "Cambria",
+            "+mn-lt": "Calibri",
+            "+mn-cs": "Arial",
+        }
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -6,13 +6,18 @@ Test suite for pptx.parts.chart module.
 
 from __future__ import absolute_import, print_function
 
+import zipfile
+
 import pytest
 
 from pptx.chart.chart import Chart
-from pptx.chart.data import ChartData
+from pptx.chart.data import CategoryChartData, ChartData
+from pptx.compat import BytesIO
+from pptx.dml.color import RGBColor
 from pptx.enum.base import EnumValue
+from pptx.enum.chart import XL_CHART_TYPE
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
-from pptx.opc.package import OpcPackage
+from pptx.opc.package import OpcPackage, Part
 from pptx.opc.packuri import PackURI
 from pptx.oxml.chart.chart import CT_ChartSpace
 from pptx.parts.chart import ChartPart, ChartWorkbook
@@ -26,7 +31,7 @@ class DescribeChartPart(object):
     def it_can_construct_from_chart_type_and_data(self, new_fixture):
         chart_type_, chart_data_, package_ = new_fixture[:3]
         partname_template, load_, partname_ = new_fixture[3:6]
-        content_type, chart_blob_, chart_part_, xlsx_blob_ = new_fixture[6:]
+        content_type, chart_blob_, chart_part_ = new_fixture[6:]
 
         chart_part = ChartPart.new(chart_type_, chart_data_, package_)
 
@@ -34,9 +39,47 @@ class DescribeChartPart(object):
         package_.next_partname.assert_called_once_with(partname_template)
         load_.assert_called_once_with(partname_, content_type, chart_blob_, package_)
         chart_workbook_ = chart_part_.chart_workbook
-        chart_workbook_.update_from_xlsx_blob.assert_called_once_with(xlsx_blob_)
+        chart_workbook_.update_from_chart_data.assert_called_once_with(
+            chart_data_, True
+        )
         assert chart_part is chart_part_
 
+    def it_can_construct_from_a_template_chart(self):
+        package = OpcPackage()
+        template_part = ChartPart.new(
+            XL_CHART_TYPE.COLUMN_CLUSTERED, _chart_data(), package
+        )
+        template_chart = template_part.chart
+        template_chart.has_title = True
+        fill = template_chart.series[0].format.fill
+        fill.solid()
+        fill.fore_color.rgb = RGBColor(0x12, 0x34, 0x56)
+        drawing_part = Part(PackURI("/ppt/drawings/drawing1.xml"), None, b"foo")
+        rId = template_part.relate_to(drawing_part, RT.CHART_USER_SHAPES)
+        chart_data = CategoryChartData()
+        chart_data.categories = ("a", "b", "c")
+        chart_data.add_series("Series A", (4, 5, 6))
+        chart_data.add_series("Series B", (7, 8, 9))
+
+        chart_part = ChartPart.new_from(template_chart, chart_data, package)
+
+        chart = chart_part.chart
+        assert chart_part is not template_part
+        assert chart.has_title is True
+        assert [s.name for s in chart.series] == ["Series A", "Series B"]
+        assert chart.series[1].values == (7.0, 8.0, 9.0)
+        assert [s.format.fill.fore_color.rgb for s in chart.series] == [
+            RGBColor(0x12, 0x34, 0x56)
+        ] * 2
+        xlsx_part = chart_part.chart_workbook.xlsx_part
+        assert xlsx_part is not template_part.chart_workbook.xlsx_part
+        assert xlsx_part.blob == chart_data.xlsx_blob
+        drawing_copy = chart_part.related_parts[rId]
+        assert drawing_copy is not drawing_part
+        assert drawing_copy.blob == b"foo"
+        assert template_chart.series[0].values == (1.0, 2.0)
+        assert len(template_chart.series) == 1
+
     def it_provides_access_to_the_chart_object(self, chart_fixture):
         chart_part, chart_, Chart_ = chart_fixture
         chart = chart_part.chart
@@ -66,7 +109,6 @@ class DescribeChartPart(object):
         partname_,
         chart_blob_,
         chart_part_,
-        xlsx_blob_,
     ):
         partname_template = "/ppt/charts/chart%d.xml"
         content_type = CT.DML_CHART
@@ -80,7 +122,6 @@ class DescribeChartPart(object):
             content_type,
             chart_blob_,
             chart_part_,
-            xlsx_blob_,
         )
 
     @pytest.fixture
@@ -177,6 +218,73 @@ class DescribeChartWorkbook(object):
         chart_data.update_from_xlsx_blob(xlsx_blob_)
         assert chart_data.xlsx_part.blob is xlsx_blob_
 
+    def it_can_update_cells_of_the_workbook_in_place(self):
+        chart_workbook = _new_chart_workbook()
+        chart_workbook.update_from_chart_data(_chart_data())
+        xlsx_part = chart_workbook.xlsx_part
+
+        assert chart_workbook.update_cells({"B3": 42.0}) is True
+
+        assert chart_workbook.xlsx_part is xlsx_part
+        sheet_xml = zipfile.ZipFile(BytesIO(xlsx_part.blob)).read(
+            "xl/worksheets/sheet1.xml"
+        )
+        assert b'<c r="B3" s="1"><v>42.0</v></c>' in sheet_xml
+
+    def but_not_when_there_is_no_workbook(self):
+        chart_workbook = _new_chart_workbook()
+        assert chart_workbook.update_cells({"B3": 42.0}) is False
+
+    def it_embeds_the_workbook_of_chart_data_right_away_by_default(self):
+        chart_workbook = _new_chart_workbook()
+        chart_data = _chart_data()
+
+        chart_workbook.update_from_chart_data(chart_data)
+
+        xlsx_part = chart_workbook.xlsx_part
+        assert isinstance(xlsx_part, EmbeddedXlsxPart)
+        assert xlsx_part._blob == chart_data.xlsx_blob
+
+    def it_can_defer_the_workbook_of_chart_data_until_it_is_read(self):
+        chart_workbook = _new_chart_workbook()
+        chart_data = _chart_data()
+
+        chart_workbook.update_from_chart_data(chart_data, "lazy")
+
+        xlsx_part = chart_workbook.xlsx_part
+        assert xlsx_part._blob is None
+        assert xlsx_part.blob == chart_data.xlsx_blob
+        assert xlsx_part._chart_data is None
+
+    def and_it_replaces_a_loaded_workbook_part_to_defer_it(self):
+        chart_workbook = _new_chart_workbook()
+        chart_workbook.xlsx_part = Part(
+            PackURI("/ppt/embeddings/Microsoft_Excel_Sheet9.xlsx"),
+            CT.SML_SHEET,
+            b"loaded",
+            chart_workbook._package,
+        )
+
+        chart_workbook.update_from_chart_data(_chart_data(), "lazy")
+
+        assert isinstance(chart_workbook.xlsx_part, EmbeddedXlsxPart)
+        assert len(chart_workbook._chart_part.rels) == 1
+
+    def it_can_remove_the_workbook(self):
+        chart_workbook = _new_chart_workbook()
+        chart_workbook.update_from_chart_data(_chart_data())
+
+        chart_workbook.update_from_chart_data(_chart_data(), False)
+
+        assert chart_workbook.xlsx_part is None
+        assert chart_workbook._chartSpace.externalData is None
+        assert len(chart_workbook._chart_part.rels) == 0
+
+    def but_it_raises_on_an_unknown_embed_workbook_value(self):
+        chart_workbook = _new_chart_workbook()
+        with pytest.raises(ValueError):
+            chart_workbook.update_from_chart_data(_chart_data(), "later")
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -268,3 +376,22 @@ class DescribeChartWorkbook(object):
     @pytest.fixture
     def xlsx_part_prop_(self, request, xlsx_part_):
         return property_mock(request, ChartWorkbook, "xlsx_part")
+
+
+# helpers ------------------------------------------------------------
+
+
+def _chart_data():
+    """Return a |CategoryChartData| object having a single series."""
+    chart_data = CategoryChartData()
+    chart_data.categories = ("foo", "bar")
+    chart_data.add_series("Series 1", (1, 2))
+    return chart_data
+
+
+def _new_chart_workbook():
+    """Return the |ChartWorkbook| of a new pie chart part in a new package."""
+    chart_part = ChartPart.new(
+        XL_CHART_TYPE.PIE, _chart_data(), OpcPackage(), embed_workbook=False
+    )
+    return chart_part.chart_workbook
@@ -8,18 +8,26 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+import pptx
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
-from pptx.parts.presentation import PresentationPart
+from pptx.parts.presentation import PresentationPart, _SlideIdIndex, _SlideImporter
 from pptx.parts.slide import NotesMasterPart, SlidePart
 from pptx.presentation import Presentation
 from pptx.slide import NotesMaster, Slide, SlideLayout, SlideMaster
 
 from ..unitutil.cxml import element
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
 
+test_image_path = absjoin(test_file_dir, "python-icon.jpeg")
+
+P14_NSDECL = 'xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main"'
+
 
 class DescribePresentationPart(object):
     def it_provides_access_to_its_presentation(self, prs_fixture):
@@ -101,6 +109,34 @@ class DescribePresentationPart(object):
         assert rId is rId_
         assert slide is slide_
 
+    def it_can_duplicate_a_slide(
+        self, request, slide_part_, _next_slide_partname_prop_, relate_to_
+    ):
+        slide_copy_ = instance_mock(request, SlidePart)
+        slide_part_.duplicate.return_value = slide_copy_
+        relate_to_.return_value = "rId9"
+        prs_part = PresentationPart(None, None, None)
+
+        rId, slide = prs_part.duplicate_slide(slide_part_)
+
+        slide_part_.duplicate.assert_called_once_with(
+            _next_slide_partname_prop_.return_value
+        )
+        relate_to_.assert_called_once_with(prs_part, slide_copy_, RT.SLIDE)
+        assert rId == "rId9"
+        assert slide is slide_copy_.slide
+
+    def it_can_import_slides(self, request):
+        _SlideImporter_ = class_mock(request, "pptx.parts.presentation._SlideImporter")
+        _SlideImporter_.return_value.import_slides.return_value = [("rId8", 42)]
+        prs_part = PresentationPart(None, None, None)
+
+        slide_pairs = prs_part.import_slides(["a", "b"])
+
+        _SlideImporter_.assert_called_once_with(prs_part)
+        _SlideImporter_.return_value.import_slides.assert_called_once_with(["a", "b"])
+        assert slide_pairs == [("rId8", 42)]
+
     def it_finds_the_slide_id_of_a_slide_part(self, slide_id_fixture):
         prs_part, slide_part_, expected_value = slide_id_fixture
         _slide_id = prs_part.slide_id(slide_part_)
@@ -111,6 +147,22 @@ class DescribePresentationPart(object):
         with pytest.raises(ValueError):
             prs_part.slide_id(slide_part_)
 
+    @pytest.mark.parametrize("slide_idx", (1, None))
+    def it_knows_the_position_of_a_slide_part(self, request, slide_part_, slide_idx):
+        _SlideIdIndex_ = class_mock(request, "pptx.parts.presentation._SlideIdIndex")
+        idx_for_part_ = _SlideIdIndex_.return_value.idx_for_part
+        idx_for_part_.return_value = slide_idx
+        prs_part = PresentationPart(None, None, None)
+
+        if slide_idx is None:
+            with pytest.raises(ValueError):
+                prs_part.slide_idx(slide_part_)
+        else:
+            assert prs_part.slide_idx(slide_part_) == slide_idx
+
+        _SlideIdIndex_.assert_called_once_with(prs_part)
+        idx_for_part_.assert_called_once_with(slide_part_)
+
     def it_finds_a_slide_by_slide_id(self, get_slide_fixture):
         prs_part, slide_id, expected_value = get_slide_fixture
         slide = prs_part.get_slide(slide_id)
@@ -120,6 +172,130 @@ class DescribePresentationPart(object):
         prs_part, partname = next_fixture
         assert prs_part._next_slide_partname == partname
 
+    def but_it_skips_partnames_in_use_after_a_slide_is_deleted(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+        prs_part.delete_slide(slide_parts[0])
+        assert prs_part._next_slide_partname == PackURI("/ppt/slides/slide4.xml")
+
+    def it_can_delete_a_slide(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+
+        prs_part.delete_slide(slide_parts[1])
+
+        prs_elm = prs_part._element
+        assert prs_elm.xpath("./p:sldIdLst/p:sldId/@r:id") == ["rId1", "rId3"]
+        assert prs_elm.xpath(".//p:custShow//p:sld/@r:id") == ["rId3"]
+        assert prs_elm.xpath(".//*[local-name()='section']/*/*/@id") == ["258"]
+        assert "rId2" not in prs_part.rels
+        assert prs_part._dropped_slide_parts == [slide_parts[1]]
+        assert prs_part.slide_id(slide_parts[2]) == 258
+
+    def but_it_raises_on_delete_of_a_slide_not_present(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+        prs_part.delete_slide(slide_parts[0])
+        with pytest.raises(ValueError):
+            prs_part.delete_slide(slide_parts[0])
+
+    @pytest.mark.parametrize(
+        "idx, new_idx, expected_value",
+        ((0, 2, [257, 258, 256]), (2, 0, [258, 256, 257]), (1, 1, [256, 257, 258])),
+    )
+    def it_can_move_a_slide(self, prs_slides, idx, new_idx, expected_value):
+        prs_part, slide_parts = prs_slides
+
+        prs_part.move_slide(slide_parts[idx], new_idx)
+
+        assert prs_part._element.xpath("./p:sldIdLst/p:sldId/@id") == [
+            str(slide_id) for slide_id in expected_value
+        ]
+        assert prs_part.slide_idx(slide_parts[idx]) == new_idx
+
+    def but_it_raises_on_move_to_a_position_out_of_range(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+        with pytest.raises(IndexError):
+            prs_part.move_slide(slide_parts[0], 3)
+
+    def it_can_reorder_its_slides(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+
+        prs_part.reorder_slides([slide_parts[2], slide_parts[0], slide_parts[1]])
+
+        assert prs_part._element.xpath("./p:sldIdLst/p:sldId/@r:id") == [
+            "rId3",
+            "rId1",
+            "rId2",
+        ]
+
+    @pytest.mark.parametrize("idxs", ((0, 1), (0, 1, 1), (0, 1, 2, 2)))
+    def but_it_raises_on_reorder_not_covering_each_slide_once(self, prs_slides, idxs):
+        prs_part, slide_parts = prs_slides
+        with pytest.raises(ValueError):
+            prs_part.reorder_slides([slide_parts[idx] for idx in idxs])
+        assert prs_part._element.xpath("./p:sldIdLst/p:sldId/@id") == [
+            "256",
+            "257",
+            "258",
+        ]
+
+    def it_drops_links_to_deleted_slides_before_it_is_saved(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+        slide_parts[0].load_rel(RT.SLIDE, slide_parts[2], "rId9")
+        slide_parts[0]._element.append(
+            element("p:cNvPr/a:hlinkClick{r:id=rId9,action=ppaction://hlinksldjump}")
+        )
+        prs_part.move_slide(slide_parts[0], 2)
+        prs_part.delete_slide(slide_parts[2])
+
+        prs_part.before_marshal()
+
+        assert "rId9" not in slide_parts[0].rels
+        assert slide_parts[0]._element.xpath("//a:hlinkClick") == []
+        assert prs_part._dropped_slide_parts == []
+        assert [slide_part.partname for slide_part in slide_parts[:2]] == [
+            "/ppt/slides/slide2.xml",
+            "/ppt/slides/slide1.xml",
+        ]
+
+    def it_can_add_notes_slides_to_many_slides_at_once(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+        prs_part.package.load_rel(RT.OFFICE_DOCUMENT, prs_part, "rId1")
+        prs_part.load_rel(RT.NOTES_MASTER, NotesMasterPart._new(None), "rId9")
+        notes_slide_part = slide_parts[1].notes_slide.part
+
+        prs_part.add_notes_slides(slide_parts + slide_parts[:1])
+
+        assert slide_parts[1].notes_slide.part is notes_slide_part
+        assert [
+            slide_part.part_related_by(RT.NOTES_SLIDE).partname
+            for slide_part in slide_parts
+        ] == [
+            "/ppt/notesSlides/notesSlide2.xml",
+            "/ppt/notesSlides/notesSlide1.xml",
+            "/ppt/notesSlides/notesSlide3.xml",
+        ]
+
+    def but_it_raises_on_notes_for_a_slide_not_present(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+        prs_part.delete_slide(slide_parts[0])
+        with pytest.raises(ValueError):
+            prs_part.add_notes_slides(slide_parts)
+        assert not slide_parts[1].has_notes_slide
+
+    def it_can_drop_slides_not_in_its_slide_sequence(self, prs_slides):
+        prs_part, slide_parts = prs_slides
+        sldIdLst = prs_part._element.sldIdLst
+        sldIdLst.remove(sldIdLst[1])
+        slide_parts[0].load_rel(RT.SLIDE, slide_parts[1], "rId9")
+        slide_parts[0]._element.append(element("p:cNvPr/a:hlinkClick{r:id=rId9}"))
+
+        prs_part.drop_orphaned_slides()
+
+        assert sorted(prs_part.rels.keys()) == ["rId1", "rId3"]
+        assert prs_part._element.xpath(".//p:custShow//p:sld/@r:id") == ["rId3"]
+        assert "rId9" not in slide_parts[0].rels
+        assert slide_parts[0]._element.xpath("//a:hlinkClick") == []
+        assert prs_part._dropped_slide_parts == []
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -271,6 +447,49 @@ class DescribePresentationPart(object):
         related_parts_prop_.return_value = {"a": None, "b": None, "c": None}
         return prs_part, slide_part_
 
+    @pytest.fixture
+    def prs_slides(self):
+        package = Package()
+        prs_elm = parse_xml(
+            "<p:presentation %s>\n"
+            "  <p:sldIdLst>\n"
+            '    <p:sldId id="256" r:id="rId1"/>\n'
+            '    <p:sldId id="257" r:id="rId2"/>\n'
+            '    <p:sldId id="258" r:id="rId3"/>\n'
+            "  </p:sldIdLst>\n"
+            "  <p:custShowLst>\n"
+            '    <p:custShow name="foo" id="0">\n'
+            '      <p:sldLst><p:sld r:id="rId2"/><p:sld r:id="rId3"/></p:sldLst>\n'
+            "    </p:custShow>\n"
+            "  </p:custShowLst>\n"
+            "  <p:extLst>\n"
+            '    <p:ext uri="{521415D9-36F7-43E2-AB2F-B90AF26B5E84}">\n'
+            "      <p14:sectionLst %s>\n"
+            '        <p14:section name="bar" id="{00000000-0000-0000-0000-000000'
+            '000000}">\n'
+            '          <p14:sldIdLst><p14:sldId id="257"/><p14:sldId id="258"/>'
+            "</p14:sldIdLst>\n"
+            "        </p14:section>\n"
+            "      </p14:sectionLst>\n"
+            "    </p:ext>\n"
+            "  </p:extLst>\n"
+            "</p:presentation>" % (nsdecls("p", "r"), P14_NSDECL)
+        )
+        prs_part = PresentationPart(
+            PackURI("/ppt/presentation.xml"), None, prs_elm, package
+        )
+        slide_parts = []
+        for n in (1, 2, 3):
+            slide_part = SlidePart(
+                PackURI("/ppt/slides/slide%d.xml" % n),
+                None,
+                element("p:sld/p:cSld/p:spTree"),
+                package,
+            )
+            prs_part.load_rel(RT.SLIDE, slide_part, "rId%d" % n)
+            slide_parts.append(slide_part)
+        return prs_part, slide_parts
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -342,3 +561,207 @@ class DescribePresentationPart(object):
     @pytest.fixture
     def SlidePart_(self, request):
         return class_mock(request, "pptx.parts.presentation.SlidePart")
+
+
+class Describe_SlideImporter(object):
+    """Unit-test suite for `pptx.parts.presentation._SlideImporter` object."""
+
+    def it_uses_equivalent_layouts_and_shares_identical_images(self):
+        prs, other_prs = pptx.Presentation(), pptx.Presentation()
+        prs_picture = prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_picture(
+            test_image_path, 0, 0
+        )
+        slide = other_prs.slides.add_slide(other_prs.slide_layouts[1])
+        slide.shapes.add_picture(test_image_path, 0, 0)
+        slide.notes_slide.notes_text_frame.text = "foo"
+
+        rId, slide_copy = _SlideImporter(prs.part).import_slides([slide.part])[0]
+
+        assert prs.part.related_parts[rId] is slide_copy.part
+        slide_copy = slide_copy.part
+        assert slide_copy.package is prs.part.package
+        assert slide_copy.slide_layout == prs.slide_layouts[1]
+        assert len(prs.slide_masters) == 1
+        picture = slide_copy.slide.shapes[2]
+        assert picture.image.sha1 == prs_picture.image.sha1
+        assert picture._pic.blip_rId in slide_copy.rels
+        assert slide_copy.related_parts[picture._pic.blip_rId] is (
+            prs_picture.part.related_parts[prs_picture._pic.blip_rId]
+        )
+        notes_slide = slide_copy.notes_slide
+        assert notes_slide.notes_text_frame.text == "foo"
+        assert notes_slide.part.notes_master is prs.notes_master
+        assert notes_slide.part.part_related_by(RT.SLIDE) is slide_copy
+
+    def it_imports_the_master_of_a_layout_without_an_equivalent(self):
+        prs, other_prs = pptx.Presentation(), pptx.Presentation()
+        other_prs.slide_layouts[1].name = "Other Title and Content"
+        slides = [
+            other_prs.slides.add_slide(other_prs.slide_layouts[idx])
+            for idx in (1, 2, 1)
+        ]
+
+        slide_copies = [
+            slide_copy.part
+            for _, slide_copy in _SlideImporter(prs.part).import_slides(
+                slide.part for slide in slides
+            )
+        ]
+
+        assert len(prs.slide_masters) == 2
+        master = prs.slide_masters[1]
+        assert len(master.slide_layouts) == 11
+        assert slide_copies[0].slide_layout == master.slide_layouts[1]
+        assert slide_copies[1].slide_layout == master.slide_layouts[2]
+        assert slide_copies[2].slide_layout == master.slide_layouts[1]
+        ids = prs.part._element.xpath("./p:sldMasterIdLst/p:sldMasterId/@id")
+        for slide_master in prs.slide_masters:
+            ids.extend(slide_master._element.xpath(".//p:sldLayoutId/@id"))
+        assert len(set(ids)) == 24
+        assert ids[1] == "2147483660"
+
+    def it_clears_a_link_to_a_slide_not_imported(self):
+        prs, other_prs = pptx.Presentation(), pptx.Presentation()
+        slides = [other_prs.slides.add_slide(other_prs.slide_layouts[6]) for _ in "ab"]
+        textbox = slides[0].shapes.add_textbox(0, 0, 10, 10)
+        textbox.click_action.target_slide = slides[1]
+
+        slide_copy = _SlideImporter(prs.part).import_slides([slides[0].part])[0][1].part
+
+        hlinkClick = slide_copy._element.xpath("//a:hlinkClick")[0]
+        assert hlinkClick.rId == ""
+        assert slide_copy.rels.part_with_reltype(RT.SLIDE_LAYOUT) is (
+            prs.slide_layouts[6].part
+        )
+
+    def it_reuses_the_index_of_the_presentation_for_later_imports(self, request):
+        prs = pptx.Presentation()
+        other_prss = [pptx.Presentation() for _ in range(3)]
+        for other_prs in other_prss:
+            slide = other_prs.slides.add_slide(other_prs.slide_layouts[1])
+            slide.shapes.add_picture(test_image_path, 0, 0)
+        _SlideImporter(prs.part).import_slides([other_prss[0].slides[0].part])
+        iter_rels_ = method_mock(
+            request, Package, "iter_rels", autospec=True, side_effect=Package.iter_rels
+        )
+        _compute_digest_ = method_mock(
+            request,
+            _SlideImporter,
+            "_compute_digest",
+            side_effect=_SlideImporter._compute_digest,
+        )
+
+        slide_pairs = [
+            _SlideImporter(prs.part).import_slides([other_prs.slides[0].part])[0]
+            for other_prs in other_prss[1:]
+        ]
+
+        assert iter_rels_.call_count == 0
+        # ---the source layout, master and theme, and the target ones, once---
+        assert _compute_digest_.call_count == 2 * 6
+        image_parts = set(
+            slide.part.related_parts[slide.shapes[2]._pic.blip_rId]
+            for _, slide in slide_pairs
+        )
+        assert len(image_parts) == 1
+        assert len(prs.slide_masters) == 1
+
+    def but_it_rebuilds_the_index_after_a_slide_is_deleted(self):
+        prs, other_prs = pptx.Presentation(), pptx.Presentation()
+        other_prs.slides.add_slide(other_prs.slide_layouts[6]).shapes.add_picture(
+            test_image_path, 0, 0
+        )
+        rId, slide = _SlideImporter(prs.part).import_slides([other_prs.slides[0].part])[
+            0
+        ]
+        prs.part.drop_rel(rId)
+        picture = prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_picture(
+            test_image_path, 0, 0
+        )
+        image_part = picture.part.related_parts[picture._pic.blip_rId]
+
+        slide = _SlideImporter(prs.part).import_slides([other_prs.slides[0].part])[0][1]
+
+        assert slide.part.related_parts[slide.shapes[0]._pic.blip_rId] is image_part
+        partnames = [part.partname for part in prs.part.package.iter_parts()]
+        assert len(partnames) == len(set(partnames))
+
+    def and_it_does_not_use_a_layout_changed_since_it_was_indexed(self):
+        prs, other_prs = pptx.Presentation(), pptx.Presentation()
+        other_prs.slides.add_slide(other_prs.slide_layouts[1])
+        _SlideImporter(prs.part).import_slides([other_prs.slides[0].part])
+        prs.slide_layouts[1].name = "Changed Title and Content"
+
+        slide = _SlideImporter(prs.part).import_slides([other_prs.slides[0].part])[0][1]
+
+        assert len(prs.slide_masters) == 2
+        assert slide.slide_layout == prs.slide_masters[1].slide_layouts[1]
+
+
+class Describe_SlideIdIndex(object):
+    """Unit-test suite for `pptx.parts.presentation._SlideIdIndex` object."""
+
+    def it_maps_slide_ids_positions_and_slide_parts(self, prs_part, parts):
+        slide_id_index = _SlideIdIndex(prs_part)
+
+        assert slide_id_index.part_for_id(257) is parts[1]
+        assert slide_id_index.id_for_part(parts[2]) == 258
+        assert slide_id_index.idx_for_part(parts[0]) == 0
+        assert slide_id_index.part_for_id(666) is None
+        assert slide_id_index.idx_for_part(None) is None
+
+    def it_indexes_appended_slides_without_a_rebuild(self, request, prs_part, parts):
+        slide_id_index = _SlideIdIndex(prs_part)
+        assert slide_id_index.id_for_part(parts[0]) == 256
+        _rebuild_ = method_mock(request, _SlideIdIndex, "_rebuild")
+        new_part = object()
+        prs_part.related_parts["d"] = new_part
+        prs_part._element.sldIdLst._add_sldId(id=300, rId="d")
+
+        assert slide_id_index.idx_for_part(new_part) == 3
+        assert slide_id_index.part_for_id(300) is new_part
+        assert _rebuild_.call_args_list == []
+
+    def it_notices_when_slides_are_reordered_or_removed(self, prs_part, parts):
+        slide_id_index = _SlideIdIndex(prs_part)
+        assert slide_id_index.idx_for_part(parts[0]) == 0
+        sldIdLst = prs_part._element.sldIdLst
+        sldId = sldIdLst[0]
+
+        sldIdLst.remove(sldId)
+        sldIdLst.insert(1, sldId)
+        assert slide_id_index.idx_for_part(parts[0]) == 1
+        assert slide_id_index.idx_for_part(parts[1]) == 0
+
+        sldIdLst.remove(sldId)
+        assert slide_id_index.part_for_id(256) is None
+        assert slide_id_index.idx_for_part(parts[2]) == 1
+
+    def it_notices_when_a_slide_id_is_changed(self, prs_part, parts):
+        slide_id_index = _SlideIdIndex(prs_part)
+        assert slide_id_index.id_for_part(parts[1]) == 257
+
+        prs_part._element.sldIdLst[1].id = 999
+
+        assert slide_id_index.part_for_id(257) is None
+        assert slide_id_index.id_for_part(parts[1]) == 999
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def parts(self):
+        return [object(), object(), object()]
+
+    @pytest.fixture
+    def prs_part(self, request, parts):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id="
+            "b,id=257},p:sldId{r:id=c,id=258})"
+        )
+        property_mock(
+            request,
+            PresentationPart,
+            "related_parts",
+            return_value=dict(zip("abc", parts)),
+        )
+        return PresentationPart(None, None, prs_elm)
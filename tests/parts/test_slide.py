@@ -8,13 +8,16 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from pptx.chart.chart import Chart
 from pptx.chart.data import ChartData
 from pptx.enum.base import EnumValue
+from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.media import Video
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
-from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
+from pptx.oxml.ns import qn
+from pptx.oxml.slide import CT_NotesMaster, CT_Slide
 from pptx.oxml.theme import CT_OfficeStyleSheet
 from pptx.package import Package
 from pptx.parts.chart import ChartPart
@@ -25,6 +28,7 @@ from pptx.parts.slide import (
     BaseSlidePart,
     NotesMasterPart,
     NotesSlidePart,
+    _PlaceholderIndex,
     SlideLayoutPart,
     SlideMasterPart,
     SlidePart,
@@ -62,6 +66,30 @@ class DescribeBaseSlidePart(object):
         assert image_part is image_part_
         assert rId is rId_
 
+    def it_can_find_a_placeholder_element_by_idx(self):
+        sld = element(
+            "p:sld/p:cSld/p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nv"
+            "SpPr/p:nvPr/p:ph{type=body,idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1})"
+        )
+        sps = sld.xpath("//p:sp")
+        base_slide = BaseSlidePart(None, None, sld, None)
+
+        assert base_slide.placeholder_elm_by_idx(0) is sps[0]
+        assert base_slide.placeholder_elm_by_idx(1) is sps[1]
+        assert base_slide.placeholder_elm_by_idx(2) is None
+
+    def it_can_find_a_placeholder_element_by_type(self):
+        sld = element(
+            "p:sld/p:cSld/p:spTree/(p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=1},"
+            "p:sp/p:nvSpPr/p:nvPr/p:ph{type=title})"
+        )
+        sps = sld.xpath("//p:sp")
+        base_slide = BaseSlidePart(None, None, sld, None)
+
+        assert base_slide.placeholder_elm_by_type(PP_PLACEHOLDER.TITLE) is sps[2]
+        assert base_slide.placeholder_elm_by_type(PP_PLACEHOLDER.BODY) is sps[1]
+        assert base_slide.placeholder_elm_by_type(PP_PLACEHOLDER.CHART) is None
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -134,6 +162,16 @@ class DescribeNotesMasterPart(object):
         NotesMaster_.assert_called_once_with(notesMaster, notes_master_part)
         assert notes_master is notes_master_
 
+    def it_provides_a_prototype_for_new_notes_slides(self):
+        notesMaster = CT_NotesMaster.new_default()
+        notes_master_part = NotesMasterPart(None, None, notesMaster, None)
+
+        prototype = notes_master_part.notes_slide_prototype
+
+        assert prototype.tag == qn("p:notes")
+        assert prototype.xpath("//p:ph/@type") == ["sldImg", "body", "sldNum"]
+        assert notes_master_part.notes_slide_prototype is prototype
+
     def it_creates_a_new_notes_master_part_to_help(self, new_fixture):
         package_, NotesMasterPart_, partname = new_fixture[:3]
         notesMaster_, notes_master_part_ = new_fixture[3:]
@@ -255,17 +293,44 @@ class DescribeNotesMasterPart(object):
 
 
 class DescribeNotesSlidePart(object):
-    def it_can_create_a_notes_slide_part(self, new_fixture):
-        package_, slide_part_, notes_master_part_ = new_fixture[:3]
-        notes_slide_, notes_master_, notes_slide_part_ = new_fixture[3:]
-
-        notes_slide_part = NotesSlidePart.new(package_, slide_part_)
-
-        NotesSlidePart._add_notes_slide_part.assert_called_once_with(
-            package_, slide_part_, notes_master_part_
-        )
-        notes_slide_.clone_master_placeholders.assert_called_once_with(notes_master_)
-        assert notes_slide_part is notes_slide_part_
+    @pytest.mark.parametrize(
+        "partname, expected_partname",
+        (
+            (None, "/ppt/notesSlides/notesSlide42.xml"),
+            ("/ppt/notesSlides/notesSlide7.xml", "/ppt/notesSlides/notesSlide7.xml"),
+        ),
+    )
+    def it_can_create_a_notes_slide_part(
+        self,
+        request,
+        package_,
+        slide_part_,
+        presentation_part_,
+        notes_master_part_,
+        partname,
+        expected_partname,
+    ):
+        relate_to_ = method_mock(request, NotesSlidePart, "relate_to", autospec=True)
+        prototype = element("p:notes/p:cSld/p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph")
+        package_.presentation_part = presentation_part_
+        presentation_part_.notes_master_part = notes_master_part_
+        notes_master_part_.notes_slide_prototype = prototype
+        package_.next_notes_slide_partnames.return_value = [
+            PackURI("/ppt/notesSlides/notesSlide42.xml")
+        ]
+
+        notes_slide_part = NotesSlidePart.new(package_, slide_part_, partname)
+
+        assert isinstance(notes_slide_part, NotesSlidePart)
+        assert notes_slide_part.partname == expected_partname
+        assert notes_slide_part.content_type == CT.PML_NOTES_SLIDE
+        assert notes_slide_part._element.xml == prototype.xml
+        assert notes_slide_part._element is not prototype
+        assert notes_slide_part.package is package_
+        assert relate_to_.call_args_list == [
+            call(notes_slide_part, notes_master_part_, RT.NOTES_MASTER),
+            call(notes_slide_part, slide_part_, RT.SLIDE),
+        ]
 
     def it_provides_access_to_the_notes_master(self, notes_master_fixture):
         notes_slide_part, notes_master_ = notes_master_fixture
@@ -281,78 +346,8 @@ class DescribeNotesSlidePart(object):
         NotesSlide_.assert_called_once_with(notes, notes_slide_part)
         assert notes_slide is notes_slide_
 
-    def it_adds_a_notes_slide_part_to_help(self, add_fixture):
-        package_, slide_part_, notes_master_part_ = add_fixture[:3]
-        notes_slide_part_, NotesSlidePart_, partname = add_fixture[3:6]
-        content_type, notes, calls = add_fixture[6:]
-
-        notes_slide_part = NotesSlidePart._add_notes_slide_part(
-            package_, slide_part_, notes_master_part_
-        )
-
-        package_.next_partname.assert_called_once_with(
-            "/ppt/notesSlides/notesSlide%d.xml"
-        )
-        CT_NotesSlide.new.assert_called_once_with()
-        NotesSlidePart_.assert_called_once_with(partname, content_type, notes, package_)
-        assert notes_slide_part_.relate_to.call_args_list == calls
-        assert notes_slide_part is notes_slide_part_
-
     # fixtures -------------------------------------------------------
 
-    @pytest.fixture
-    def add_fixture(
-        self,
-        package_,
-        slide_part_,
-        notes_master_part_,
-        notes_slide_part_,
-        NotesSlidePart_,
-        new_,
-    ):
-        partname = PackURI("/ppt/notesSlides/notesSlide42.xml")
-        content_type = CT.PML_NOTES_SLIDE
-        notes = element("p:notes")
-        calls = [call(notes_master_part_, RT.NOTES_MASTER), call(slide_part_, RT.SLIDE)]
-        package_.next_partname.return_value = partname
-        new_.return_value = notes
-        return (
-            package_,
-            slide_part_,
-            notes_master_part_,
-            notes_slide_part_,
-            NotesSlidePart_,
-            partname,
-            content_type,
-            notes,
-            calls,
-        )
-
-    @pytest.fixture
-    def new_fixture(
-        self,
-        package_,
-        slide_part_,
-        notes_master_part_,
-        notes_slide_,
-        notes_master_,
-        notes_slide_part_,
-        _add_notes_slide_part_,
-        presentation_part_,
-    ):
-        package_.presentation_part = presentation_part_
-        presentation_part_.notes_master_part = notes_master_part_
-        notes_slide_part_.notes_slide = notes_slide_
-        notes_master_part_.notes_master = notes_master_
-        return (
-            package_,
-            slide_part_,
-            notes_master_part_,
-            notes_slide_,
-            notes_master_,
-            notes_slide_part_,
-        )
-
     @pytest.fixture
     def notes_master_fixture(self, notes_master_, part_related_by_, notes_master_part_):
         notes_slide_part = NotesSlidePart(None, None, None, None)
@@ -368,19 +363,6 @@ class DescribeNotesSlidePart(object):
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _add_notes_slide_part_(self, request, notes_slide_part_):
-        return method_mock(
-            request,
-            NotesSlidePart,
-            "_add_notes_slide_part",
-            return_value=notes_slide_part_,
-        )
-
-    @pytest.fixture
-    def new_(self, request):
-        return method_mock(request, CT_NotesSlide, "new")
-
     @pytest.fixture
     def notes_master_(self, request):
         return instance_mock(request, NotesMaster)
@@ -445,10 +427,68 @@ class DescribeSlidePart(object):
 
         _rId = slide_part.add_chart_part(chart_type_, chart_data_)
 
-        ChartPart_.new.assert_called_once_with(chart_type_, chart_data_, package_)
+        ChartPart_.new.assert_called_once_with(chart_type_, chart_data_, package_, True)
         slide_part.relate_to.assert_called_once_with(chart_part_, RT.CHART)
         assert _rId is rId
 
+    def it_can_add_a_chart_part_from_a_template_chart(
+        self, request, package_, chart_data_, ChartPart_, chart_part_, relate_to_
+    ):
+        template_chart_ = instance_mock(request, Chart)
+        slide_part = SlidePart(None, None, None, package_)
+        ChartPart_.new_from.return_value = chart_part_
+        relate_to_.return_value = "rId42"
+
+        rId = slide_part.add_chart_part_from(template_chart_, chart_data_, "lazy")
+
+        ChartPart_.new_from.assert_called_once_with(
+            template_chart_, chart_data_, package_, "lazy"
+        )
+        relate_to_.assert_called_once_with(chart_part_, RT.CHART)
+        assert rId == "rId42"
+
+    def it_can_duplicate_itself(self):
+        package = Package()
+        slide_part = SlidePart(
+            PackURI("/ppt/slides/slide1.xml"),
+            CT.PML_SLIDE,
+            element("p:sld/p:cSld/p:spTree/p:pic/p:blipFill/a:blip{r:embed=rId2}"),
+            package,
+        )
+        layout_part = SlideLayoutPart(None, CT.PML_SLIDE_LAYOUT, None, package)
+        image_part = ImagePart(None, CT.PNG, b"png", package)
+        chart_part = Part(PackURI("/ppt/charts/chart1.xml"), "foo/bar", b"x", package)
+        notes_slide_part = NotesSlidePart(
+            PackURI("/ppt/notesSlides/notesSlide1.xml"),
+            CT.PML_NOTES_SLIDE,
+            element("p:notes/p:cSld/p:spTree"),
+            package,
+        )
+        notes_slide_part.load_rel(RT.SLIDE, slide_part, "rId1")
+        slide_part.load_rel(RT.SLIDE_LAYOUT, layout_part, "rId1")
+        slide_part.load_rel(RT.IMAGE, image_part, "rId2")
+        slide_part.load_rel(RT.CHART, chart_part, "rId3")
+        slide_part.load_rel(RT.NOTES_SLIDE, notes_slide_part, "rId4")
+        slide_part.load_rel(RT.HYPERLINK, "http://foo", "rId5", is_external=True)
+        partname = PackURI("/ppt/slides/slide2.xml")
+
+        slide_copy = slide_part.duplicate(partname)
+
+        assert isinstance(slide_copy, SlidePart)
+        assert slide_copy.partname == partname
+        assert slide_copy._element is not slide_part._element
+        assert slide_copy._element.xml == slide_part._element.xml
+        related_parts = slide_copy.related_parts
+        assert related_parts["rId1"] is layout_part
+        assert related_parts["rId2"] is image_part
+        assert related_parts["rId3"] is not chart_part
+        assert related_parts["rId3"].blob == b"x"
+        notes_copy = related_parts["rId4"]
+        assert isinstance(notes_copy, NotesSlidePart)
+        assert notes_copy is not notes_slide_part
+        assert notes_copy.related_parts["rId1"] is slide_copy
+        assert slide_copy.rels["rId5"].target_ref == "http://foo"
+
     def it_can_get_or_add_a_video_part(self, goa_video_fixture):
         slide_part, video_, package_, relate_to_ = goa_video_fixture[:4]
         calls, media_rId, video_rId = goa_video_fixture[4:]
@@ -795,3 +835,55 @@ class DescribeSlideMasterPart(object):
     @pytest.fixture
     def slide_master_(self, request):
         return instance_mock(request, SlideMaster)
+
+
+class Describe_PlaceholderIndex(object):
+    def it_maps_a_key_to_the_first_placeholder_having_it(self):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=3},p:sp/p:nvSpPr/p:nvPr/p:ph{id"
+            "x=3},p:pic)"
+        )
+        sps = spTree.xpath("p:sp")
+        index = _PlaceholderIndex(spTree, "ph_idx")
+
+        assert index.get(3) is sps[0]
+        assert index.get(4) is None
+
+    def it_notices_when_a_shape_is_added_or_removed(self):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}")
+        index = _PlaceholderIndex(spTree, "ph_idx")
+        assert index.get(2) is None
+
+        spTree.append(element("p:sp/p:nvSpPr/p:nvPr/p:ph{idx=2}"))
+        assert index.get(2) is spTree[1]
+
+        spTree.remove(spTree[0])
+        assert index.get(1) is None
+
+    def it_notices_when_an_indexed_placeholder_changes(self):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{id"
+            "x=2})"
+        )
+        sp, sp_2 = spTree.xpath("p:sp")
+        index = _PlaceholderIndex(spTree, "ph_idx")
+        assert index.get(1) is sp
+
+        sp.ph.idx, sp_2.ph.idx = 2, 1
+        assert index.get(1) is sp_2
+
+    def it_notices_when_a_missing_key_appears_without_a_shape_count_change(self):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{id"
+            "x=2})"
+        )
+        sp, sp_2 = spTree.xpath("p:sp")
+        index = _PlaceholderIndex(spTree, "ph_idx")
+        assert index.get(3) is None
+
+        sp_2.ph.idx = 3
+        assert index.get(3) is sp_2
+
+        sp_4 = element("p:sp/p:nvSpPr/p:nvPr/p:ph{idx=4}")
+        spTree.replace(sp, sp_4)
+        assert index.get(4) is sp_4
@@ -297,7 +297,9 @@ class DescribeChartPlaceholder(object):
 
         ph_graphic_frame = chart_ph.insert_chart(chart_type, chart_data_)
 
-        chart_ph.part.add_chart_part.assert_called_once_with(chart_type, chart_data_)
+        chart_ph.part.add_chart_part.assert_called_once_with(
+            chart_type, chart_data_, True
+        )
         chart_ph._new_chart_graphicFrame.assert_called_once_with(
             rId, chart_ph.left, chart_ph.top, chart_ph.width, chart_ph.height
         )
@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from pptx.compat import BytesIO
+from pptx.chart.chart import Chart
 from pptx.chart.data import ChartData
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, PP_PLACEHOLDER
 from pptx.oxml import parse_xml
@@ -16,7 +17,7 @@ from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement, ST_Direction
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.parts.image import ImagePart
-from pptx.parts.slide import SlidePart
+from pptx.parts.slide import SlideLayoutPart, SlideMasterPart, SlidePart
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -35,6 +36,7 @@ from pptx.shapes.shapetree import (
     BasePlaceholders,
     BaseShapeFactory,
     _BaseShapes,
+    _DeferredGroupExtents,
     GroupShapes,
     LayoutPlaceholders,
     _LayoutShapeFactory,
@@ -51,6 +53,7 @@ from pptx.shapes.shapetree import (
     SlideShapeFactory,
     SlideShapes,
 )
+from pptx.shapes.spatial import SpatialIndex
 from pptx.slide import SlideLayout, SlideMaster
 from pptx.table import Table
 
@@ -131,6 +134,15 @@ class Describe_BaseShapes(object):
         with pytest.raises(IndexError):
             shapes[2]
 
+    def it_can_build_a_spatial_index_of_its_shapes(self, request):
+        from_shapes_ = method_mock(request, SpatialIndex, "from_shapes")
+        shapes = _BaseShapes(element("p:spTree"), None)
+
+        spatial_index = shapes.spatial_index(include_group_members=False)
+
+        from_shapes_.assert_called_once_with(shapes, False)
+        assert spatial_index is from_shapes_.return_value
+
     def it_can_clone_a_placeholder(self, clone_ph_fixture):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
@@ -301,7 +313,9 @@ class Describe_BaseGroupShapes(object):
 
         graphic_frame = shapes.add_chart(chart_type, x, y, cx, cy, chart_data_)
 
-        shapes.part.add_chart_part.assert_called_once_with(chart_type, chart_data_)
+        shapes.part.add_chart_part.assert_called_once_with(
+            chart_type, chart_data_, True
+        )
         shapes._add_chart_graphicFrame.assert_called_once_with(
             shapes, rId_, x, y, cx, cy
         )
@@ -309,6 +323,37 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, graphicFrame)
         assert graphic_frame is graphic_frame_
 
+    def it_can_add_a_chart_from_a_template_chart(
+        self,
+        request,
+        chart_data_,
+        _add_chart_graphicFrame_,
+        graphic_frame_,
+        part_prop_,
+        slide_part_,
+        _recalculate_extents_,
+        _shape_factory_,
+    ):
+        template_chart_ = instance_mock(request, Chart)
+        graphicFrame = element("p:graphicFrame")
+        part_prop_.return_value = slide_part_
+        slide_part_.add_chart_part_from.return_value = "rId42"
+        _add_chart_graphicFrame_.return_value = graphicFrame
+        _shape_factory_.return_value = graphic_frame_
+        shapes = _BaseGroupShapes(None, None)
+
+        graphic_frame = shapes.add_chart_from(
+            template_chart_, 1, 2, 3, 4, chart_data_, embed_workbook=False
+        )
+
+        slide_part_.add_chart_part_from.assert_called_once_with(
+            template_chart_, chart_data_, False
+        )
+        _add_chart_graphicFrame_.assert_called_once_with(shapes, "rId42", 1, 2, 3, 4)
+        _recalculate_extents_.assert_called_once_with(shapes)
+        _shape_factory_.assert_called_once_with(shapes, graphicFrame)
+        assert graphic_frame is graphic_frame_
+
     def it_can_add_a_connector_shape(self, connector_fixture):
         shapes, connector_type, begin_x, begin_y = connector_fixture[:4]
         end_x, end_y, cxnSp_, connector_ = connector_fixture[4:]
@@ -322,6 +367,102 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, cxnSp_)
         assert connector is connector_
 
+    def it_can_clone_a_shape(
+        self, request, part_prop_, slide_part_, _recalculate_extents_, shape_
+    ):
+        PartImporter_ = class_mock(request, "pptx.shapes.shapetree.PartImporter")
+        importer_ = PartImporter_.return_value
+        importer_.import_rel.side_effect = ["rId7", None]
+        _assign_fresh_shape_ids_ = method_mock(
+            request, _BaseGroupShapes, "_assign_fresh_shape_ids", autospec=True
+        )
+        _shape_factory_ = method_mock(
+            request, _BaseGroupShapes, "_shape_factory", autospec=True
+        )
+        source_part_ = instance_mock(request, SlidePart, rels={"rId1": 1, "rId2": 2})
+        shape_.part = source_part_
+        shape_.element = element(
+            "p:pic/(p:nvPicPr/p:cNvPr/a:hlinkClick{r:id=rId2},p:blipFill/a:blip{r:e"
+            "mbed=rId1},p:spPr/a:ln/a:custDash{r:id=rId9})"
+        )
+        part_prop_.return_value = slide_part_
+        spTree = element("p:spTree/p:extLst")
+        shapes = _BaseGroupShapes(spTree, None)
+
+        clone = shapes.clone(shape_)
+
+        PartImporter_.assert_called_once_with(slide_part_.package)
+        assert importer_.import_rel.call_args_list == [
+            call(source_part_, "rId2", slide_part_),
+            call(source_part_, "rId1", slide_part_),
+        ]
+        pic = spTree[0]
+        assert pic is not shape_.element
+        assert pic.xpath("//@r:*") == ["rId7", "", ""]
+        _assign_fresh_shape_ids_.assert_called_once_with(
+            shapes, pic, keep_connections=False
+        )
+        _recalculate_extents_.assert_called_once_with(shapes)
+        _shape_factory_.assert_called_once_with(shapes, pic)
+        assert clone is _shape_factory_.return_value
+
+    @pytest.mark.parametrize(
+        "keep_connections, expected_value", ((True, ["6", "42"]), (False, ["6"]))
+    )
+    def it_assigns_fresh_ids_to_a_shape_copy(self, keep_connections, expected_value):
+        spTree = element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=4}")
+        grpSp = element(
+            "p:grpSp/(p:nvGrpSpPr/p:cNvPr{id=2},p:sp/p:nvSpPr/p:cNvPr{id=3},p:cxnSp/"
+            "p:nvCxnSpPr/(p:cNvPr{id=7},p:cNvCxnSpPr/(a:stCxn{id=3,idx=0},a:endCxn{"
+            "id=42,idx=1})))"
+        )
+        shapes = _BaseGroupShapes(spTree, None)
+
+        shapes._assign_fresh_shape_ids(grpSp, keep_connections)
+
+        assert grpSp.xpath("//p:cNvPr/@id") == ["5", "6", "7"]
+        assert grpSp.xpath("//a:stCxn/@id | //a:endCxn/@id") == expected_value
+
+    def it_can_defer_recalculation_of_group_extents(self, part_prop_, slide_part_):
+        spTree = element(
+            "p:spTree/p:grpSp/(p:grpSpPr/a:xfrm,p:grpSp/(p:grpSpPr/a:xfrm,p:sp/p:spP"
+            "r/a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4})))"
+        )
+        outer_grpSp, inner_grpSp = spTree.xpath("//p:grpSp")
+        slide_part_.deferred_group_extents = None
+        part_prop_.return_value = slide_part_
+        shapes = _BaseGroupShapes(spTree, None)
+
+        with shapes.deferred_extents():
+            deferred_group_extents = slide_part_.deferred_group_extents
+            assert isinstance(deferred_group_extents, _DeferredGroupExtents)
+            deferred_group_extents.add(inner_grpSp)
+            assert inner_grpSp.x is None
+
+        assert slide_part_.deferred_group_extents is None
+        for grpSp in (inner_grpSp, outer_grpSp):
+            assert (grpSp.x, grpSp.y, grpSp.cx, grpSp.cy) == (1, 2, 3, 4)
+            assert (grpSp.chOff.x, grpSp.chOff.y) == (1, 2)
+            assert (grpSp.chExt.cx, grpSp.chExt.cy) == (3, 4)
+
+    def and_it_recalculates_only_when_the_outermost_context_exits(
+        self, part_prop_, slide_part_, _DeferredGroupExtents_
+    ):
+        deferred_group_extents_ = _DeferredGroupExtents_.return_value
+        slide_part_.deferred_group_extents = None
+        part_prop_.return_value = slide_part_
+        shapes = _BaseGroupShapes(None, None)
+
+        with shapes.deferred_extents():
+            with shapes.deferred_extents():
+                pass
+            assert deferred_group_extents_.recalculate.call_args_list == []
+            assert slide_part_.deferred_group_extents is deferred_group_extents_
+
+        _DeferredGroupExtents_.assert_called_once_with()
+        deferred_group_extents_.recalculate.assert_called_once_with()
+        assert slide_part_.deferred_group_extents is None
+
     def it_can_provide_a_freeform_builder(self, freeform_fixture):
         shapes, start_x, start_y, scale = freeform_fixture[:4]
         FreeformBuilder_new_, x_scale, y_scale = freeform_fixture[4:7]
@@ -800,6 +941,10 @@ class Describe_BaseGroupShapes(object):
     def CT_GroupShape_add_grpSp_(self, request):
         return method_mock(request, CT_GroupShape, "add_grpSp", autospec=True)
 
+    @pytest.fixture
+    def _DeferredGroupExtents_(self, request):
+        return class_mock(request, "pptx.shapes.shapetree._DeferredGroupExtents")
+
     @pytest.fixture
     def FreeformBuilder_new_(self, request):
         return method_mock(request, FreeformBuilder, "new")
@@ -849,18 +994,62 @@ class DescribeGroupShapes(object):
         shapes._recalculate_extents()
         shapes._grpSp.recalculate_extents.assert_called_once_with()
 
+    def but_it_marks_its_group_for_later_when_extents_are_deferred(
+        self, recalc_fixture, slide_part_, deferred_group_extents_
+    ):
+        shapes = recalc_fixture
+        slide_part_.deferred_group_extents = deferred_group_extents_
+
+        shapes._recalculate_extents()
+
+        deferred_group_extents_.add.assert_called_once_with(shapes._grpSp)
+        assert shapes._grpSp.recalculate_extents.call_args_list == []
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def recalc_fixture(self, grpSp_):
+    def recalc_fixture(self, request, grpSp_, slide_part_):
+        slide_part_.deferred_group_extents = None
+        property_mock(request, GroupShapes, "part", return_value=slide_part_)
         return GroupShapes(grpSp_, None)
 
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def deferred_group_extents_(self, request):
+        return instance_mock(request, _DeferredGroupExtents)
+
     @pytest.fixture
     def grpSp_(self, request):
         return instance_mock(request, CT_GroupShape)
 
+    @pytest.fixture
+    def slide_part_(self, request):
+        return instance_mock(request, SlidePart)
+
+
+class Describe_DeferredGroupExtents(object):
+    def it_marks_a_group_and_the_groups_that_contain_it(self):
+        spTree = element("p:spTree/p:grpSp/p:grpSp/p:grpSp")
+        grpSps = spTree.xpath("//p:grpSp")
+        deferred_group_extents = _DeferredGroupExtents()
+
+        deferred_group_extents.add(grpSps[1])
+
+        assert deferred_group_extents._grpSps == set(grpSps[:2])
+
+    def it_recalculates_each_marked_group_innermost_first(self, request):
+        spTree = element("p:spTree/p:grpSp/p:grpSp/p:grpSp")
+        grpSps = spTree.xpath("//p:grpSp")
+        fit_extents_ = method_mock(request, CT_GroupShape, "fit_extents", autospec=True)
+        deferred_group_extents = _DeferredGroupExtents()
+        deferred_group_extents.add(grpSps[2])
+
+        deferred_group_extents.recalculate()
+
+        assert fit_extents_.call_args_list == [call(e) for e in reversed(grpSps)]
+        assert deferred_group_extents._grpSps == set()
+
 
 class DescribeBasePlaceholders(object):
     def it_contains_only_placeholder_shapes(self, member_fixture):
@@ -1539,8 +1728,13 @@ class DescribeLayoutPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_idx_value(self, get_fixture):
-        placeholders, idx, placeholder_ = get_fixture
-        assert placeholders.get(idx) is placeholder_
+        placeholders, idx, ph_elm_, _LayoutShapeFactory_, placeholder_ = get_fixture
+
+        placeholder = placeholders.get(idx)
+
+        placeholders.part.placeholder_elm_by_idx.assert_called_once_with(idx)
+        _LayoutShapeFactory_.assert_called_once_with(ph_elm_, placeholders)
+        assert placeholder is placeholder_
 
     def it_returns_default_on_ph_idx_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1549,8 +1743,9 @@ class DescribeLayoutPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
+    def default_fixture(self, part_prop_, slide_layout_part_):
         placeholders = LayoutPlaceholders(None, None)
+        slide_layout_part_.placeholder_elm_by_idx.return_value = None
         default = "barfoo"
         return placeholders, default
 
@@ -1560,25 +1755,15 @@ class DescribeLayoutPlaceholders(object):
         sp = element("p:sp")
         return placeholders, sp, _LayoutShapeFactory_, placeholder_
 
-    @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        idx = request.param
+    @pytest.fixture
+    def get_fixture(self, part_prop_, ph_elm_, _LayoutShapeFactory_, placeholder_):
+        idx = 1
         layout_placeholders = LayoutPlaceholders(None, None)
-        _placeholder_ = (placeholder_, placeholder_2_)[idx]
-        placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
-        return layout_placeholders, idx, _placeholder_
+        part_prop_.return_value.placeholder_elm_by_idx.return_value = ph_elm_
+        return layout_placeholders, idx, ph_elm_, _LayoutShapeFactory_, placeholder_
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request,
-            LayoutPlaceholders,
-            "__iter__",
-            return_value=iter([placeholder_, placeholder_2_]),
-        )
-
     @pytest.fixture
     def _LayoutShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1592,13 +1777,19 @@ class DescribeLayoutPlaceholders(object):
     def ph_elm_(self, request):
         return instance_mock(request, CT_Shape)
 
+    @pytest.fixture
+    def part_prop_(self, request, slide_layout_part_):
+        return property_mock(
+            request, LayoutPlaceholders, "part", return_value=slide_layout_part_
+        )
+
     @pytest.fixture
     def placeholder_(self, request):
         return instance_mock(request, LayoutPlaceholder)
 
     @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
+    def slide_layout_part_(self, request):
+        return instance_mock(request, SlideLayoutPart)
 
 
 class Describe_MasterShapeFactory(object):
@@ -1703,8 +1894,14 @@ class DescribeMasterPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_type(self, get_fixture):
-        placeholders, ph_type, placeholder_ = get_fixture
-        assert placeholders.get(ph_type) is placeholder_
+        placeholders, ph_type, ph_elm_, _MasterShapeFactory_ = get_fixture[:4]
+        placeholder_ = get_fixture[4]
+
+        placeholder = placeholders.get(ph_type)
+
+        placeholders.part.placeholder_elm_by_type.assert_called_once_with(ph_type)
+        _MasterShapeFactory_.assert_called_once_with(ph_elm_, placeholders)
+        assert placeholder is placeholder_
 
     def it_returns_default_on_ph_type_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1713,8 +1910,9 @@ class DescribeMasterPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
+    def default_fixture(self, part_prop_, slide_master_part_):
         placeholders = MasterPlaceholders(None, None)
+        slide_master_part_.placeholder_elm_by_type.return_value = None
         default = "barfoo"
         return placeholders, default
 
@@ -1724,24 +1922,15 @@ class DescribeMasterPlaceholders(object):
         sp = element("p:sp")
         return placeholders, sp, _MasterShapeFactory_, placeholder_
 
-    @pytest.fixture(params=["title", "body"])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        ph_type = request.param
+    @pytest.fixture
+    def get_fixture(self, part_prop_, ph_elm_, _MasterShapeFactory_, placeholder_):
+        ph_type = PP_PLACEHOLDER.BODY
         placeholders = MasterPlaceholders(None, None)
-        _placeholder_ = {"title": placeholder_, "body": placeholder_2_}[ph_type]
-        return placeholders, ph_type, _placeholder_
+        part_prop_.return_value.placeholder_elm_by_type.return_value = ph_elm_
+        return placeholders, ph_type, ph_elm_, _MasterShapeFactory_, placeholder_
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request,
-            MasterPlaceholders,
-            "__iter__",
-            return_value=iter([placeholder_, placeholder_2_]),
-        )
-
     @pytest.fixture
     def _MasterShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1751,13 +1940,23 @@ class DescribeMasterPlaceholders(object):
             autospec=True,
         )
 
+    @pytest.fixture
+    def part_prop_(self, request, slide_master_part_):
+        return property_mock(
+            request, MasterPlaceholders, "part", return_value=slide_master_part_
+        )
+
+    @pytest.fixture
+    def ph_elm_(self, request):
+        return instance_mock(request, CT_Shape)
+
     @pytest.fixture
     def placeholder_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type="title")
+        return instance_mock(request, MasterPlaceholder)
 
     @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type="body")
+    def slide_master_part_(self, request):
+        return instance_mock(request, SlideMasterPart)
 
 
 class Describe_MoviePicElementCreator(object):
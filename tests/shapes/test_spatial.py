@@ -0,0 +1,120 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.shapes.spatial` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from pptx.shapes.shapetree import SlideShapes
+from pptx.shapes.spatial import SpatialIndex, _child_transform
+
+from ..unitutil.cxml import element
+
+
+class DescribeSpatialIndex(object):
+    """Unit-test suite for `pptx.shapes.spatial.SpatialIndex` object."""
+
+    def it_can_build_itself_from_a_shape_collection(self):
+        shapes = SlideShapes(
+            element(
+                "p:spTree/(p:sp/p:spPr/a:xfrm/(a:off{x=10,y=20},a:ext{cx=30,cy=40}),"
+                "p:grpSp/(p:grpSpPr/a:xfrm/(a:off{x=100,y=100},a:ext{cx=200,cy=100},"
+                "a:chOff{x=0,y=0},a:chExt{cx=100,cy=100}),p:sp/p:spPr/a:xfrm/(a:off{"
+                "x=50,y=10},a:ext{cx=50,cy=20})),p:sp/p:spPr)"
+            ),
+            None,
+        )
+
+        spatial_index = SpatialIndex.from_shapes(shapes)
+
+        assert len(spatial_index) == 2
+        assert spatial_index._boxes == [(10, 20, 40, 60), (200, 110, 300, 130)]
+
+    def but_it_can_index_group_shapes_as_a_whole(self):
+        shapes = SlideShapes(
+            element(
+                "p:spTree/p:grpSp/(p:grpSpPr/a:xfrm/(a:off{x=100,y=100},a:ext{cx=200"
+                ",cy=100},a:chOff{x=0,y=0},a:chExt{cx=100,cy=100}),p:sp/p:spPr/a:xfrm"
+                "/(a:off{x=50,y=10},a:ext{cx=50,cy=20}))"
+            ),
+            None,
+        )
+
+        spatial_index = SpatialIndex.from_shapes(shapes, include_group_members=False)
+
+        assert spatial_index._boxes == [(100, 100, 300, 200)]
+
+    def it_composes_the_transforms_of_nested_groups(self):
+        xfrm = element(
+            "a:xfrm/(a:off{x=10,y=20},a:ext{cx=50,cy=50},a:chOff{x=100,y=100},"
+            "a:chExt{cx=100,cy=100})"
+        )
+        assert _child_transform((2.0, 1.0, 5, 0), xfrm) == (1.0, 0.5, -75.0, -30.0)
+
+    @pytest.mark.parametrize(
+        "x, y, expected_value",
+        ((15, 15, ["a", "b"]), (5, 5, ["a"]), (25, 25, ["b"]), (50, 0, [])),
+    )
+    def it_can_find_the_shapes_at_a_point(self, x, y, expected_value):
+        spatial_index = SpatialIndex([("a", 0, 0, 20, 20), ("b", 10, 10, 30, 30)])
+        assert spatial_index.at_point(x, y) == expected_value
+
+    @pytest.mark.parametrize(
+        "region, expected_value",
+        (
+            ((0, 0, 5, 5), ["a"]),
+            ((20, 20, 5, 5), ["a", "b"]),
+            ((35, 0, 20, 20), ["c"]),
+            ((100, 100, 10, 10), []),
+        ),
+    )
+    def it_can_find_the_shapes_intersecting_a_region(self, region, expected_value):
+        spatial_index = SpatialIndex(
+            [("a", 0, 0, 20, 20), ("b", 10, 10, 30, 30), ("c", 50, 0, 60, 10)]
+        )
+        assert spatial_index.intersecting(*region) == expected_value
+
+    @pytest.mark.parametrize(
+        "region, expected_value",
+        (
+            ((0, 0, 20, 20), ["a"]),
+            ((0, 0, 30, 30), ["a", "b"]),
+            ((0, 0, 60, 60), ["a", "b", "c"]),
+            ((10, 10, 10, 10), []),
+        ),
+    )
+    def it_can_find_the_shapes_within_a_region(self, region, expected_value):
+        spatial_index = SpatialIndex(
+            [("a", 0, 0, 20, 20), ("b", 10, 10, 30, 30), ("c", 50, 0, 60, 10)]
+        )
+        assert spatial_index.within(*region) == expected_value
+
+    @pytest.mark.parametrize(
+        "x, y, expected_value",
+        ((0, 0, "a"), (15, 15, "b"), (35, 25, "b"), (1000, -5, "c"), (56, 5, "c")),
+    )
+    def it_can_find_the_shape_nearest_a_point(self, x, y, expected_value):
+        spatial_index = SpatialIndex(
+            [("a", 0, 0, 20, 20), ("b", 10, 10, 30, 30), ("c", 50, 0, 60, 10)]
+        )
+        assert spatial_index.nearest(x, y) == expected_value
+
+    def but_it_finds_no_nearest_shape_when_empty(self):
+        assert SpatialIndex([]).nearest(0, 0) is None
+
+    def it_can_find_the_pairs_of_overlapping_shapes(self):
+        spatial_index = SpatialIndex(
+            [
+                ("a", 0, 0, 20, 20),
+                ("b", 10, 10, 30, 30),
+                ("c", 30, 0, 40, 10),
+                ("d", 0, 0, 100, 100),
+            ]
+        )
+        assert spatial_index.overlaps() == [
+            ("a", "b"),
+            ("a", "d"),
+            ("b", "d"),
+            ("c", "d"),
+        ]
@@ -0,0 +1,110 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.aio` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pptx
+from pptx.aio import open_async, save_async
+from pptx.presentation import Presentation
+
+from .unitutil.file import absjoin, test_file_dir
+
+test_pptx_path = absjoin(test_file_dir, "test.pptx")
+
+
+class AsyncSource(object):
+    """Byte source having a coroutine `read()` method, like `aiofiles`."""
+
+    def __init__(self, blob):
+        self._blob = blob
+
+    async def read(self):
+        return self._blob
+
+
+class AsyncSink(object):
+    """Byte sink having a coroutine `write()` method, like `aiofiles`."""
+
+    def __init__(self):
+        self.blob = b""
+
+    async def write(self, blob):
+        self.blob += blob
+
+
+class StreamWriterSink(object):
+    """Byte sink having a `drain()` coroutine, like `asyncio.StreamWriter`."""
+
+    def __init__(self):
+        self.blob = b""
+        self.drained = False
+
+    def write(self, blob):
+        self.blob += blob
+
+    async def drain(self):
+        self.drained = True
+
+
+def run(coroutine):
+    return asyncio.new_event_loop().run_until_complete(coroutine)
+
+
+class Describe_open_async(object):
+    """Unit-test suite for `pptx.aio.open_async()` coroutine."""
+
+    def it_opens_a_presentation_from_a_path(self):
+        prs = run(open_async(test_pptx_path))
+        assert isinstance(prs, Presentation)
+        assert len(prs.slides) == len(pptx.Presentation(test_pptx_path).slides)
+
+    def it_opens_the_default_template_when_no_file_is_given(self):
+        prs = run(open_async())
+        assert isinstance(prs, Presentation)
+
+    def it_opens_a_presentation_from_an_async_source(self):
+        with open(test_pptx_path, "rb") as f:
+            source = AsyncSource(f.read())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            prs = run(open_async(source, executor))
+
+        assert isinstance(prs, Presentation)
+
+    def it_is_exposed_by_the_pptx_package(self):
+        assert pptx.open_async is open_async
+
+
+class Describe_save_async(object):
+    """Unit-test suite for `pptx.aio.save_async()` coroutine."""
+
+    def it_saves_a_presentation_to_a_file_like_object(self):
+        prs = pptx.Presentation(test_pptx_path)
+        stream = io.BytesIO()
+
+        run(save_async(prs, stream))
+
+        stream.seek(0)
+        assert len(pptx.Presentation(stream).slides) == len(prs.slides)
+
+    def it_saves_a_presentation_to_an_async_sink(self):
+        prs = pptx.Presentation(test_pptx_path)
+        sink = AsyncSink()
+
+        run(prs.save_async(sink))
+
+        assert len(pptx.Presentation(io.BytesIO(sink.blob)).slides) == len(prs.slides)
+
+    def and_it_drains_a_stream_writer(self):
+        prs = pptx.Presentation(test_pptx_path)
+        sink = StreamWriterSink()
+
+        run(prs.save_async(sink))
+
+        assert sink.drained is True
+        assert sink.blob.startswith(b"PK")
@@ -9,15 +9,21 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from pptx.media import Video
-from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import Part, _Relationship
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part, XmlPart, _Relationship
 from pptx.opc.packuri import PackURI
-from pptx.package import _ImageParts, _MediaParts, Package
+from pptx.package import (
+    _ImageParts,
+    _ImportIndex,
+    _MediaParts,
+    Package,
+    PartImporter,
+)
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
 
-
+from .unitutil.cxml import element
 from .unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
 
 
@@ -26,6 +32,37 @@ class DescribePackage(object):
         pkg = Package.open("pptx/templates/default.pptx")
         assert isinstance(pkg.core_properties, CorePropertiesPart)
 
+    def it_provides_access_to_its_text_style_resolver(self, request):
+        TextStyleResolver_ = class_mock(request, "pptx.package.TextStyleResolver")
+        package = Package()
+
+        text_styles = package.text_styles
+
+        TextStyleResolver_.assert_called_once_with(package)
+        assert text_styles is TextStyleResolver_.return_value
+
+    def it_can_compact_itself(self):
+        package = Package.open("pptx/templates/default.pptx")
+        prs_part = package.presentation_part
+        slide = prs_part.presentation.slides.add_slide(
+            prs_part.presentation.slide_layouts[6]
+        )
+        picture = slide.shapes.add_picture("tests/test_files/python-icon.jpeg", 0, 0)
+        picture._element.getparent().remove(picture._element)
+        slide.part.relate_to("http://foo", RT.HYPERLINK, is_external=True)
+        notes_slide_part = slide.notes_slide.part
+
+        package.compact()
+
+        assert sorted(rel.reltype for rel in slide.part.rels.values()) == [
+            RT.NOTES_SLIDE,
+            RT.SLIDE_LAYOUT,
+        ]
+        assert RT.SLIDE in [rel.reltype for rel in notes_slide_part.rels.values()]
+        assert not any(
+            part.partname.startswith("/ppt/media/") for part in package.iter_parts()
+        )
+
     def it_can_get_or_add_an_image_part(self, image_part_fixture):
         package, image_file, image_parts_, image_part_ = image_part_fixture
         image_part = package.get_or_add_image_part(image_file)
@@ -48,6 +85,26 @@ class DescribePackage(object):
         partname = package.next_media_partname(ext)
         assert partname == expected_value
 
+    def it_knows_the_next_available_notes_slide_partnames(self, request):
+        parts_related_by_type_ = method_mock(request, Package, "parts_related_by_type")
+        parts_related_by_type_.return_value = [
+            instance_mock(
+                request, Part, partname=PackURI("/ppt/notesSlides/notesSlide%d.xml" % n)
+            )
+            for n in (3, 1)
+        ]
+        package = Package()
+
+        partnames = package.next_notes_slide_partnames(3)
+
+        parts_related_by_type_.assert_called_once_with(RT.NOTES_SLIDE)
+        assert partnames == [
+            "/ppt/notesSlides/notesSlide2.xml",
+            "/ppt/notesSlides/notesSlide4.xml",
+            "/ppt/notesSlides/notesSlide5.xml",
+        ]
+        assert all(isinstance(partname, PackURI) for partname in partnames)
+
     def it_provides_access_to_its_MediaParts_object(self, m_parts_fixture):
         package, _MediaParts_, media_parts_ = m_parts_fixture
         media_parts = package._media_parts
@@ -148,6 +205,198 @@ class DescribePackage(object):
         return property_mock(request, Package, "_media_parts")
 
 
+class DescribePartImporter(object):
+    """Unit-test suite for `pptx.package.PartImporter` object."""
+
+    def it_uses_the_mapped_part_when_there_is_one(self, package_):
+        part, mapped_part = Part(None, None), Part(None, None)
+        importer = PartImporter(package_, {part: mapped_part})
+        assert importer.import_part(part, RT.SLIDE_LAYOUT) is mapped_part
+
+    @pytest.mark.parametrize("reltype", (RT.IMAGE, RT.MEDIA, RT.SLIDE))
+    def it_shares_parts_of_the_same_package_when_it_can(self, package_, reltype):
+        part = Part(None, None, package=package_)
+        assert PartImporter(package_).import_part(part, reltype) is part
+
+    def but_it_cannot_import_a_slide_of_another_package(self, package_):
+        part = Part(None, None, package=None)
+        assert PartImporter(package_).import_part(part, RT.SLIDE) is None
+
+    def it_reuses_an_identical_image_from_another_package(self, package_):
+        part, existing_part = Part(None, None, b"foo"), Part(None, None, b"foo")
+        package_.iter_rels.return_value = [
+            _Relationship(None, RT.IMAGE, existing_part, "/")
+        ]
+        importer = PartImporter(package_)
+
+        image_part = importer.import_part(part, RT.IMAGE)
+
+        assert image_part is existing_part
+        assert importer.import_part(part, RT.IMAGE) is existing_part
+        assert package_.iter_rels.call_count == 1
+
+    def and_it_stores_an_image_imported_twice_only_once(self, request, package_):
+        image_copy = Part(None, None, b"foo")
+        class_mock(request, "pptx.package.PartFactory", return_value=image_copy)
+        package_.iter_rels.return_value = []
+        part = Part(PackURI("/ppt/media/image1.png"), "image/png", b"foo")
+        other_part = Part(PackURI("/ppt/media/image9.png"), "image/png", b"foo")
+        importer = PartImporter(package_)
+
+        assert importer.import_part(part, RT.IMAGE) is image_copy
+        assert importer.import_part(other_part, RT.IMAGE) is image_copy
+
+    def it_copies_a_part_along_with_the_parts_it_relates_to(self, request, package_):
+        part_copy = instance_mock(request, Part)
+        PartFactory_ = class_mock(
+            request, "pptx.package.PartFactory", return_value=part_copy
+        )
+        package_.iter_rels.return_value = [
+            _Relationship(
+                None, RT.CHART, Part(PackURI("/ppt/charts/chart1.xml"), None), "/"
+            )
+        ]
+        part = Part(PackURI("/ppt/charts/chart1.xml"), "ct", b"blob", package_)
+        embedded_part = Part(None, None, package=package_)
+        part.load_rel(RT.PACKAGE, embedded_part, "rId2")
+        part.load_rel(RT.HYPERLINK, "http://x.com", "rId3", is_external=True)
+        importer = PartImporter(package_, {embedded_part: 42})
+
+        chart_part = importer.import_part(part, RT.CHART)
+
+        PartFactory_.assert_called_once_with(
+            PackURI("/ppt/charts/chart2.xml"), "ct", b"blob", package_
+        )
+        assert part_copy.load_rel.call_args_list == [
+            call(RT.PACKAGE, 42, "rId2"),
+            call(RT.HYPERLINK, "http://x.com", "rId3", True),
+        ]
+        assert importer.import_part(part, RT.CHART) is chart_part
+
+    @pytest.mark.parametrize(
+        "partname, expected_value",
+        (
+            ("/ppt/charts/chart1.xml", "/ppt/charts/chart3.xml"),
+            ("/ppt/media/image1.png", "/ppt/media/image1.png"),
+            ("/ppt/embeddings/sheet%20a.bin", "/ppt/embeddings/sheet%20a1.bin"),
+        ),
+    )
+    def it_names_a_copy_after_its_source_part(self, package_, partname, expected_value):
+        package_.iter_rels.return_value = [
+            _Relationship(
+                None, RT.CHART, Part(PackURI("/ppt/charts/chart1.xml"), None), "/"
+            ),
+            _Relationship(
+                None, RT.CHART, Part(PackURI("/ppt/charts/chart2.xml"), None), "/"
+            ),
+        ]
+        importer = PartImporter(package_)
+        assert importer._next_partname(PackURI(partname)) == expected_value
+
+    def it_resumes_the_search_for_a_free_partname(self, package_):
+        package_.iter_rels.return_value = []
+        index = _ImportIndex(package_)
+        index.partnames = set(["/ppt/charts/chart1.xml"])
+        index.next_partname_idxs["/ppt/charts/chart%d.xml"] = 5
+        importer = PartImporter(package_, index=index)
+        importer._index_is_checked = True
+
+        assert importer._next_partname(PackURI("/ppt/charts/chart1.xml")) == (
+            "/ppt/charts/chart5.xml"
+        )
+        assert index.next_partname_idxs["/ppt/charts/chart%d.xml"] == 6
+
+    def it_copies_a_group_of_parts_related_to_one_another(self, package_):
+        package_.iter_rels.return_value = []
+        master = XmlPart(
+            PackURI("/ppt/slideMasters/slideMaster1.xml"),
+            CT.PML_SLIDE_MASTER,
+            element("p:sldMaster/p:sldLayoutIdLst/p:sldLayoutId{r:id=rId1}"),
+        )
+        layout = XmlPart(
+            PackURI("/ppt/slideLayouts/slideLayout1.xml"),
+            CT.PML_SLIDE_LAYOUT,
+            element("p:sldLayout/p:cSld/p:bg/p:bgPr/a:blipFill/a:blip{r:embed=rId2}"),
+        )
+        master.load_rel(RT.SLIDE_LAYOUT, layout, "rId1")
+        layout.load_rel(RT.SLIDE_MASTER, master, "rId1")
+        layout.load_rel(RT.SLIDE, Part(None, None), "rId2")
+        importer = PartImporter(package_)
+
+        master_copy, layout_copy = importer.copy_parts([master, layout])
+
+        assert master_copy.partname == "/ppt/slideMasters/slideMaster1.xml"
+        assert master_copy.related_parts["rId1"] is layout_copy
+        assert layout_copy.related_parts["rId1"] is master_copy
+        assert "rId2" not in layout_copy.rels
+        assert layout_copy._element.xpath("//a:blip/@r:embed") == [""]
+
+    def it_can_import_a_relationship(self, request, package_):
+        import_part_ = method_mock(
+            request, PartImporter, "import_part", side_effect=[42, None]
+        )
+        source_part = Part(PackURI("/ppt/slides/slide1.xml"), None)
+        chart_part, slide_part = Part(None, None), Part(None, None)
+        source_part.load_rel(RT.CHART, chart_part, "rId1")
+        source_part.load_rel(RT.SLIDE, slide_part, "rId2")
+        source_part.load_rel(RT.HYPERLINK, "http://x.com", "rId3", is_external=True)
+        target_part = instance_mock(request, Part)
+        target_part.relate_to.side_effect = ["rId4", "rId5"]
+        importer = PartImporter(package_)
+
+        assert importer.import_rel(source_part, "rId1", target_part) == "rId4"
+        assert importer.import_rel(source_part, "rId2", target_part) is None
+        assert importer.import_rel(source_part, "rId3", target_part) == "rId5"
+
+        assert import_part_.call_args_list == [
+            call(chart_part, RT.CHART),
+            call(slide_part, RT.SLIDE),
+        ]
+        assert target_part.relate_to.call_args_list == [
+            call(42, RT.CHART),
+            call("http://x.com", RT.HYPERLINK, is_external=True),
+        ]
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def package_(self, request):
+        package_ = instance_mock(request, Package)
+        return package_
+
+
+class Describe_ImportIndex(object):
+    """Unit-test suite for `pptx.package._ImportIndex` object."""
+
+    def it_is_rebuilt_only_once_relationships_change_by_other_means(self):
+        package = Package.open("pptx/templates/default.pptx")
+        index = _ImportIndex(package)
+        index.refresh()
+        assert "/ppt/presentation.xml" in index.partnames
+
+        index.partnames.add("/ppt/charts/chart1.xml")
+        index.refresh()
+        assert "/ppt/charts/chart1.xml" in index.partnames
+
+        index.mark_current()
+        package.presentation_part.presentation.slides.add_slide(
+            package.presentation_part.presentation.slide_layouts[0]
+        )
+        index.refresh()
+        assert "/ppt/charts/chart1.xml" not in index.partnames
+        assert "/ppt/slides/slide1.xml" in index.partnames
+
+    def it_keys_an_image_or_media_part_by_its_sha1(self, request):
+        image_part_ = instance_mock(request, ImagePart, sha1="1be010ea")
+        part = Part(None, None, b"foo")
+
+        assert _ImportIndex.sha1_key(image_part_, RT.IMAGE) == (True, "1be010ea")
+        assert _ImportIndex.sha1_key(part, RT.MEDIA) == (
+            False,
+            "0beec7b5ea3f0fdbc95d0dd47f3c5bc275da8a33",
+        )
+
+
 class Describe_ImageParts(object):
     def it_can_iterate_over_the_package_image_parts(self, iter_fixture):
         image_parts, expected_parts = iter_fixture
@@ -0,0 +1,64 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.parallel` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+
+import pytest
+
+from pptx import Presentation
+from pptx.parallel import build_presentation
+
+from .unitutil.file import absjoin, test_file_dir
+
+test_image_path = absjoin(test_file_dir, "python-icon.jpeg")
+
+
+def build_titled_slide(prs, job):
+    """Add a slide titled with *job* and showing the test image to *prs*."""
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.text = job
+    slide.shapes.add_picture(test_image_path, 0, 0)
+
+
+def duplicate_first_slide(prs, job):
+    """Add a copy of the first slide of *prs*, titled with *job*."""
+    slide = prs.slides.duplicate(prs.slides[0])
+    slide.shapes.title.text = job
+
+
+class Describe_build_presentation(object):
+    """Unit-test suite for `pptx.parallel.build_presentation()` function."""
+
+    @pytest.mark.parametrize("processes, chunk_size", ((1, None), (1, 2), (2, 1)))
+    def it_builds_the_slides_for_each_job_in_order(self, processes, chunk_size):
+        jobs = ["foo", "bar", "baz", "qux", "quux"]
+
+        prs = build_presentation(None, build_titled_slide, jobs, processes, chunk_size)
+
+        assert [slide.shapes.title.text for slide in prs.slides] == jobs
+        assert all(slide.slide_layout is prs.slide_layouts[5] for slide in prs.slides)
+        image_partnames = [
+            part.partname
+            for part in prs.part.package.iter_parts()
+            if part.partname.startswith("/ppt/media/")
+        ]
+        assert len(image_partnames) == 1
+
+    def it_keeps_the_slides_of_the_template(self):
+        template = Presentation()
+        slide = template.slides.add_slide(template.slide_layouts[0])
+        slide.shapes.title.text = "template"
+        stream = io.BytesIO()
+        template.save(stream)
+        stream.seek(0)
+
+        prs = build_presentation(stream, duplicate_first_slide, ["foo", "bar"], 1)
+
+        assert [slide.shapes.title.text for slide in prs.slides] == [
+            "template",
+            "foo",
+            "bar",
+        ]
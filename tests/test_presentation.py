@@ -8,6 +8,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import NotesMasterPart
@@ -82,6 +83,15 @@ class DescribePresentation(object):
         prs.save(file_)
         prs_part_.save.assert_called_once_with(file_)
 
+    def it_can_compact_the_package_before_saving(self, save_fixture, package_):
+        prs, file_, prs_part_ = save_fixture
+        prs_part_.package = package_
+
+        prs.save(file_, compact=True)
+
+        package_.compact.assert_called_once_with()
+        prs_part_.save.assert_called_once_with(file_)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -210,6 +220,10 @@ class DescribePresentation(object):
     def notes_master_(self, request):
         return instance_mock(request, NotesMasterPart)
 
+    @pytest.fixture
+    def package_(self, request):
+        return instance_mock(request, Package)
+
     @pytest.fixture
     def part_prop_(self, request):
         return property_mock(request, Presentation, "part")
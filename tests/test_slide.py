@@ -6,12 +6,14 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+import pptx
 from pptx.dml.fill import FillFormat
 from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.package import Package
 from pptx.parts.presentation import PresentationPart
-from pptx.parts.slide import SlideLayoutPart, SlideMasterPart, SlidePart
 from pptx.presentation import Presentation
+from pptx.parts.slide import SlideLayoutPart, SlideMasterPart, SlidePart
 from pptx.shapes.base import BaseShape
 from pptx.shapes.placeholder import LayoutPlaceholder, NotesSlidePlaceholder
 from pptx.shapes.shapetree import (
@@ -184,10 +186,17 @@ class DescribeNotesSlide(object):
         NotesSlidePlaceholders_.assert_called_once_with(spTree, notes_slide)
         assert placeholders is placeholders_
 
-    def it_provides_access_to_its_notes_placeholder(self, notes_ph_fixture):
-        notes_slide, expected_value = notes_ph_fixture
+    def it_provides_access_to_its_notes_placeholder(
+        self, placeholders_prop_, placeholders_, placeholder_
+    ):
+        placeholders_prop_.return_value = placeholders_
+        placeholders_.get.return_value = placeholder_
+        notes_slide = NotesSlide(None, None)
+
         placeholder = notes_slide.notes_placeholder
-        assert placeholder is expected_value
+
+        placeholders_.get.assert_called_once_with(PP_PLACEHOLDER.BODY)
+        assert placeholder is placeholder_
 
     def it_provides_access_to_its_notes_text_frame(self, notes_tf_fixture):
         notes_slide, expected_value = notes_tf_fixture
@@ -207,26 +216,6 @@ class DescribeNotesSlide(object):
         shapes_.clone_placeholder = clone_placeholder_
         return notes_slide, notes_master_, clone_placeholder_, calls
 
-    @pytest.fixture(
-        params=[
-            (("SLIDE_IMAGE", "BODY", "SLIDE_NUMBER"), 1),
-            (("DATE", "SLIDE_IMAGE", "FOOTER"), None),
-        ]
-    )
-    def notes_ph_fixture(self, request, placeholders_prop_):
-        type_names, match = request.param
-        notes_slide = NotesSlide(None, None)
-        placeholders_ = []
-        for type_name in type_names:
-            placeholder_ = instance_mock(
-                request, NotesSlidePlaceholder, name="%s-placeholder" % type_name
-            )
-            placeholder_.placeholder_format.type = getattr(PP_PLACEHOLDER, type_name)
-            placeholders_.append(placeholder_)
-        placeholders_prop_.return_value = placeholders_
-        expected_value = None if match is None else placeholders_[match]
-        return notes_slide, expected_value
-
     @pytest.fixture(params=[True, False])
     def notes_tf_fixture(
         self, request, notes_placeholder_prop_, placeholder_, text_frame_
@@ -470,15 +459,139 @@ class DescribeSlides(object):
         with pytest.raises(IndexError):
             slides[2]
 
-    def it_knows_the_index_of_a_slide_it_contains(self, index_fixture):
-        slides, slide, expected_value = index_fixture
-        index = slides.index(slide)
-        assert index == expected_value
+    def it_knows_the_index_of_a_slide_it_contains(self, part_prop_, slide_):
+        prs_part_ = part_prop_.return_value
+        prs_part_.slide_idx.return_value = 1
+        slides = Slides(None, None)
+
+        index = slides.index(slide_)
+
+        prs_part_.slide_idx.assert_called_once_with(slide_.part)
+        assert index == 1
+
+    def it_raises_on_slide_not_in_collection(self, part_prop_, slide_):
+        part_prop_.return_value.slide_idx.side_effect = ValueError
+        slides = Slides(None, None)
+        with pytest.raises(ValueError):
+            slides.index(slide_)
+
+    def it_can_delete_a_slide(self, part_prop_, slide_):
+        slides = Slides(None, None)
+        slides.delete(slide_)
+        part_prop_.return_value.delete_slide.assert_called_once_with(slide_.part)
+
+    @pytest.mark.parametrize("index", (None, 0))
+    def it_can_duplicate_a_slide(self, request, part_prop_, slide_, index):
+        new_slide_ = instance_mock(request, Slide)
+        prs_part_ = part_prop_.return_value
+        prs_part_.duplicate_slide.return_value = "rId2", new_slide_
+        slides = Slides(element("p:sldIdLst/p:sldId{r:id=rId1,id=256}"), None)
+
+        new_slide = slides.duplicate(slide_, index)
+
+        prs_part_.duplicate_slide.assert_called_once_with(slide_.part)
+        assert slides._sldIdLst.xml == xml(
+            "p:sldIdLst/(p:sldId{r:id=rId1,id=256},p:sldId{id=257,r:id=rId2})"
+        )
+        if index is None:
+            assert prs_part_.move_slide.call_args_list == []
+        else:
+            prs_part_.move_slide.assert_called_once_with(new_slide_.part, index)
+        assert new_slide is new_slide_
+
+    @pytest.mark.parametrize("index", (2, -1))
+    def but_it_leaves_the_slides_unchanged_on_an_index_out_of_range(self, index):
+        prs = pptx.Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        partnames = sorted(part.partname for part in prs.part.package.iter_parts())
+
+        with pytest.raises(IndexError):
+            prs.slides.duplicate(slide, index)
+
+        assert len(prs.slides) == 1
+        assert sorted(part.partname for part in prs.part.package.iter_parts()) == (
+            partnames
+        )
+
+    @pytest.mark.parametrize("idxs", (None, (1,)))
+    def it_can_import_slides_from_another_presentation(
+        self, request, part_prop_, idxs
+    ):
+        other_slides_ = [instance_mock(request, Slide) for _ in range(2)]
+        other_prs_ = instance_mock(request, Presentation, slides=other_slides_)
+        new_slides_ = [instance_mock(request, Slide) for _ in range(2)]
+        prs_part_ = part_prop_.return_value
+        prs_part_.import_slides.return_value = [
+            ("rId2", new_slides_[0]),
+            ("rId3", new_slides_[1]),
+        ]
+        slides = Slides(element("p:sldIdLst/p:sldId{r:id=rId1,id=256}"), None)
+        selected = None if idxs is None else [other_slides_[idx] for idx in idxs]
+
+        new_slides = slides.import_slides(other_prs_, selected)
+
+        expected_slides = other_slides_ if idxs is None else selected
+        prs_part_.import_slides.assert_called_once_with(
+            [slide.part for slide in expected_slides]
+        )
+        assert slides._sldIdLst.xml == xml(
+            "p:sldIdLst/(p:sldId{r:id=rId1,id=256},p:sldId{id=257,r:id=rId2},p:sldI"
+            "d{id=258,r:id=rId3})"
+        )
+        assert new_slides == new_slides_
+
+    def it_can_move_a_slide(self, part_prop_, slide_):
+        slides = Slides(None, None)
+        slides.move(slide_, 3)
+        part_prop_.return_value.move_slide.assert_called_once_with(slide_.part, 3)
 
-    def it_raises_on_slide_not_in_collection(self, raises_fixture):
-        slides, slide = raises_fixture
+    @pytest.mark.parametrize("method_name", ("delete_slide", "move_slide"))
+    def but_it_raises_on_delete_or_move_of_a_slide_not_present(
+        self, part_prop_, slide_, method_name
+    ):
+        getattr(part_prop_.return_value, method_name).side_effect = ValueError
+        slides = Slides(None, None)
         with pytest.raises(ValueError):
-            slides.index(slide)
+            if method_name == "delete_slide":
+                slides.delete(slide_)
+            else:
+                slides.move(slide_, 0)
+
+    def it_can_reorder_its_slides(self, request, part_prop_):
+        slides_ = [instance_mock(request, Slide) for _ in range(3)]
+        slides = Slides(None, None)
+
+        slides.reorder(reversed(slides_))
+
+        part_prop_.return_value.reorder_slides.assert_called_once_with(
+            [slides_[2].part, slides_[1].part, slides_[0].part]
+        )
+
+    def it_can_set_the_notes_of_many_slides_at_once(self, request, part_prop_):
+        slides_ = [instance_mock(request, Slide) for _ in range(3)]
+        getitem_ = method_mock(request, Slides, "__getitem__", autospec=False)
+        getitem_.side_effect = lambda idx: slides_[idx]
+        slides = Slides(None, None)
+
+        slides.set_notes({2: "foo"})
+        slides.set_notes([(slides_[0], "bar"), (1, "baz")])
+
+        assert part_prop_.return_value.add_notes_slides.call_args_list == [
+            call([slides_[2].part]),
+            call([slides_[0].part, slides_[1].part]),
+        ]
+        assert [slide.notes_slide.notes_text_frame.text for slide in slides_] == [
+            "bar",
+            "baz",
+            "foo",
+        ]
+
+    def but_it_raises_on_notes_for_a_slide_not_present(self, request, part_prop_):
+        part_prop_.return_value.add_notes_slides.side_effect = ValueError
+        slides = Slides(None, None)
+        with pytest.raises(ValueError) as e:
+            slides.set_notes([(instance_mock(request, Slide), "foo")])
+        assert str(e.value) == "slide is not in slide collection"
 
     def it_can_iterate_its_slides(self, iter_fixture):
         slides, related_slide_, calls, expected_value = iter_fixture
@@ -547,15 +660,6 @@ class DescribeSlides(object):
         slides = Slides(sldIdLst, None)
         return slides
 
-    @pytest.fixture(params=[0, 1])
-    def index_fixture(self, request, part_prop_):
-        idx = request.param
-        sldIdLst = element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})")
-        slides = Slides(sldIdLst, None)
-        _slides = [Slide(element("p:sld"), None), Slide(element("p:sld"), None)]
-        part_prop_.return_value.related_slide.side_effect = _slides
-        return slides, _slides[idx], idx
-
     @pytest.fixture
     def iter_fixture(self, part_prop_, slide_):
         sldIdLst = element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})")
@@ -578,12 +682,6 @@ class DescribeSlides(object):
         slides = Slides(element(sldIdLst_cxml), None)
         return slides, expected_value
 
-    @pytest.fixture
-    def raises_fixture(self):
-        slides = Slides(element("p:sldIdLst"), None)
-        slide = Slide(element("p:sld"), None)
-        return slides, slide
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -644,23 +742,40 @@ class DescribeSlideLayout(object):
         assert slide_master is slide_master_
 
     def it_knows_which_slides_are_based_on_it(
-        self,
-        used_by_fixture,
-        part_prop_,
-        slide_layout_part_,
-        package_,
-        presentation_part_,
-        presentation_,
+        self, request, part_prop_, slide_layout_part_, package_, presentation_part_
     ):
-        presentation_, slide_layout, expected_value = used_by_fixture
+        slide_part_, slide_part_2_, deleted_slide_part_ = (
+            instance_mock(request, SlidePart, content_type=CT.PML_SLIDE)
+            for _ in range(3)
+        )
+        master_part_ = instance_mock(
+            request, SlideMasterPart, content_type=CT.PML_SLIDE_MASTER
+        )
         part_prop_.return_value = slide_layout_part_
         slide_layout_part_.package = package_
         package_.presentation_part = presentation_part_
-        presentation_part_.presentation = presentation_
+        package_.parts_related_to.return_value = [
+            slide_part_2_,
+            master_part_,
+            deleted_slide_part_,
+            slide_part_,
+        ]
+        slide_idxs = {slide_part_: 0, slide_part_2_: 3}
+
+        def slide_idx(slide_part):
+            if slide_part not in slide_idxs:
+                raise ValueError
+            return slide_idxs[slide_part]
+
+        presentation_part_.slide_idx.side_effect = slide_idx
+        slide_layout = SlideLayout(None, None)
 
         used_by_slides = slide_layout.used_by_slides
 
-        assert used_by_slides == expected_value
+        package_.parts_related_to.assert_called_once_with(
+            slide_layout_part_, RT.SLIDE_LAYOUT
+        )
+        assert used_by_slides == (slide_part_.slide, slide_part_2_.slide)
 
     # fixtures -------------------------------------------------------
 
@@ -684,17 +799,6 @@ class DescribeSlideLayout(object):
         placeholders_prop_.return_value = _placeholders
         return slide_layout, expected_placeholders
 
-    @pytest.fixture(params=[(), (0,), (1,), (0, 1)])
-    def used_by_fixture(self, request, presentation_, slide_, slide_2_):
-        used_by_idxs = request.param
-        slides = (slide_, slide_2_)
-        slide_layout = SlideLayout(None, None)
-        for idx, s in enumerate(slides):
-            s.slide_layout = slide_layout if idx in used_by_idxs else None
-        presentation_.slides = slides
-        expected_value = tuple(s for i, s in enumerate(slides) if i in used_by_idxs)
-        return presentation_, slide_layout, expected_value
-
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -735,10 +839,6 @@ class DescribeSlideLayout(object):
             request, SlideLayout, "placeholders", return_value=placeholders_
         )
 
-    @pytest.fixture
-    def presentation_(self, request):
-        return instance_mock(request, Presentation)
-
     @pytest.fixture
     def presentation_part_(self, request):
         return instance_mock(request, PresentationPart)
@@ -871,6 +971,19 @@ class DescribeSlideLayouts(object):
         )
         slide_master_part_.drop_rel.assert_called_once_with("rId1")
 
+    def it_can_remove_the_slide_layouts_no_slide_uses(
+        self, request, _iter_, slide_layout_, slide_layout_2_, slide_
+    ):
+        remove_ = method_mock(request, SlideLayouts, "remove")
+        _iter_.return_value = iter((slide_layout_, slide_layout_2_))
+        slide_layout_.used_by_slides = (slide_,)
+        slide_layout_2_.used_by_slides = ()
+        slide_layouts = SlideLayouts(None, None)
+
+        slide_layouts.remove_unused()
+
+        remove_.assert_called_once_with(slide_layout_2_)
+
     def but_it_raises_on_attempt_to_remove_slide_layout_in_use(
         self, slide_layout_, slide_
     ):
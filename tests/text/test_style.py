@@ -0,0 +1,157 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.text.style` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from pptx import Presentation
+from pptx.enum.text import MSO_UNDERLINE, PP_ALIGN
+from pptx.opc.package import Part
+from pptx.package import Package
+from pptx.text.style import EffectiveFont, EffectiveParagraphFormat, TextStyleResolver
+from pptx.util import Pt
+
+from ..unitutil.cxml import element
+from ..unitutil.mock import instance_mock, method_mock
+
+
+class DescribeEffectiveFont(object):
+    """Unit-test suite for `pptx.text.style.EffectiveFont` object."""
+
+    def it_provides_access_to_its_character_properties(self):
+        font = EffectiveFont("Calibri", 2400, True, False, MSO_UNDERLINE.DOUBLE_LINE)
+        assert font.name == "Calibri"
+        assert font.size == Pt(24)
+        assert font.bold is True
+        assert font.italic is False
+        assert font.underline == MSO_UNDERLINE.DOUBLE_LINE
+
+    @pytest.mark.parametrize(
+        "u, expected_value",
+        (
+            (None, None),
+            (MSO_UNDERLINE.NONE, False),
+            (MSO_UNDERLINE.SINGLE_LINE, True),
+            (MSO_UNDERLINE.WAVY_LINE, MSO_UNDERLINE.WAVY_LINE),
+        ),
+    )
+    def it_reports_underline_the_same_way_as_Font(self, u, expected_value):
+        assert EffectiveFont(None, None, None, None, u).underline == expected_value
+
+    def it_reports_None_for_an_undefined_size(self):
+        assert EffectiveFont(None, None, None, None, None).size is None
+
+
+class DescribeEffectiveParagraphFormat(object):
+    """Unit-test suite for `pptx.text.style.EffectiveParagraphFormat` object."""
+
+    def it_provides_access_to_its_paragraph_properties(self):
+        paragraph_format = EffectiveParagraphFormat(
+            PP_ALIGN.CENTER, 1.5, Pt(6), Pt(12)
+        )
+        assert paragraph_format.alignment == PP_ALIGN.CENTER
+        assert paragraph_format.line_spacing == 1.5
+        assert paragraph_format.space_after == Pt(6)
+        assert paragraph_format.space_before == Pt(12)
+
+
+class DescribeTextStyleResolver(object):
+    """Unit-test suite for `pptx.text.style.TextStyleResolver` object."""
+
+    def it_resolves_values_inherited_by_a_placeholder(self, prs):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        title_p = slide.shapes.title.text_frame.paragraphs[0]
+        body_tf = slide.placeholders[1].text_frame
+        body_tf.text = "foo"
+        sub_p = body_tf.add_paragraph()
+        sub_p.level = 1
+        text_styles = prs.part.package.text_styles
+
+        title_font = text_styles.effective_font(slide.part, title_p._p)
+        title_format = text_styles.effective_paragraph_format(slide.part, title_p._p)
+        body_font = text_styles.effective_font(slide.part, body_tf.paragraphs[0]._p)
+        sub_font = text_styles.effective_font(slide.part, sub_p._p)
+
+        assert title_font == ("Calibri", 4400, None, None, None)
+        assert title_format.alignment == PP_ALIGN.CENTER
+        assert body_font.size == Pt(32)
+        assert sub_font.size == Pt(28)
+
+    def it_resolves_values_inherited_by_a_notes_placeholder(self, prs):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        notes_slide = slide.notes_slide
+        p = notes_slide.notes_text_frame.paragraphs[0]
+        text_styles = prs.part.package.text_styles
+
+        font = text_styles.effective_font(notes_slide.part, p._p)
+
+        assert font.name == "Calibri"
+        assert font.size == Pt(12)
+
+    def it_resolves_values_inherited_by_a_non_placeholder_shape(self, prs):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        textbox = slide.shapes.add_textbox(0, 0, 0, 0)
+        p = textbox.text_frame.paragraphs[0]
+        text_styles = prs.part.package.text_styles
+
+        font = text_styles.effective_font(slide.part, p._p)
+
+        assert font.name == "Calibri"
+        assert font.size == Pt(18)
+
+    def it_gives_precedence_to_values_defined_in_the_shape(self, prs):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        textbox = slide.shapes.add_textbox(0, 0, 0, 0)
+        txBody = textbox.text_frame._txBody
+        lvl1pPr = txBody.get_or_add_lstStyle().get_or_add_lvl1pPr()
+        lvl1pPr.algn = PP_ALIGN.RIGHT
+        lvl1pPr.get_or_add_defRPr().i = True
+        p = textbox.text_frame.paragraphs[0]
+        p.font.size = Pt(20)
+        r = p.add_run()
+        r.font.name = "Arial"
+        text_styles = prs.part.package.text_styles
+
+        font = text_styles.effective_font(slide.part, p._p, r._r.rPr)
+        paragraph_format = text_styles.effective_paragraph_format(slide.part, p._p)
+
+        assert font == ("Arial", 2000, None, True, None)
+        assert paragraph_format.alignment == PP_ALIGN.RIGHT
+
+    def it_caches_inherited_values(self, request, part_):
+        _inherited_pPrs_ = method_mock(
+            request, TextStyleResolver, "_inherited_pPrs", return_value=([], None)
+        )
+        p = element("p:sp/p:txBody/a:p").txBody.p_lst[0]
+        text_styles = TextStyleResolver(None)
+
+        text_styles.effective_font(part_, p)
+        text_styles.effective_paragraph_format(part_, p)
+        assert _inherited_pPrs_.call_count == 1
+
+        text_styles.clear()
+        text_styles.effective_font(part_, p)
+        assert _inherited_pPrs_.call_count == 2
+
+    def it_resolves_only_local_values_for_text_outside_a_slide(self, part_):
+        part_.content_type = "application/vnd.openxmlformats-officedocument"
+        p = element("c:rich/(a:lstStyle/a:lvl1pPr/a:defRPr{sz=1000},a:p)").p_lst[0]
+        text_styles = TextStyleResolver(None)
+
+        font = text_styles.effective_font(part_, p)
+
+        assert font == (None, 1000, None, None, None)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def part_(self, request):
+        return instance_mock(request, Part)
+
+    @pytest.fixture
+    def prs(self):
+        prs = Presentation()
+        assert isinstance(prs.part.package, Package)
+        return prs
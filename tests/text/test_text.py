@@ -14,6 +14,7 @@ from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, MSO_UNDERLINE, PP_ALIGN
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.shapes.autoshape import Shape
+from pptx.text.style import TextStyleResolver
 from pptx.text.text import Font, _Hyperlink, _Paragraph, _Run, TextFrame
 from pptx.util import Inches, Pt
 
@@ -841,6 +842,30 @@ class Describe_Paragraph(object):
         Font_.assert_called_once_with(paragraph._defRPr)
         assert font == Font_.return_value
 
+    def it_provides_access_to_its_effective_font(self, request, text_styles_):
+        paragraph = _Paragraph(element("a:p"), None)
+        part_ = property_mock(request, _Paragraph, "part").return_value
+        part_.package.text_styles = text_styles_
+
+        effective_font = paragraph.effective_font
+
+        text_styles_.effective_font.assert_called_once_with(part_, paragraph._p)
+        assert effective_font is text_styles_.effective_font.return_value
+
+    def it_provides_access_to_its_effective_paragraph_format(
+        self, request, text_styles_
+    ):
+        paragraph = _Paragraph(element("a:p"), None)
+        part_ = property_mock(request, _Paragraph, "part").return_value
+        part_.package.text_styles = text_styles_
+
+        paragraph_format = paragraph.effective_paragraph_format
+
+        text_styles_.effective_paragraph_format.assert_called_once_with(
+            part_, paragraph._p
+        )
+        assert paragraph_format is text_styles_.effective_paragraph_format.return_value
+
     def it_knows_its_indentation_level(self, level_get_fixture):
         paragraph, expected_value = level_get_fixture
         assert paragraph.level == expected_value
@@ -1169,6 +1194,10 @@ class Describe_Paragraph(object):
     def paragraph(self, p_bldr):
         return _Paragraph(p_bldr.element, None)
 
+    @pytest.fixture
+    def text_styles_(self, request):
+        return instance_mock(request, TextStyleResolver)
+
 
 class Describe_Run(object):
     """Unit-test suite for `pptx.text.text._Run` object."""
@@ -1179,6 +1208,19 @@ class Describe_Run(object):
         Font_.assert_called_once_with(rPr)
         assert font == font_
 
+    def it_provides_access_to_its_effective_font(self, request):
+        p = element("a:p/a:r/a:rPr")
+        r = p.r_lst[0]
+        run = _Run(r, None)
+        part_ = property_mock(request, _Run, "part").return_value
+        text_styles_ = instance_mock(request, TextStyleResolver)
+        part_.package.text_styles = text_styles_
+
+        effective_font = run.effective_font
+
+        text_styles_.effective_font.assert_called_once_with(part_, p, r.rPr)
+        assert effective_font is text_styles_.effective_font.return_value
+
     def it_provides_access_to_a_hyperlink_proxy(self, hyperlink_fixture):
         run, rPr, _Hyperlink_, hlink_ = hyperlink_fixture
         hlink = run.hyperlink